@@ -1,7 +1,15 @@
 from modules.nodel.base.dep_node import Dep_Node
 from modules.nodel.base.dag_node import Dag_Node
 from modules.nodel.base.attribute_base import Attributes, Attribute
+from modules.nodel.components import Components
 from modules.nodel.mesh_node import Mesh
 from modules.nodel.joint_node import Joint
 from modules.nodel.curve_node import Curve
 from modules.nodel.joint_node import Joint
+from modules.nodel.base.attribute_expression import lazy
+from modules.nodel.base.expression_cache import cseSession
+from modules.nodel.base.node_cost import cheapest
+from modules.nodel.base.attribute_batch import batch, disconnect, rewire
+from modules.nodel.base.bounding_box import Bounding_Box
+from modules.nodel.base.dag_dimension import positions, bounds
+from modules.nodel import graph
@@ -7,7 +7,12 @@ About: Our Dag Node functionality to deal with
 
 import maya.cmds as cmds
 
-from modules.utils import path
+import maya.OpenMaya as om
+
+from modules.utils import path, open_maya_api
+
+from modules.nodel.base import attribute_schema, attribute_expression, expression_cache, node_cost, \
+    attribute_batch, modifier_command
 
 import string
 
@@ -17,8 +22,12 @@ from modules import six
 
 
 class Attributes(object):
+
+    __slots__ = ("node", "_cache")
+
     def __init__(self, node):
         self.node = node
+        self._cache = {}
 
         if not node.exists():
             raise ValueError("Node does not exist:{}".format(node.name))
@@ -36,10 +45,11 @@ class Attributes(object):
                 print(cube.a["rotateX"])
                 Output: "|cube_GEO.rotateX"
         """
-        if attr in self.__dict__.keys():
-            return self.__dict__[attr]
+        attribute = self._cache.get(attr)
+        if attribute is None:
+            attribute = self._cache[attr] = Attribute(self.node, attr)
 
-        return Attribute(self.node, attr)
+        return attribute
 
     def __getattr__(self, attr):
         """ Getting the attribute with a string input
@@ -48,10 +58,11 @@ class Attributes(object):
                        print(cube.a.rotateX)
                        Output: "|cube_GEO.rotateX"
         """
-        if attr in self.__dict__.keys():
-            return self.__dict__[attr]
+        # Only reached for names that are not slots, keep python internals out of Maya
+        if attr.startswith("_"):
+            raise AttributeError(attr)
 
-        return Attribute(self.node, attr)
+        return self[attr]
 
     # -------------------------------------------------------------------------------------------------
     def list(self, **kwargs):
@@ -61,7 +72,7 @@ class Attributes(object):
                 print(cube.a.list())
                 Output: list
         """
-        return [Attribute(self.node, a) for a in cmds.listAttr(self.node, **kwargs)]
+        return [self[a] for a in cmds.listAttr(self.node, **kwargs)]
 
     def add(self, **kwargs):
         """ Using functionality from maya.cmds addAttr to add
@@ -82,6 +93,103 @@ class Attributes(object):
                         cube.a.add(ln="new_attr", nn="New Attr", at="float", k=1, dv=0)
                 """
         cmds.addAttr(self.node, **kwargs)
+        self.clearCache()
+
+    def clearCache(self):
+        """ Forget the Attribute objects handed out so far, they are rebuilt on next access.
+
+            Example:
+                cube.a.clearCache()
+        """
+        self._cache.clear()
+        attribute_schema.forgetNode(self.node.handle)
+
+    def disconnectAll(self, inputs=True, outputs=False):
+        """ Break the connections of every attribute of the node with one query and one modifier.
+
+            Args:
+                inputs (bool): Break the connections driving the node.
+                outputs (bool): Break the connections the node drives.
+
+            Returns:
+                int: The number of connections broken.
+
+            Example:
+                cube.a.disconnectAll(inputs=True, outputs=True)
+        """
+        return attribute_batch.disconnect([self.node], inputs=inputs, outputs=outputs)
+
+    def getMany(self, attrs):
+        """ Read many attributes of the node in one pass over their plugs.
+
+            Args:
+                attrs (list): The attribute names.
+
+            Returns:
+                dict: The values keyed by attribute name.
+
+            Example:
+                print(cube.a.getMany(["tx", "ty", "r"]))
+                Output: {'tx': 0.0, 'ty': 1.0, 'r': [(0.0, 0.0, 0.0)]}
+        """
+        return dict((attr, self[attr].get()) for attr in attrs)
+
+    def setMany(self, values, lock=None, keyable=None, channelBox=None):
+        """ Set many attributes of the node at once, see setBulk.
+
+            Args:
+                values (dict/list): Values keyed by attribute name, or a list of names
+                    when only changing the lock, keyable or channelBox state.
+                lock (bool): Lock or unlock the attributes.(optional)
+                keyable (bool): Make the attributes keyable.(optional)
+                channelBox (bool): Show the non keyable attributes in the channel box.(optional)
+
+            Example 1:
+                cube.a.setMany({"tx": 0, "ty": 0, "r": (0, 90, 0)})
+            Example 2:
+                cube.a.setMany(["tx", "ty", "tz"], lock=True, keyable=False, channelBox=False)
+        """
+        Attributes.setBulk([(self.node, values)], lock=lock, keyable=keyable, channelBox=channelBox)
+
+    @staticmethod
+    def setBulk(nodeValues, lock=None, keyable=None, channelBox=None):
+        """ Set attributes across many nodes with a single MDGModifier, numeric, compound
+            and matrix values go through the plugs and anything else, the lock, keyable
+            and channelBox state included, through setAttr commands queued on it.
+            Everything is applied in one batch and reverts with a single undo.
+
+            Args:
+                nodeValues (dict/list): {node: {attr: value}} or {node: [attr]}, or a list of pairs.
+                lock (bool): Lock or unlock the attributes.(optional)
+                keyable (bool): Make the attributes keyable.(optional)
+                channelBox (bool): Show the non keyable attributes in the channel box.(optional)
+
+            Example:
+                Attributes.setBulk({"ctrl_1": {"t": (0, 0, 0)}, "ctrl_2": {"t": (0, 0, 0), "v": 1}})
+        """
+        from modules.nodel import Dep_Node
+
+        pairs = nodeValues.items() if hasattr(nodeValues, "items") else nodeValues
+
+        attributes = []
+        for node, values in pairs:
+            attrs = (node if isinstance(node, Dep_Node) else Dep_Node(node)).a
+            values = values.items() if hasattr(values, "items") else [(attr, None) for attr in values]
+            attributes.extend((attrs[attr], value) for attr, value in values)
+
+        # Queued on one batch, or on the current one, so the values and the
+        # state flags apply in order and revert with a single undo
+        flags = dict((k, v) for k, v in (("lock", lock), ("keyable", keyable), ("channelBox", channelBox))
+                     if v is not None)
+        with attribute_batch.batch() as edits:
+            for attribute, value in attributes:
+                # Unlock first so the new value can go in
+                if lock is False:
+                    edits.set(attribute, (), {"lock": False})
+                if value is not None:
+                    edits.set(attribute, tuple(value) if isinstance(value, (list, tuple)) else (value,))
+                if flags:
+                    edits.set(attribute, (), flags)
 
     def zeroAttributes(self, **kwargs):
         """ Zeros out the transform attributes on the node.
@@ -95,9 +203,12 @@ class Attributes(object):
 
 class Attribute(object):
 
+    __slots__ = ("node", "_attribute", "_plug")
+
     def __init__(self, node, attr):
         self.node = node
         self._attribute = attr
+        self._plug = None
 
     def __str__(self):
         fullPath = self.fullPath
@@ -206,6 +317,9 @@ class Attribute(object):
             Example:
                 calc = (node.a.sx + node.a.sy)
         """
+        if attribute_expression.isLazy():
+            return attribute_expression.Expression.wrap(self) + value
+
         return self.plusMinusAverageNode(value)
 
     def __sub__(self, value):
@@ -214,6 +328,9 @@ class Attribute(object):
             Example:
                 subNode = node.a.sx - node.a.sy
         """
+        if attribute_expression.isLazy():
+            return attribute_expression.Expression.wrap(self) - value
+
         return self.plusMinusAverageNode(value, operationType=2)
 
     def __mul__(self, value):
@@ -222,6 +339,9 @@ class Attribute(object):
             Example:
                 mulNode = node.a.sx * node.a.sy
         """
+        if attribute_expression.isLazy():
+            return attribute_expression.Expression.wrap(self) * value
+
         return self.multiplyDivideNode(value, operationType=1)
 
     def __div__(self, value):
@@ -230,6 +350,9 @@ class Attribute(object):
             Example:
                 calc = node.a.sx / node.a.sy
         """
+        if attribute_expression.isLazy():
+            return attribute_expression.Expression.wrap(self) / value
+
         return self.multiplyDivideNode(value, operationType=2)
 
     def __truediv__(self, value):
@@ -238,6 +361,9 @@ class Attribute(object):
             Example:
                 calc = node.a.sx / node.a.sy
         """
+        if attribute_expression.isLazy():
+            return attribute_expression.Expression.wrap(self) / value
+
         return self.multiplyDivideNode(value, operationType=2)
 
     def __pow__(self, value):
@@ -246,9 +372,12 @@ class Attribute(object):
             Example:
                 calc = node.a.sx ** node.a.sy
         """
+        if attribute_expression.isLazy():
+            return attribute_expression.Expression.wrap(self) ** value
+
         return self.multiplyDivideNode(value, operationType=3)
 
-    def plusMinusAverageNode(self, value, operationType=1):
+    def plusMinusAverageNode(self, value, operationType=1, nodeType=None):
         """ Adding or Subtracting the value passed or attribute.
 
                     Args
@@ -257,6 +386,7 @@ class Attribute(object):
                             operationType = 1 (sum)
                             operationType = 2 (subtract)
                             operationType = 3 (average)
+                        nodeType (str): The node type to use, default: node_cost.pick().
                     Returns:
                         object: self
 
@@ -266,20 +396,27 @@ class Attribute(object):
                         calc = ((node.a.sx + node.a.sy) + node.a.sz) + 10
                         calc.a.output >> node.a.sx
                 """
-        nodeType = "plusMinusAverage"
-        nodeName = self.createNodeName(value, nodeType)
+        if isinstance(value, attribute_expression.Expression):
+            value = value.compile()
 
         # Check whether the connections are both parent plugs or children
-        attribute = "input3D" if self.checkConnectionAttribute(value) else "input1D"
+        compound = self.checkConnectionAttribute(value)
+        attribute = "input3D" if compound else "input1D"
 
         # This makes the addition to a current plusMinus node if is self
-        if cmds.objectType(self.node) == nodeType and cmds.getAttr(self.node.a.operation) == operationType:
+        # Nodes shared by a CSE session cannot be edited in place
+        if nodeType in (None, "plusMinusAverage") and cmds.objectType(self.node) == "plusMinusAverage" \
+                and cmds.getAttr(self.node.a.operation) == operationType and expression_cache.release(self.node):
             self.addToPlusMinusAverage(attribute, value)
+            return self
 
-        else:
-            return self.createPlusMinusAverage(nodeName, nodeType, operationType, attribute, value)
+        operation = {1: "add", 2: "subtract", 3: "average"}[operationType]
+        spec = node_cost.pick(operation, compound, isinstance(value, (float, int)), nodeType=nodeType)
+        if spec.nodeType != "plusMinusAverage":
+            return self.createMathNode(spec, value)
 
-        return self
+        nodeName = self.createNodeName(value, spec.nodeType)
+        return self.createPlusMinusAverage(nodeName, spec.nodeType, operationType, attribute, value)
 
     def createNodeName(self, value, suffix):
         """Create a new node name. """
@@ -300,7 +437,11 @@ class Attribute(object):
                         attribute (int/float/str/attributeObject): The maya node.
                         value (int/float/str/attributeObject): The maya node.
                 """
-        connectionIndex = cmds.getAttr(self.node.a[attribute], size=1)
+        batch = attribute_batch.current()
+        if batch is not None:
+            connectionIndex = batch.nextIndex(self.node.a[attribute])
+        else:
+            connectionIndex = cmds.getAttr(self.node.a[attribute], size=1)
         if isinstance(value, (float, int)):
             self.node.a["%s[%s]" % (attribute, connectionIndex)].set(value)
         else:
@@ -325,6 +466,12 @@ class Attribute(object):
                         class: The attribute nodal name and class.
                 """
         from modules.nodel import Dep_Node
+        outputAttr = "output3D" if self.checkConnectionAttribute(value) else "output1D"
+        inputs = [(attribute + "[0]", self), (attribute + "[1]", value)]
+        output = expression_cache.lookup(nodeType, operationType, inputs, commutative=operationType == 1)
+        if output is not None:
+            return output
+
         plusMinusAverage = Dep_Node(nodeName, nodeType)
         plusMinusAverage.a.operation.set(operationType)
 
@@ -336,33 +483,89 @@ class Attribute(object):
         elif isinstance(value, six.string_types) or isinstance(value, Attribute):
             plusMinusAverage.a[attribute] << value
 
-        if self.checkConnectionAttribute(value):
-            return plusMinusAverage.a.output3D
+        output = plusMinusAverage.a[outputAttr]
+        expression_cache.store(nodeType, operationType, inputs, output, commutative=operationType == 1)
+        return output
 
-        return plusMinusAverage.a.output1D
+    def multiplyDivideNode(self, value, operationType=1, nodeType=None):
+        """ Multiplying, dividing or powering by the value passed or attribute.
+
+                    Args
+                        value (int/float/str/attributeObject): The value to use.
+                        operationType (int): The operation to use.
+                            operationType = 1 (multiply)
+                            operationType = 2 (divide)
+                            operationType = 3 (power)
+                        nodeType (str): The node type to use, default: node_cost.pick().
+                    Returns:
+                        class: The attribute output.
+                """
+        if isinstance(value, attribute_expression.Expression):
+            value = value.compile()
+
+        compound = self.checkConnectionAttribute(value)
+        operation = {1: "multiply", 2: "divide", 3: "power"}[operationType]
+        spec = node_cost.pick(operation, compound, isinstance(value, (float, int)), nodeType=nodeType)
+
+        # Scalar division by a constant and the single channel math nodes
+        if spec.nodeType not in ("multiplyDivide", "multDoubleLinear") or spec.constant:
+            return self.createMathNode(spec, value)
 
-    def multiplyDivideNode(self, value, operationType=1):
         nodeType = "multiplyDivide"
         nodeName = self.createNodeName(value, nodeType)
         # multi
         if operationType == 1:
             # if parent
-            if self.checkConnectionAttribute(value):
+            if compound:
                 return self.createMultiDivide(nodeName, nodeType, operationType, value)
 
             # if child
-            else:
+            elif spec.nodeType == "multDoubleLinear":
                 return self.createMultDoubleLinear(nodeName, value)
-        # div/pow
-        else:
 
-            # If parent
-            if self.checkConnectionAttribute(value):
-                return self.createDivideParent(nodeName, nodeType, operationType, value)
+        # If parent
+        if compound:
+            return self.createDivideParent(nodeName, nodeType, operationType, value)
 
-            # If child
-            else:
-                return self.createDivideChildren(nodeName, nodeType, operationType, value)
+        # If child
+        return self.createDivideChildren(nodeName, nodeType, operationType, value)
+
+    def createMathNode(self, spec, value):
+        """ Create the two input node node_cost picked for a scalar operation within a cheapest() block.
+
+            Args:
+                spec (Node_Spec): The node type, operation and attributes to use.
+                value (int/float/str/attributeObject): The value to use.
+
+            Returns
+                class: The attribute output.
+        """
+        from modules.nodel import Dep_Node
+        if isinstance(value, (float, int)) and spec.constant:
+            try:
+                value = spec.constant(value)
+            except ZeroDivisionError:
+                raise ValueError(">>> Cannot divide {} by zero".format(self))
+
+        inputs = [(spec.inputs[0], self), (spec.inputs[1], value)]
+        output = expression_cache.lookup(spec.nodeType, spec.operationType, inputs, spec.commutative)
+        if output is not None:
+            return output
+
+        node = Dep_Node(self.createNodeName(value, spec.nodeType), spec.nodeType)
+        if spec.operationType is not None:
+            node.a.operation.set(spec.operationType)
+
+        node.a[spec.inputs[0]] << self
+
+        if isinstance(value, (float, int)):
+            node.a[spec.inputs[1]].set(value)
+        else:
+            node.a[spec.inputs[1]] << value
+
+        output = node.a[spec.output]
+        expression_cache.store(spec.nodeType, spec.operationType, inputs, output, spec.commutative)
+        return output
 
     def createMultiDivide(self, nodeName, nodeType, operationType, value):
         """ Create the multi divide node that we need to work with.
@@ -377,12 +580,18 @@ class Attribute(object):
                 class: The attribute nodal class.
         """
         from modules.nodel import Dep_Node
+        inputs = [("input1", self), ("input2", value)]
+        output = expression_cache.lookup(nodeType, operationType, inputs, commutative=operationType == 1)
+        if output is not None:
+            return output
+
         md = Dep_Node(nodeName, nodeType)
-        md.a.operation = operationType
+        md.a.operation.set(operationType)
 
         md.a.input1 << self
         md.a.input2 << value
 
+        expression_cache.store(nodeType, operationType, inputs, md.a.output, commutative=operationType == 1)
         return md.a.output
 
     def createMultDoubleLinear(self, nodeName, value):
@@ -396,6 +605,11 @@ class Attribute(object):
                 str/class: The attribute nodal name and class.
         """
         from modules.nodel import Dep_Node
+        inputs = [("input1", self), ("input2", value)]
+        output = expression_cache.lookup("multDoubleLinear", None, inputs, commutative=True)
+        if output is not None:
+            return output
+
         mdl = Dep_Node(nodeName[:-2] + "MDL", "multDoubleLinear")
         mdl.a.input1 << self
 
@@ -404,6 +618,7 @@ class Attribute(object):
         else:
             mdl.a.input2 << value
 
+        expression_cache.store("multDoubleLinear", None, inputs, mdl.a.output, commutative=True)
         return mdl.a.output
 
     def createDivideChildren(self, nodeName, nodeType, operationType, value):
@@ -418,6 +633,11 @@ class Attribute(object):
                         class: The attribute object output.
                """
         from modules.nodel import Dep_Node
+        inputs = [("input1X", self), ("input2X", value)]
+        output = expression_cache.lookup(nodeType, operationType, inputs)
+        if output is not None:
+            return output
+
         divide = Dep_Node(nodeName, nodeType)
         divide.a.operation.set(operationType)
 
@@ -428,6 +648,7 @@ class Attribute(object):
         else:
             divide.a.input2X << value
 
+        expression_cache.store(nodeType, operationType, inputs, divide.a.outputX)
         return divide.a.outputX
 
     def createDivideParent(self, nodeName, nodeType, operationType, value):
@@ -442,6 +663,11 @@ class Attribute(object):
                         class: The attribute object output.
                """
         from modules.nodel import Dep_Node
+        inputs = [("input1", self), ("input2", value)]
+        output = expression_cache.lookup(nodeType, operationType, inputs)
+        if output is not None:
+            return output
+
         divide = Dep_Node(nodeName, nodeType)
         divide.a.operation.set(operationType)
 
@@ -452,6 +678,7 @@ class Attribute(object):
         else:
             divide.a.input2 << value
 
+        expression_cache.store(nodeType, operationType, inputs, divide.a.output)
         return divide.a.output
 
     # -------------------------------------------------------------------------------------------------
@@ -475,6 +702,47 @@ class Attribute(object):
         """
         return self._attribute
 
+    @property
+    def plug(self):
+        """ The OpenMaya plug of the attribute, resolved once and reused.
+
+            Example:
+                print(sphere.a.rotateX.plug.name())
+                Output:"sphere_Geo.rotateX"
+        """
+        if self._plug is not None and self._plugIsValid():
+            return self._plug
+
+        self._plug = None
+        nodePath = self.node.fullPath
+        if nodePath:
+            try:
+                self._plug = open_maya_api.toMPlug("{}.{}".format(nodePath, self.attribute))
+            except RuntimeError:
+                pass
+
+        return self._plug
+
+    def _plugIsValid(self):
+        """ Whether the cached plug still belongs to a living node and attribute."""
+        handle = self.node.handle
+        if handle is None or not handle.isValid() or not self._plug.node() == handle.object():
+            return False
+
+        # Only dynamic attributes can be removed from under us
+        if self._plug.isDynamic():
+            return self.node.dep.hasAttribute(om.MFnAttribute(self._plug.attribute()).name())
+
+        return True
+
+    def _attributePath(self, nodePath):
+        if not nodePath:
+            return None
+
+        attrPath = "{}.{}".format(nodePath, self.attribute)
+        if self.plug is not None or cmds.objExists(attrPath):
+            return attrPath
+
     @property
     def path(self):
         """ Object attribute string path with node name and attr.
@@ -483,9 +751,7 @@ class Attribute(object):
                 print(sphere.a.rotateX.path)
                 Output:"sphere_Geo.rotateX"
         """
-        nodePath = "{}.{}".format(self.node.path, self.attribute)
-        if self.node.path and cmds.objExists(nodePath):
-            return nodePath
+        return self._attributePath(self.node.path)
 
     @property
     def fullPath(self):
@@ -495,9 +761,7 @@ class Attribute(object):
                 print(sphere.a.rotateX.path)
                 Output:"|BASE_GRP|SUB_GRP|sphere_Geo.rotateX"
         """
-        nodePath = "{}.{}".format(self.node.fullPath, self.attribute)
-        if self.node.fullPath and cmds.objExists(nodePath):
-            return nodePath
+        return self._attributePath(self.node.fullPath)
 
     def exists(self):
         """ Checks whether our attribute exists
@@ -513,20 +777,42 @@ class Attribute(object):
     # -------------------------------------------------------------------------------------------------
 
     def set(self, *args, **kwargs):
-        """ Sets our attribute using functionality from maya.cmds
+        """ Sets our attribute through its plug, numeric, compound and matrix values
+            go through an undoable MDGModifier command, anything else or any flag uses maya.cmds.
 
             Example:
                 print(sphere.a.rx.set(1))
         """
+        batch = attribute_batch.current()
+        if batch is not None:
+            return batch.set(self, args, kwargs)
+
+        plug = None if kwargs else self.plug
+        if plug is not None and open_maya_api.isPlugFree(plug):
+            modifier = om.MDGModifier()
+            if open_maya_api.setPlugValue(modifier, plug, args):
+                try:
+                    modifier_command.run(modifier)
+                    return
+                except RuntimeError:
+                    pass
+
         cmds.setAttr(self.fullPath, *args, **kwargs)
 
     def get(self, **kwargs):
-        """ Gets our attribute value using functionality from maya.cmds
+        """ Gets our attribute value through its plug, falling back to
+            maya.cmds for flags and types the plug can not read.
 
             Example:
                 print(sphere.a.rx.get())
                 Output: 1
         """
+        plug = None if kwargs else self.plug
+        if plug is not None:
+            valueType = open_maya_api.plugValueType(plug)
+            if valueType:
+                return open_maya_api.getPlugValue(plug, valueType)
+
         return cmds.getAttr(self.fullPath, **kwargs)
 
     def query(self, **kwargs):
@@ -565,21 +851,28 @@ class Attribute(object):
                 print(sphere.a.rx.children)
                 Output: []
         """
-        if self.query(indexMatters=True, multi=True):
-            multiIndices = cmds.getAttr(self, multiIndices=True)
-            index = len(multiIndices) if multiIndices else 0
-            lc = self.query(listChildren=True)
+        schema = self.schema
+        if not schema:
+            return []
+
+        # An element such as "input3D[0]" is no longer the multi itself
+        if schema.multi and not self.attr.endswith("]"):
+            multiIndices = om.MIntArray()
+            self.plug.getExistingArrayAttributeIndices(multiIndices)
+            index = multiIndices.length()
 
             # If children, return all the multi indices attrs
-            if lc:
-                return [self.node.a["%s[%s].%s" % (self.attr, index, a)] for a in lc]
+            if schema.children:
+                return [self.node.a["%s[%s].%s" % (self.attr, index, a)] for a in schema.children]
 
             # return the single multi index item
             else:
                 return [self.node.a["%s[%s]" % (self.attr, index)]]
 
-        return [self.node.a[attr] for attr in self.query(listChildren=True) or []]  # NoneType is not iterable,
-        # iterate [] returns None
+        if "[" in self.attr:
+            return [self.node.a["%s.%s" % (self.attr, a)] for a in schema.children]
+
+        return [self.node.a[attr] for attr in schema.children]
 
     @property
     def parent(self):
@@ -591,10 +884,25 @@ class Attribute(object):
                 print(sphere.a.rotate.parent)
                 Output: []
         """
-        a = self.query(listParent=True)
-        if a:
-            return Attribute(self.node, a[0]) or []
-        return []
+        schema = self.schema
+        if not schema or not schema.parent:
+            return []
+
+        # Keep the multi index of element children, "input3D[0].input3Dx" -> "input3D[0]"
+        if "[" in self.attr and "." in self.attr:
+            return self.node.a[self.attr.rsplit(".", 1)[0]]
+
+        return self.node.a[schema.parent]
+
+    @property
+    def schema(self):
+        """ The cached layout of the attribute, shared by every node of the same type.
+
+            Example:
+                print(sphere.a.rotate.schema.children)
+                Output: ('rotateX', 'rotateY', 'rotateZ')
+        """
+        return attribute_schema.get(self)
 
     # -------------------------------------------------------------------------------------------------
 
@@ -606,23 +914,14 @@ class Attribute(object):
                           print(sphere.a.rx.connectionInput)
                           Output: Attribute('cube_GEO.rotateX')
         """
-        from modules.nodel import Dag_Node
-        attrs = cmds.listConnections(self.fullPath, p=1, d=0) or []
-
-        if self.children:
-            for child in self.children:
-                childAttrs = cmds.listConnections(child.fullPath, plugs=True, destination=False)
-                if childAttrs:
-                    attrs += childAttrs
-
-        inputs = []
+        from modules.nodel import graph
+        plug = self.plug
+        if plug is None:
+            return None
 
-        if attrs:
-            for attr in attrs:
-                nodeName = Dag_Node(attr.split(".")[0])
-                attrName = attr.split(".")[-1]
-                inputs.append(Attribute(nodeName, attrName))
-            return inputs[0] if len(attrs) == 1 else inputs
+        inputs = [graph.wrapPlug(source) for source, own in graph.connectedPlugs(plug, inputs=True)]
+        if inputs:
+            return inputs[0] if len(inputs) == 1 else inputs
 
         return None
 
@@ -634,20 +933,14 @@ class Attribute(object):
                                   print(cube.a.rx.connectionOutputs)
                                   Output: Attribute('cube_GEO.rotateX')
         """
-        from modules.nodel import Dag_Node
-        attrs = cmds.listConnections(self.fullPath, p=1, s=0) or []
-
-        if self.children:
-            for child in self.children:
-                childAttrs = cmds.listConnections(child.fullPath, plugs=True)
-                if childAttrs:
-                    attrs += childAttrs
-
-        if attrs:
-            attrNodes = [Attribute(Dag_Node(attr.split(".")[0]), attr.split(".")[-1]) for attr in attrs]
-            return attrNodes
+        from modules.nodel import graph
+        plug = self.plug
+        if plug is None:
+            return None
 
-        return None
+        outputs = [graph.wrapPlug(destination)
+                   for destination, own in graph.connectedPlugs(plug, inputs=False, outputs=True)]
+        return outputs or None
 
     # -------------------------------------------------------------------------------------------------
     def connect(self, attr):
@@ -656,9 +949,16 @@ class Attribute(object):
             Example:
                 sphere.a.rx.connect(cube.a.rx)
         """
+        batch = attribute_batch.current()
+        if batch is not None:
+            batch.connect(self, attr)
+            return self
+
         if not cmds.isConnected(self, attr):
 
-            if (self.query(listChildren=True) != None) and (attr.query(listChildren=True) == None):
+            drivingSchema = self.schema
+            drivenSchema = attr.schema
+            if drivingSchema and drivingSchema.children and drivenSchema and not drivenSchema.children:
                 raise ValueError(
                     "The driving of these values might be a parent value such"
                     "as scale and the driven cannot then be a child, this must be handled on the"
@@ -677,32 +977,16 @@ class Attribute(object):
             return self
 
     def disconnect(self):
-        """ Disconnects this attribute to the passed item.
+        """ Disconnects whatever drives this attribute or its children.
 
             Example:
                 cube.a.rx.disconnect()
         """
-        CHILDREN_ELSE_SELF = self.children if self.children else self
+        batch = attribute_batch.current()
+        if batch is not None:
+            return batch.disconnect(self)
 
-        allAttrs = CHILDREN_ELSE_SELF
-        connections = cmds.listConnections(allAttrs, p=True)
-
-        if not connections:
-            return None
-        
-        if self.children:
-            for child_attr in self.children:
-                conn_attr = cmds.listConnections(child_attr, p=True)
-                if not conn_attr:
-                    continue
-
-                if cmds.isConnected(conn_attr[0], child_attr):
-                    cmds.disconnectAttr(conn_attr[0], child_attr)
-
-        else:
-            for attr in connections:
-                if cmds.isConnected(attr, self.fullPath):
-                    cmds.disconnectAttr(attr, self.fullPath)
+        attribute_batch.disconnect([self])
 
     def delete(self):
         """ Removes and deletes the attribute
@@ -711,3 +995,5 @@ class Attribute(object):
                  cube.a.geo_vis.delete()
         """
         cmds.deleteAttr(self.fullPath)
+        self._plug = None
+        self.node.a.clearCache()
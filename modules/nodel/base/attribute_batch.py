@@ -0,0 +1,328 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Queue connections, disconnections and attribute values on a single MDGModifier
+        and commit them all at once, rolling everything back if one of them fails.
+"""
+
+import contextlib
+import numbers
+
+import maya.OpenMaya as om
+
+from modules import six
+
+from modules.nodel import graph
+from modules.nodel.base import modifier_command
+from modules.utils import open_maya_api
+
+# The batch of the outermost batch() block we are in
+_current = None
+
+
+class Batch(object):
+    """A queue of attribute edits that is applied with one MDGModifier, as a single undo step.
+
+        The operations are checked against the cached plugs and schemas while queuing,
+        so mistakes raise at the line that made them and nothing is applied.
+        Queries like get() or listConnections still see the scene as it was before the batch.
+
+        Example:
+
+            with batch():
+                ctrl.a.rx >> jnt.a.rx
+                jnt.a.ry.disconnect()
+                jnt.a.v.set(0)
+    """
+
+    __slots__ = ("modifier", "count", "_incoming", "_indices")
+
+    def __init__(self):
+        self.modifier = om.MDGModifier()
+        self.count = 0
+
+        # Destination attribute path -> the source plug queued for it, None once disconnected
+        self._incoming = {}
+
+        # Array attribute path -> the next free logical index, pending connections included
+        self._indices = {}
+
+    def __repr__(self):
+        return "{0}({1} operations)".format(self.__class__.__name__, self.count)
+
+    # -------------------------------------------------------------------------------------------------
+
+    def connect(self, source, destination):
+        """ Queue a connection the way Attribute.connect makes it, child by child for parent attributes.
+
+            Args:
+                source (Attribute): The driving attribute.
+                destination (Attribute): The driven attribute.
+        """
+        drivingSchema = source.schema
+        drivenSchema = destination.schema
+        if not drivingSchema or not drivenSchema:
+            raise ValueError(">>> Cannot connect {0} to {1}, the attribute does not exist".format(source, destination))
+
+        if drivingSchema.children and not drivenSchema.children:
+            raise ValueError(">>> Cannot connect the parent attribute {0} to the child attribute {1}, this must be "
+                             "handled on the input side".format(source, destination))
+
+        # Connecting to the array itself takes the next free element
+        if drivenSchema.multi and not destination.attr.endswith("]"):
+            destination = destination.node.a["{0}[{1}]".format(destination.attr, self.nextIndex(destination))]
+
+        drivingAttrs = source.children or [source] * 3
+        drivenAttrs = destination.children or [destination]
+
+        for driver, driven in zip(drivingAttrs, drivenAttrs):
+            self._connectPlug(driver, driven)
+
+    def _connectPlug(self, driver, driven):
+        self.connectPlugs(_checkedPlug(driver), _checkedPlug(driven))
+
+    def connectPlugs(self, driverPlug, drivenPlug):
+        """ Queue a connection between two plugs, replacing what drives the destination.
+
+            Args:
+                driverPlug (MPlug): The driving plug.
+                drivenPlug (MPlug): The driven plug.
+        """
+        if drivenPlug.isLocked():
+            raise ValueError(">>> Cannot connect to {}, the attribute is locked".format(drivenPlug.name()))
+
+        key = graph.plugPath(drivenPlug)
+        existing = self._sourceOf(key, drivenPlug)
+        if existing is not None:
+            if existing == driverPlug:
+                return
+
+            # Same as connectAttr(force=True)
+            self.modifier.disconnect(existing, drivenPlug)
+
+        self.modifier.connect(driverPlug, drivenPlug)
+        self._incoming[key] = driverPlug
+        self.count += 1
+
+    def disconnect(self, attribute):
+        """ Queue the removal of the incoming connections of an attribute or of its children.
+
+            Args:
+                attribute (Attribute): The driven attribute.
+        """
+        for driven in attribute.children or [attribute]:
+            drivenPlug = _checkedPlug(driven)
+            existing = self._sourceOf(graph.plugPath(drivenPlug), drivenPlug)
+            if existing is not None:
+                self.disconnectPlugs(existing, drivenPlug)
+
+    def disconnectPlugs(self, sourcePlug, drivenPlug):
+        """ Queue the removal of one connection, nothing happens if it is already gone.
+
+            Args:
+                sourcePlug (MPlug): The driving plug.
+                drivenPlug (MPlug): The driven plug.
+        """
+        key = graph.plugPath(drivenPlug)
+        existing = self._sourceOf(key, drivenPlug)
+        if existing is None or existing != sourcePlug:
+            return
+
+        self.modifier.disconnect(sourcePlug, drivenPlug)
+        self._incoming[key] = None
+        self.count += 1
+
+    def set(self, attribute, args, kwargs=None):
+        """ Queue a value, through the plug when it can take it and as a setAttr command otherwise.
+
+            Args:
+                attribute (Attribute): The attribute to set.
+                args (tuple): The values, like Attribute.set.
+                kwargs (dict): The setAttr flags, like Attribute.set.(optional)
+        """
+        plug = _checkedPlug(attribute)
+        if not kwargs and open_maya_api.isPlugFree(plug) and \
+                open_maya_api.setPlugValue(self.modifier, plug, args):
+            self.count += 1
+            return
+
+        # Keeps its place in the queue, unlike running the command now
+        self.modifier.commandToExecute(_melCommand("setAttr", attribute.fullPath, args, kwargs or {}))
+        self.count += 1
+
+    def nextIndex(self, attribute):
+        """ The next free logical index of an array attribute, counting the queued connections."""
+        key = attribute.fullPath
+        if key not in self._indices:
+            indices = om.MIntArray()
+            _checkedPlug(attribute).getExistingArrayAttributeIndices(indices)
+            self._indices[key] = max([indices[i] for i in range(indices.length())] or [-1]) + 1
+
+        index = self._indices[key]
+        self._indices[key] = index + 1
+        return index
+
+    def _sourceOf(self, key, plug):
+        if key in self._incoming:
+            return self._incoming[key]
+
+        sources = om.MPlugArray()
+        plug.connectedTo(sources, True, False)
+        return sources[0] if sources.length() else None
+
+    # -------------------------------------------------------------------------------------------------
+
+    def commit(self):
+        """ Apply the whole queue as one undo step, rolling back what was applied if any operation fails."""
+        try:
+            modifier_command.run(self.modifier)
+        except RuntimeError as error:
+            raise ValueError(">>> The batch was rolled back, one of its {0} operations failed: {1}".format(
+                self.count, error))
+
+
+# -------------------------------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def batch():
+    """Queue every connect, disconnect and set of our Attributes within the block and apply them
+    with one MDGModifier when it ends, one cmds.undo() reverts it all. Nothing is applied if the
+    block raises, and a failing operation rolls the whole batch back. Nested blocks join the outer batch.
+
+        Example:
+            with batch() as edits:
+                for ctrl, jnt in zip(ctrls, joints):
+                    ctrl.a.r >> jnt.a.r
+            print(edits)
+            # Output: Batch(120 operations)
+    """
+    global _current
+    if _current is not None:
+        yield _current
+        return
+
+    _current = Batch()
+    try:
+        yield _current
+        queued, _current = _current, None
+        queued.commit()
+    finally:
+        _current = None
+
+
+def current():
+    """The batch being queued, None outside a batch() block."""
+    return _current
+
+
+def disconnect(items, inputs=True, outputs=False):
+    """Break every connection of some attributes or nodes, found in one query and removed
+    with one modifier. Joins the current batch() block if there is one.
+
+        Args:
+            items(list): Attributes, plugs or attribute paths, and nodes for all their attributes.
+            inputs(bool): Break the connections driving them.
+            outputs(bool): Break the connections they drive.
+
+        Returns:
+            int: The number of connections broken.
+
+        Example:
+            disconnect([ctrl.a.t, ctrl.a.r], inputs=False, outputs=True)
+    """
+    if not isinstance(items, (list, tuple, set)):
+        items = [items]
+
+    connections = graph.edges(items, inputs=inputs, outputs=outputs)
+    with batch() as edits:
+        for source, destination in connections:
+            edits.disconnectPlugs(source, destination)
+
+    return len(connections)
+
+
+def rewire(oldSource, newSource):
+    """Move everything driven by one attribute or node over to another one, with one modifier.
+    Nodes are matched attribute by attribute, parent attributes child by child.
+    Joins the current batch() block if there is one.
+
+        Args:
+            oldSource(Attribute/Dep_Node): What drives the connections now.
+            newSource(Attribute/Dep_Node): What should drive them instead.
+
+        Returns:
+            int: The number of connections moved.
+
+        Example:
+            rewire(oldModule.ctrl, newModule.ctrl)
+    """
+    connections = graph.edges([oldSource], inputs=False, outputs=True)
+    replacements = _replacementPlugs(oldSource, newSource, [source for source, _ in connections])
+
+    with batch() as edits:
+        for (source, destination), replacement in zip(connections, replacements):
+            edits.connectPlugs(replacement, destination)
+
+    return len(connections)
+
+
+def _replacementPlugs(oldSource, newSource, plugs):
+    """The plug of newSource that takes over from each plug of oldSource."""
+    if graph.isNode(oldSource):
+        newNode = graph.toMObject(newSource)
+        newName = open_maya_api.toName(newNode)
+        replacements = []
+        for plug in plugs:
+            path = "{0}.{1}".format(newName, graph.plugAttributeName(plug))
+            try:
+                replacements.append(open_maya_api.toMPlug(path))
+            except RuntimeError:
+                raise ValueError(">>> Cannot rewire {0}, {1} does not exist".format(plug.name(), path))
+        return replacements
+
+    oldPlug = graph.toPlug(oldSource)
+    newPlug = graph.toPlug(newSource)
+    oldChildren = [oldPlug.child(i) for i in range(oldPlug.numChildren())] if oldPlug.isCompound() else []
+
+    replacements = []
+    for plug in plugs:
+        if plug == oldPlug:
+            replacements.append(newPlug)
+            continue
+
+        index = [i for i, child in enumerate(oldChildren) if child == plug]
+        if not index or not newPlug.isCompound() or index[0] >= newPlug.numChildren():
+            raise ValueError(">>> Cannot rewire {0}, {1} has no matching child".format(
+                plug.name(), newPlug.name()))
+        replacements.append(newPlug.child(index[0]))
+
+    return replacements
+
+
+def _checkedPlug(attribute):
+    plug = attribute.plug
+    if plug is None:
+        raise ValueError(">>> Cannot batch {}, the attribute does not exist".format(attribute))
+    return plug
+
+
+def _melValue(value):
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, six.string_types):
+        return '"{}"'.format(value.replace("\\", "\\\\").replace('"', '\\"'))
+    if isinstance(value, (list, tuple)):
+        return " ".join(_melValue(i) for i in value)
+    # float() and int() first, the repr of a numpy scalar is no MEL number
+    if isinstance(value, numbers.Integral):
+        return str(int(value))
+    if isinstance(value, numbers.Real):
+        return "%r" % float(value)
+    raise ValueError(">>> {0!r} can not be written as a MEL value".format(value))
+
+
+def _melCommand(command, path, args, kwargs):
+    """Build the MEL version of a maya.cmds call, e.g. setAttr -lock 1 "cube.tx"."""
+    flags = " ".join("-{0} {1}".format(flag, _melValue(value)) for flag, value in sorted(kwargs.items()))
+    values = " ".join(_melValue(value) for value in args)
+    return " ".join(part for part in (command, flags, _melValue(path), values) if part)
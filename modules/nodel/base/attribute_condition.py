@@ -11,6 +11,8 @@ from modules.nodel import Dep_Node
 class Condition(Dep_Node):
     """ The class that will carry our condition node information. """
 
+    __slots__ = ()
+
     def __init__(self, node, firstTerm=None, secondTerm=None, operation=None):
         Dep_Node.__init__(self, node, "condition")
 
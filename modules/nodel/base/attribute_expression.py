@@ -0,0 +1,496 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: An opt-in lazy mode for the Attribute math operators, the operators build an
+        expression tree that is only turned into Maya nodes when it gets connected.
+"""
+
+import contextlib
+
+import maya.cmds as cmds
+
+from modules import six
+
+from modules.nodel.base import expression_cache, node_cost
+
+# Nesting depth of the lazy() blocks we are in
+_lazyDepth = 0
+
+CONSTANT = "constant"
+PLUG = "plug"
+SUM = "sum"
+PRODUCT = "product"
+POWER = "power"
+
+
+@contextlib.contextmanager
+def lazy():
+    """Build expression trees instead of nodes for the math operators within the block.
+    The trees are folded and flattened, then compiled on >> or connect.
+
+        Example:
+            with lazy():
+                (node.a.tx + node.a.ty + node.a.tz + 0) * 2 * 0.5 >> node2.a.tx
+            # One plusMinusAverage instead of three plusMinusAverage and two multDoubleLinear
+    """
+    global _lazyDepth
+    _lazyDepth += 1
+    try:
+        yield
+    finally:
+        _lazyDepth -= 1
+
+
+def isLazy():
+    return _lazyDepth > 0
+
+
+def isConstant(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class Expression(object):
+    """A node of a deferred Attribute math expression.
+
+        Args:
+            operation(str): One of CONSTANT, PLUG, SUM, PRODUCT or POWER.
+            operands(list): The value for leaves, (sign, Expression) pairs for sums,
+                (exponent, Expression) pairs for products and [base, exponent] for powers.
+
+        Example:
+
+            with lazy():
+                calc = node.a.sx * node.a.sy / 2
+            calc >> node.a.sz
+    """
+
+    __slots__ = ("operation", "operands", "_output")
+
+    def __init__(self, operation, operands):
+        self.operation = operation
+        self.operands = operands
+        self._output = None
+
+    @classmethod
+    def wrap(cls, value):
+        """Turn an Attribute, an attribute path like "ctrl.tx", a number or an Expression into an Expression."""
+        from modules.nodel.base.attribute_base import Attribute
+
+        if isinstance(value, Expression):
+            return value
+        if isConstant(value):
+            return cls(CONSTANT, value)
+        if isinstance(value, Attribute):
+            return cls(PLUG, value)
+        if isinstance(value, six.string_types):
+            return cls(PLUG, _attributeFromPath(value))
+
+        raise ValueError(">>> Cannot use {!r} in an attribute expression".format(value))
+
+    def __repr__(self):
+        if self.operation in (CONSTANT, PLUG):
+            return "{0}({1!r})".format(self.__class__.__name__, self.operands)
+
+        return "{0}('{1}', {2})".format(self.__class__.__name__, self.operation, len(self.operands))
+
+    # -------------------------------------------------------------------------------------------------
+
+    def __add__(self, value):
+        return Expression(SUM, [(1, self), (1, Expression.wrap(value))])
+
+    def __radd__(self, value):
+        return Expression(SUM, [(1, Expression.wrap(value)), (1, self)])
+
+    def __sub__(self, value):
+        return Expression(SUM, [(1, self), (-1, Expression.wrap(value))])
+
+    def __rsub__(self, value):
+        return Expression(SUM, [(1, Expression.wrap(value)), (-1, self)])
+
+    def __mul__(self, value):
+        return Expression(PRODUCT, [(1, self), (1, Expression.wrap(value))])
+
+    def __rmul__(self, value):
+        return Expression(PRODUCT, [(1, Expression.wrap(value)), (1, self)])
+
+    def __truediv__(self, value):
+        return Expression(PRODUCT, [(1, self), (-1, Expression.wrap(value))])
+
+    def __rtruediv__(self, value):
+        return Expression(PRODUCT, [(1, Expression.wrap(value)), (-1, self)])
+
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __pow__(self, value):
+        return Expression(POWER, [self, Expression.wrap(value)])
+
+    def __neg__(self):
+        return Expression(PRODUCT, [(1, Expression(CONSTANT, -1)), (1, self)])
+
+    # Conditions end the tree, they need a real node for setCondition
+    def __gt__(self, value):
+        return self._compiledPlug() > value
+
+    def __ge__(self, value):
+        return self._compiledPlug() >= value
+
+    def __lt__(self, value):
+        return self._compiledPlug() < value
+
+    def __le__(self, value):
+        return self._compiledPlug() <= value
+
+    def __eq__(self, value):
+        return self._compiledPlug() == value
+
+    def __ne__(self, value):
+        return self._compiledPlug() != value
+
+    __hash__ = object.__hash__
+
+    # -------------------------------------------------------------------------------------------------
+
+    def __rshift__(self, attr):
+        """ Compile and connect from the expression to the attribute.
+
+            Example:
+                with lazy():
+                    node1.a.sx + node1.a.sy + 1 >> node2.a.sy
+        """
+        self.connect(attr)
+
+    def connect(self, attr):
+        """ Compile the expression and drive the given attribute with it,
+        an expression that folded to a constant sets the value instead.
+
+            Example:
+                expression.connect(cube.a.rx)
+        """
+        output = self.compile()
+        if isConstant(output):
+            if attr.isParent:
+                attr.set(output, output, output)
+            else:
+                attr.set(output)
+            return output
+
+        output.connect(attr)
+        return output
+
+    @property
+    def node(self):
+        """ The node giving the result, compiling the expression if needed."""
+        return self._compiledPlug().node
+
+    def compile(self):
+        """ Build the minimal node network for this expression.
+
+            Returns:
+                Attribute/float: The output attribute or the value if everything folded to a constant.
+        """
+        if self._output is None:
+            self._output = _emit(simplify(self))
+
+        return self._output
+
+    def _compiledPlug(self):
+        output = self.compile()
+        if isConstant(output):
+            raise ValueError(">>> The expression folded to the constant {}, there is no node to use".format(output))
+        return output
+
+    # -------------------------------------------------------------------------------------------------
+
+    @property
+    def isCompound(self):
+        """ Whether any plug in the expression is a parent attribute like translate."""
+        if self.operation == PLUG:
+            return self.operands.isParent
+        if self.operation == CONSTANT:
+            return False
+        if self.operation == POWER:
+            return any(operand.isCompound for operand in self.operands)
+
+        return any(operand.isCompound for sign, operand in self.operands)
+
+    @property
+    def firstPlug(self):
+        """ The first attribute of the expression, used to name the new nodes."""
+        if self.operation == PLUG:
+            return self.operands
+        if self.operation == CONSTANT:
+            return None
+
+        operands = self.operands if self.operation == POWER else [operand for sign, operand in self.operands]
+        for operand in operands:
+            plug = operand.firstPlug
+            if plug is not None:
+                return plug
+
+
+def _attributeFromPath(path):
+    """The Attribute of a "node.attr" path, the way the eager operators connect from it."""
+    from modules.nodel import graph
+    from modules.utils import open_maya_api
+
+    try:
+        return graph.wrapPlug(open_maya_api.toMPlug(path))
+    except RuntimeError:
+        raise ValueError(">>> Cannot use {!r} in an attribute expression, the attribute does not exist".format(path))
+
+
+# -------------------------------------------------------------------------------------------------
+
+def simplify(expression):
+    """Return a new tree with constants folded, nested sums and products flattened
+    and branches that cannot change the result removed, e.g. x * 0, x + 0, x ** 1.
+
+        Args:
+            expression(Expression): The tree to simplify.
+
+        Returns:
+            Expression: The simplified tree, compiled branches become plug leaves.
+    """
+    if expression._output is not None:
+        return Expression.wrap(expression._output)
+
+    if expression.operation in (CONSTANT, PLUG):
+        return expression
+
+    if expression.operation == SUM:
+        return _simplifySum(expression)
+
+    if expression.operation == PRODUCT:
+        return _simplifyProduct(expression)
+
+    base, exponent = [simplify(operand) for operand in expression.operands]
+    if exponent.operation == CONSTANT:
+        if exponent.operands == 0:
+            return Expression(CONSTANT, 1)
+        if exponent.operands == 1:
+            return base
+        if base.operation == CONSTANT:
+            return Expression(CONSTANT, base.operands ** exponent.operands)
+    if base.operation == CONSTANT and base.operands == 1:
+        return Expression(CONSTANT, 1)
+
+    return Expression(POWER, [base, exponent])
+
+
+def _simplifySum(expression):
+    constant = 0
+    terms = []
+
+    for sign, operand in _flatten(expression, SUM, 1):
+        if operand.operation == CONSTANT:
+            constant += sign * operand.operands
+        else:
+            terms.append((sign, operand))
+
+    if not terms:
+        return Expression(CONSTANT, constant)
+
+    if constant:
+        terms.append((1, Expression(CONSTANT, constant)))
+
+    if len(terms) == 1 and terms[0][0] == 1:
+        return terms[0][1]
+
+    return Expression(SUM, terms)
+
+
+def _simplifyProduct(expression):
+    constant = 1
+    factors = []
+
+    for exponent, operand in _flatten(expression, PRODUCT, 1):
+        if operand.operation == CONSTANT:
+            if exponent < 0 and operand.operands == 0:
+                raise ValueError(">>> Division by zero in the attribute expression")
+            constant *= operand.operands ** exponent
+        else:
+            factors.append((exponent, operand))
+
+    # Anything multiplied by zero is a dead branch
+    if not factors or constant == 0:
+        return Expression(CONSTANT, constant)
+
+    if constant != 1:
+        factors.append((1, Expression(CONSTANT, constant)))
+
+    if len(factors) == 1 and factors[0][0] == 1:
+        return factors[0][1]
+
+    return Expression(PRODUCT, factors)
+
+
+def _flatten(expression, operation, sign):
+    """Yield the (sign, operand) pairs of nested sums or products as one n-ary list."""
+    for operandSign, operand in expression.operands:
+        operand = simplify(operand)
+        if operand.operation == operation:
+            for pair in _flatten(operand, operation, sign * operandSign):
+                yield pair
+        else:
+            yield sign * operandSign, operand
+
+
+# -------------------------------------------------------------------------------------------------
+
+def _emit(expression):
+    """Create the nodes of a simplified tree and return its output attribute or constant."""
+    if expression.operation == CONSTANT:
+        return expression.operands
+    if expression.operation == PLUG:
+        return expression.operands
+
+    compound = expression.isCompound
+    for operand in _operandsOf(expression):
+        if compound and operand.operation != CONSTANT and not operand.isCompound:
+            raise ValueError(">>> Cannot mix parent attributes like translate with child attributes like "
+                             "translateX in one expression: {}".format(operand.firstPlug))
+
+    if expression.operation == SUM:
+        return _emitSum(expression, compound)
+    if expression.operation == PRODUCT:
+        return _emitProduct(expression, compound)
+
+    base, exponent = [_emit(operand) for operand in expression.operands]
+    return _emitBinary(expression, "power", base, exponent, compound)
+
+
+def _operandsOf(expression):
+    if expression.operation == POWER:
+        return expression.operands
+    return [operand for sign, operand in expression.operands]
+
+
+def _mathNode(expression, label, nodeType, operationType, inputs, outputAttr, compound, commutative=False):
+    """Create a uniquely named math node, named after the first plug of the expression,
+    and feed it its inputs. An identical node made earlier in a CSE session is reused instead.
+
+        Args:
+            expression(Expression): The expression the node is made for.
+            label(str): The operation part of the node name.
+            nodeType(str): The type of node to make.
+            operationType(int): The operation to set, None for nodes without one.
+            inputs(list): The (attribute name, value) pairs to connect or set.
+            outputAttr(str): The attribute giving the result.
+            compound(bool): Whether the inputs are parent attributes.
+            commutative(bool): Whether the order of the inputs does not matter.
+
+        Returns:
+            Attribute: The output attribute.
+    """
+    from modules.nodel import Dep_Node
+
+    output = expression_cache.lookup(nodeType, operationType, inputs, commutative)
+    if output is not None:
+        return output
+
+    plug = expression.firstPlug
+    nodeName = plug.createNodeName(label, nodeType) if plug is not None else nodeType
+    node = Dep_Node(cmds.createNode(nodeType, n=nodeName, skipSelect=True))
+
+    if operationType is not None:
+        node.a.operation.set(operationType)
+
+    for name, value in inputs:
+        _setInput(node.a[name], value, compound)
+
+    output = node.a[outputAttr]
+    expression_cache.store(nodeType, operationType, inputs, output, commutative)
+    return output
+
+
+def _setInput(attr, value, compound):
+    """Connect an attribute or set a constant on the input of a new node."""
+    if isConstant(value):
+        if compound:
+            attr.set(value, value, value)
+        else:
+            attr.set(value)
+    else:
+        attr << value
+
+
+def _emitSum(expression, compound):
+    attribute = "input3D" if compound else "input1D"
+    outputAttr = "output3D" if compound else "output1D"
+
+    added, subtracted = [], []
+    for sign, operand in expression.operands:
+        value = _emit(operand)
+        if isConstant(value) and value < 0:
+            sign, value = -sign, -value
+        (added if sign > 0 else subtracted).append(value)
+
+    # A chain of two input nodes can beat one plusMinusAverage for short scalar sums
+    if not compound and added and node_cost.isCheapest():
+        steps = [("add", value) for value in added[1:]] + [("subtract", value) for value in subtracted]
+        chain = [node_cost.select(operation, False, isConstant(value)) for operation, value in steps]
+        arrayCost = node_cost.COSTS["plusMinusAverage"] * (2 if len(added) > 1 and subtracted else 1)
+
+        if sum(spec.cost for spec in chain) < arrayCost:
+            result = added[0]
+            for (operation, value), spec in zip(steps, chain):
+                result = _emitBinary(expression, operation, result, value, compound, spec)
+            return result
+
+    # plusMinusAverage subtracts every input from the first, so the added terms need their own sum
+    if len(added) > 1 and subtracted:
+        added = [_emitPlusMinusAverage(expression, 1, added, attribute, outputAttr, compound)]
+
+    if not subtracted:
+        return _emitPlusMinusAverage(expression, 1, added, attribute, outputAttr, compound)
+
+    return _emitPlusMinusAverage(expression, 2, (added or [0]) + subtracted, attribute, outputAttr, compound)
+
+
+def _emitPlusMinusAverage(expression, operationType, values, attribute, outputAttr, compound):
+    label = "sum" if operationType == 1 else "sub"
+    inputs = [("{0}[{1}]".format(attribute, index), value) for index, value in enumerate(values)]
+
+    return _mathNode(expression, label, "plusMinusAverage", operationType, inputs, outputAttr, compound,
+                     commutative=operationType == 1)
+
+
+def _emitProduct(expression, compound):
+    numerators, denominators = [], []
+    for exponent, operand in expression.operands:
+        (numerators if exponent > 0 else denominators).append(_emit(operand))
+
+    numerator = _multiplyAll(expression, numerators, compound)
+    if not denominators:
+        return numerator
+
+    denominator = _multiplyAll(expression, denominators, compound)
+    return _emitBinary(expression, "divide", numerator, denominator, compound)
+
+
+def _multiplyAll(expression, values, compound):
+    """Chain the values through two input multiply nodes, constants are folded so there is at most one."""
+    values = sorted(values, key=isConstant)
+    if not values:
+        return 1
+
+    result = values[0]
+    for value in values[1:]:
+        result = _emitBinary(expression, "multiply", result, value, compound)
+
+    return result
+
+
+_LABELS = {"add": "sum", "subtract": "sub", "multiply": "mult", "divide": "div", "power": "pow"}
+
+
+def _emitBinary(expression, operation, input1, input2, compound, spec=None):
+    """Make the node node_cost picks for a two operand operation."""
+    spec = spec or node_cost.pick(operation, compound, isConstant(input2))
+    if isConstant(input2) and spec.constant:
+        input2 = spec.constant(input2)
+
+    inputs = [(spec.inputs[0], input1), (spec.inputs[1], input2)]
+    return _mathNode(expression, _LABELS[operation], spec.nodeType, spec.operationType, inputs, spec.output,
+                     compound, commutative=spec.commutative)
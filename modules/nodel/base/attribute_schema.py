@@ -0,0 +1,126 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: A process-wide cache of attribute layouts (multi, compound children, parent),
+        static attributes are shared per node type, dynamic ones are held per node.
+"""
+
+import re
+
+import maya.OpenMaya as om
+
+# (nodeType, attr) -> Attribute_Schema
+_static = {}
+
+# hashCode -> (MObjectHandle, {attr: Attribute_Schema})
+_dynamic = {}
+
+_INDICES = re.compile(r"\[[^\]]*\]")
+
+
+class Attribute_Schema(object):
+    """The facts about an attribute that never change for a node type.
+
+        Args:
+            plug(MPlug): Any plug of the attribute.
+
+        Example:
+
+            schema = Attribute_Schema(sphere.a.rotate.plug)
+            print(schema.children)
+            Output: ('rotateX', 'rotateY', 'rotateZ')
+    """
+
+    __slots__ = ("name", "shortName", "multi", "indexMatters", "children", "parent", "apiType", "dynamic")
+
+    def __init__(self, plug):
+        attr = plug.attribute()
+        fnAttr = om.MFnAttribute(attr)
+
+        self.name = fnAttr.name()
+        self.shortName = fnAttr.shortName()
+        self.multi = fnAttr.isArray()
+        self.indexMatters = fnAttr.indexMatters()
+        self.apiType = attr.apiTypeStr()
+        self.dynamic = fnAttr.isDynamic()
+
+        self.children = ()
+        if attr.hasFn(om.MFn.kCompoundAttribute):
+            fnCompound = om.MFnCompoundAttribute(attr)
+            self.children = tuple(om.MFnAttribute(fnCompound.child(i)).name()
+                                  for i in range(fnCompound.numChildren()))
+
+        parent = fnAttr.parent()
+        self.parent = None if parent.isNull() else om.MFnAttribute(parent).name()
+
+    def __repr__(self):
+        return "{cls}('{name}')".format(cls=self.__class__.__name__, name=self.name)
+
+
+# -------------------------------------------------------------------------------------------------
+
+def schemaKey(attr):
+    """Strip the multi indices so every element shares one entry, "input3D[0].input3Dx" -> "input3D.input3Dx"."""
+    return _INDICES.sub("", attr)
+
+
+def get(attribute):
+    """Return the schema of an Attribute, only asking Maya the first time a layout is seen.
+
+        Args:
+            attribute(Attribute): The attribute to look up.
+
+        Returns:
+            Attribute_Schema: The schema or None if the attribute does not exist.
+
+        Example:
+            print(get(sphere.a.rx).parent)
+            Output: rotate
+    """
+    node = attribute.node
+    handle = node.handle
+    if handle is None or not handle.isValid():
+        return None
+
+    key = schemaKey(attribute.attr)
+    hashCode = handle.hashCode()
+
+    nodeSchemas = _dynamic.get(hashCode)
+    if nodeSchemas:
+        storedHandle, schemas = nodeSchemas
+        if storedHandle.isValid() and storedHandle.object() == handle.object():
+            # Dynamic attributes can be deleted without going through our wrappers
+            if key in schemas:
+                if node.dep.hasAttribute(schemas[key].name):
+                    return schemas[key]
+                del schemas[key]
+        else:
+            del _dynamic[hashCode]
+
+    typeKey = (node.dep.typeName(), key)
+    schema = _static.get(typeKey)
+    if schema:
+        return schema
+
+    plug = attribute.plug
+    if plug is None:
+        return None
+
+    schema = Attribute_Schema(plug)
+    if schema.dynamic:
+        _dynamic.setdefault(hashCode, (om.MObjectHandle(handle.object()), {}))[1][key] = schema
+    else:
+        _static[typeKey] = schema
+
+    return schema
+
+
+def forgetNode(handle):
+    """Drop the dynamic attribute schemas of a node after its attributes changed."""
+    if handle is not None:
+        _dynamic.pop(handle.hashCode(), None)
+
+
+def clear():
+    _static.clear()
+    _dynamic.clear()
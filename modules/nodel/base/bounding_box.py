@@ -0,0 +1,117 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: An immutable bounding box, queried once and read as often as we like
+"""
+
+
+class Bounding_Box(object):
+    """A bounding box value, laid out like the xform query so it still indexes as
+    [minX, minY, minZ, maxX, maxY, maxZ].
+
+        Args:
+            values(list): The six values of the box.
+
+        Example:
+
+            box = cube.o.boundingBox
+            print(box.size, box.centre)
+            Output: (1.0, 2.0, 3.0) (0.0, 0.0, 0.0)
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values):
+        values = tuple(float(i) for i in values)
+        if len(values) != 6:
+            raise ValueError(">>> A bounding box needs 6 values, got {}".format(len(values)))
+
+        object.__setattr__(self, "_values", values)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(">>> {} is immutable".format(self.__class__.__name__))
+
+    def __repr__(self):
+        return "{0}(min={1}, max={2})".format(self.__class__.__name__, self.min, self.max)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return 6
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def __eq__(self, other):
+        if isinstance(other, Bounding_Box):
+            return self._values == other._values
+        if isinstance(other, (list, tuple)):
+            return self._values == tuple(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash(self._values)
+
+    # -------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def fromMinMax(cls, minimum, maximum):
+        return cls(tuple(minimum) + tuple(maximum))
+
+    @property
+    def min(self):
+        return self._values[:3]
+
+    @property
+    def max(self):
+        return self._values[3:]
+
+    @property
+    def size(self):
+        """ The (width, height, depth) of the box."""
+        return tuple(high - low for low, high in zip(self.min, self.max))
+
+    @property
+    def width(self):
+        return self.size[0]
+
+    @property
+    def height(self):
+        return self.size[1]
+
+    @property
+    def depth(self):
+        return self.size[2]
+
+    @property
+    def centre(self):
+        return tuple((low + high) / 2 for low, high in zip(self.min, self.max))
+
+    @property
+    def center(self):
+        return self.centre
+
+    @property
+    def volume(self):
+        width, height, depth = self.size
+        return width * height * depth
+
+    # -------------------------------------------------------------------------------------------------
+
+    def contains(self, point):
+        """ Whether a point lies within the box, its surface included."""
+        return all(low <= value <= high for low, value, high in zip(self.min, point, self.max))
+
+    def union(self, other):
+        """ A new box holding both boxes.
+
+            Example:
+                box = reduce(Bounding_Box.union, [i.o.boundingBox for i in meshes])
+        """
+        return Bounding_Box.fromMinMax([min(a, b) for a, b in zip(self.min, other.min)],
+                                       [max(a, b) for a, b in zip(self.max, other.max)])
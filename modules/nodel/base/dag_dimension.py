@@ -4,13 +4,20 @@ Created:2023
 About: Our objects dimensions functionality
 """
 
+import math
+
 import maya.cmds as cmds
+import maya.OpenMaya as om
 
+from modules.nodel.base.bounding_box import Bounding_Box
+from modules.utils import open_maya_api
 from modules.utils.math import getDistanceBetween
 
 
 class Object_Dimension(object):
 
+    __slots__ = ("_node",)
+
     def __init__(self, node):
         self._node = node
 
@@ -30,21 +37,30 @@ class Object_Dimension(object):
         """
         return cmds.xform(self._node, q=1, bbi=1)
 
+    @property
+    def boundingBox(self):
+        """ The xform bounding box queried once.
+
+            Returns:
+                Bounding_Box: Indexes like xformBoundingBox.
+        """
+        return Bounding_Box(self.xformBoundingBox)
+
     @property
     def bb(self):
-        return self.xformBoundingBox
+        return self.boundingBox
 
     @property
     def width(self):
-        return self.bb[3] - self.bb[0]
+        return self.bb.width
 
     @property
     def height(self):
-        return self.bb[4] - self.bb[1]
+        return self.bb.height
 
     @property
     def depth(self):
-        return self.bb[5] - self.bb[2]
+        return self.bb.depth
 
     @property
     def centre(self):
@@ -53,11 +69,7 @@ class Object_Dimension(object):
             Returns:
                 Output: [x, y, z]
         """
-        return [
-            (self.bb[3] + self.bb[0]) / 2,
-            (self.bb[4] + self.bb[1]) / 2,
-            (self.bb[5] + self.bb[2]) / 2,
-        ]
+        return list(self.bb.centre)
 
     @property
     def center(self):
@@ -65,16 +77,46 @@ class Object_Dimension(object):
 
     @property
     def position(self):
-        """Position will return the world space translate and rotate pivot of the object"""
-        from modules.nodel import Dag_Node as Dag
-        tempDag = Dag(cmds.group(em=1, w=1))
-        tempDag.moveTo(self._node)
+        """Position will return the world space rotate pivot and the world rotation of the object,
+        read from its world matrix.
 
-        position = [float(format(i, 'f'))
-                    for i in cmds.xform(tempDag, ws=1, t=1, q=1) + cmds.xform(tempDag, ws=1, ro=1, q=1)]
-        tempDag.delete()
+            Returns:
+                Output: [tx, ty, tz, rx, ry, rz]
+        """
+        return _worldPosition(self._dagPath())
 
-        return position
+    @property
+    def rotation(self):
+        """ The world rotation of the object in degrees, xyz rotate order.
+
+            Returns:
+                Output: [rx, ry, rz]
+        """
+        return self.position[3:]
+
+    @property
+    def scale(self):
+        """ The world scale of the object, a negative determinant flips x.
+
+            Returns:
+                Output: [sx, sy, sz]
+        """
+        matrix = self._dagPath().inclusiveMatrix()
+        scale = [om.MVector(matrix(i, 0), matrix(i, 1), matrix(i, 2)).length() for i in range(3)]
+        if matrix.det3x3() < 0:
+            scale[0] = -scale[0]
+
+        return [_round(i) for i in scale]
+
+    def _dagPath(self):
+        dag = getattr(self._node, "dag", None)
+        if dag is not None:
+            return dag
+
+        path = open_maya_api.toMDagPaths([self._node])[0]
+        if path is None:
+            raise ValueError(">>> {} is not a dag node and has no world position".format(self._node))
+        return path
 
     @property
     def pivot(self):
@@ -125,3 +167,85 @@ class Object_Dimension(object):
         """
         distance = getDistanceBetween(str(self._node), str(item))
         return distance
+
+
+# -------------------------------------------------------------------------------------------------
+
+def _round(value):
+    return float(format(value, 'f'))
+
+
+def _worldPosition(path):
+    """The world rotate pivot and xyz rotation of a dag path, what matching a group to it gives."""
+    matrix = path.inclusiveMatrix()
+    transformation = om.MTransformationMatrix(matrix)
+
+    if path.hasFn(om.MFn.kTransform):
+        translate = om.MFnTransform(path).rotatePivot(om.MSpace.kWorld)
+    else:
+        translate = transformation.getTranslation(om.MSpace.kWorld)
+
+    rotation = transformation.eulerRotation()
+    rotation.reorderIt(om.MEulerRotation.kXYZ)
+
+    return [_round(i) for i in (translate.x, translate.y, translate.z,
+                                math.degrees(rotation.x), math.degrees(rotation.y), math.degrees(rotation.z))]
+
+
+def positions(nodes):
+    """The world positions of many nodes at once, resolved through one selection list.
+
+        Args:
+            nodes(list): The dag nodes.
+
+        Returns:
+            numpy.ndarray: Shape (N, 6), the rotate pivot and rotation of each node like Object_Dimension.position.
+
+        Example:
+            print(positions(spineJoints)[:, :3])
+            Output: [[0. 98.2 0.4] [0. 104.9 0.1] ...]
+    """
+    import numpy as np
+
+    nodes = list(nodes)
+    result = np.zeros((len(nodes), 6), dtype=np.float64)
+    for i, (node, path) in enumerate(zip(nodes, open_maya_api.toMDagPaths(nodes))):
+        if path is None:
+            raise ValueError(">>> {} is not an existing dag node and has no world position".format(node))
+        result[i] = _worldPosition(path)
+
+    return result
+
+
+def bounds(nodes, worldSpace=True):
+    """The bounding boxes of many dag nodes at once through MFnDagNode.boundingBox,
+    children included for transforms.
+
+        Args:
+            nodes(list): The dag nodes.
+            worldSpace(bool): Move the boxes into world space, otherwise keep them in object space.
+
+        Returns:
+            numpy.ndarray: Shape (N, 6), [minX, minY, minZ, maxX, maxY, maxZ] for each node.
+
+        Example:
+            boxes = bounds(meshes)
+            print(boxes[:, 3:] - boxes[:, :3])
+            Output: [[2. 2. 2.] [1. 2. 3.]]
+    """
+    import numpy as np
+
+    nodes = list(nodes)
+    result = np.zeros((len(nodes), 6), dtype=np.float64)
+    for i, (node, path) in enumerate(zip(nodes, open_maya_api.toMDagPaths(nodes))):
+        if path is None:
+            raise ValueError(">>> {} is not an existing dag node and has no bounding box".format(node))
+
+        box = om.MFnDagNode(path).boundingBox()
+        if worldSpace:
+            box.transformUsing(path.inclusiveMatrix())
+
+        low, high = box.min(), box.max()
+        result[i] = (low.x, low.y, low.z, high.x, high.y, high.z)
+
+    return result
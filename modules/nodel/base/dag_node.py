@@ -6,11 +6,52 @@ About: Our Dag Node functionality to deal with Maya
 """
 
 import maya.cmds as cmds
+import maya.OpenMaya as om
+from modules import six
 from modules.nodel import Dep_Node
-from modules.utils import open_maya_api, colour
+from modules.utils import colour
 from modules.common import matchMove, createOffset
 
 
+def _childPaths(dag, shapes=False):
+    """Yield the paths of the direct children of a path, either the shapes or everything else.
+    Intermediate objects are left out, like listRelatives(ni=True)."""
+    fnDag = om.MFnDagNode(dag)
+    for i in range(fnDag.childCount()):
+        child = fnDag.child(i)
+        if child.hasFn(om.MFn.kShape) != shapes or om.MFnDagNode(child).isIntermediateObject():
+            continue
+
+        # Copy as push changes the path in place
+        childPath = om.MDagPath(dag)
+        childPath.push(child)
+        yield childPath
+
+
+def _ownPath(node, entry):
+    """A path of our own for a wrapper, the one it was given so every instance of an
+    instanced node keeps its own, a copy of the registry's path otherwise."""
+    if entry.dag is None:
+        return None
+
+    if isinstance(node, om.MDagPath):
+        return om.MDagPath(node)
+
+    dag = getattr(node, "dag", None)
+    if isinstance(dag, om.MDagPath) and dag.isValid():
+        return om.MDagPath(dag)
+
+    # A name may pick an instance other than the first one
+    if entry.dag.isInstanced() and isinstance(node, six.string_types):
+        selectionList = om.MSelectionList()
+        selectionList.add(node)
+        path = om.MDagPath()
+        selectionList.getDagPath(0, path)
+        return path
+
+    return om.MDagPath(entry.dag)
+
+
 class Dag_Node(Dep_Node):
     """Class based way of calling all the information that we need to
     deal with in the Maya node with dependency in a clean Python way.
@@ -26,6 +67,8 @@ class Dag_Node(Dep_Node):
             print(dag.fullPath)
     """
 
+    __slots__ = ("_dag",)
+
     def __init__(self, node, nodeType=None):
         self._dag = None
 
@@ -43,12 +86,14 @@ class Dag_Node(Dep_Node):
 
     @node.setter
     def node(self, node):
-        self._dag = node
+        self._dag = None
 
-        if not Dep_Node.node.fset(self, node):
-            return False
+        entry = Dep_Node.node.fset(self, node)
+        if not entry:
+            return None
 
-        self._dag = open_maya_api.toMDagPath(self.node)
+        self._dag = _ownPath(node, entry)
+        return entry
 
     # -------------------------------------------------------------------------------------------------
 
@@ -71,14 +116,88 @@ class Dag_Node(Dep_Node):
         else:
             return Dep_Node.fullPath.fget(self)
 
+    # -------------------------------------------------------------------------------------------------
+    def _childPaths(self, shapes=False):
+        """Yield the paths of the direct children, either the shapes or everything else."""
+        if self.dag:
+            for path in _childPaths(self.dag, shapes):
+                yield path
+
+    def _parentPaths(self):
+        """Yield the path of every ancestor, closest first, by popping a copy of our path."""
+        if not self.dag:
+            return
+
+        path = om.MDagPath(self.dag)
+        while path.length() > 1:
+            path.pop()
+            yield om.MDagPath(path)
+
+    def _descendantPaths(self, type=None, depthFirst=True):
+        """Yield the paths below this node walking MItDag, the node itself excluded."""
+        if not self.dag:
+            return
+
+        traversal = om.MItDag.kDepthFirst if depthFirst else om.MItDag.kBreadthFirst
+        dagIt = om.MItDag(traversal, om.MFn.kInvalid)
+        dagIt.reset(self.dag, traversal, om.MFn.kInvalid)
+        dagIt.next()
+
+        while not dagIt.isDone():
+            path = om.MDagPath()
+            dagIt.getPath(path)
+            dagIt.next()
+
+            fnDag = om.MFnDagNode(path)
+            if fnDag.isIntermediateObject():
+                continue
+
+            if type is not None:
+                if isinstance(type, int) and not path.hasFn(type):
+                    continue
+                if not isinstance(type, int) and fnDag.typeName() != type:
+                    continue
+
+            yield path
+
+    def iterShapes(self):
+        """Lazily yield the shapes of this node.
+
+            Example:
+                for shape in dag.iterShapes():
+                    print(shape.type)
+        """
+        for path in self._childPaths(shapes=True):
+            yield Dag_Node(path)
+
+    def iterChildren(self):
+        """Lazily yield the direct children of this node, shapes excluded.
+
+            Example:
+                for child in dag.iterChildren():
+                    print(child.name)
+        """
+        for path in self._childPaths():
+            yield Dag_Node(path)
+
+    def iterDescendants(self, type=None, depthFirst=True):
+        """Lazily yield everything below this node, shapes included, nodes are only wrapped when consumed.
+
+            Args:
+                type(str/int): Only yield this node type, a type name or an om.MFn type.(optional)
+                depthFirst(bool): Walk depth first, breadth first otherwise.
+
+            Example:
+                for joint in dag.iterDescendants(type="joint"):
+                    print(joint.name)
+        """
+        for path in self._descendantPaths(type, depthFirst):
+            yield Dag_Node(path)
+
     # -------------------------------------------------------------------------------------------------
     @property
     def shapes(self):
-        shapes = []
-        for shape in cmds.listRelatives(self.fullPath, s=True, f=True, ni=True) or []:
-            shapes.append(Dag_Node(shape))
-
-        return shapes
+        return list(self.iterShapes())
 
     @property
     def shape(self):
@@ -88,45 +207,96 @@ class Dag_Node(Dep_Node):
     # -------------------------------------------------------------------------------------------------
     @property
     def children(self):
-        shapes = self.shapes
-        children = []
-        for child in cmds.listRelatives(self.fullPath, c=True, f=True, ni=True) or []:
-            if child not in shapes:
-                children.append(Dag_Node(child))
-
-        return children
+        return list(self.iterChildren())
 
     @property
     def allChildren(self):
-        allChildren = []
-        for child in cmds.listRelatives(self.fullPath, ad=True, f=True, ni=True) or []:
-            allChildren.append(Dag_Node(child))
-        return allChildren
+        return Dag_Node.fromNames(cmds.listRelatives(self.fullPath, ad=True, f=True, ni=True) or [])
 
     @property
     def parent(self):
-        parent = cmds.listRelatives(self.fullPath, p=True, f=True)
-        if parent:
-            return Dag_Node(parent[0])
+        for path in self._parentPaths():
+            return Dag_Node(path)
+
+    def iterParents(self):
+        """Lazily yield the ancestors of this node, closest first.
+
+            Example:
+                for parent in dag.iterParents():
+                    print(parent.name)
+        """
+        for path in self._parentPaths():
+            yield Dag_Node(path)
 
     @property
     def allParents(self):
-        parents = []
-        parent = self.parent
-        while parent:
-            parents.append(parent)
-            parent = parent.parent
+        return list(self.iterParents())
+
+    @property
+    def depth(self):
+        """The number of ancestors above this node, 0 for nodes under the world."""
+        return self.dag.length() - 1 if self.dag else 0
+
+    def isDescendantOf(self, item):
+        """Check whether this node sits anywhere below the given one.
+
+            Example:
+                print(Dag_Node("L_hand_JNT").isDescendantOf("BASE_GRP"))
+                Output: True
+        """
+        other = item if isinstance(item, Dag_Node) else Dag_Node(item)
+        if not self.dag or not other.dag or self.dag.length() <= other.dag.length():
+            return False
+
+        path = om.MDagPath(self.dag)
+        while path.length() > other.dag.length():
+            path.pop()
+
+        return path.node() == other.dag.node()
 
-        return parents
+    def commonAncestor(self, item):
+        """Return the closest node both this and the given node sit under, None if only the world.
+
+            Example:
+                print(Dag_Node("L_hand_JNT").commonAncestor("R_hand_JNT"))
+                Output: |BASE_GRP|SUB_GRP
+        """
+        other = item if isinstance(item, Dag_Node) else Dag_Node(item)
+        if not self.dag or not other.dag:
+            return None
+
+        path = om.MDagPath(self.dag)
+        otherPath = om.MDagPath(other.dag)
+        while path.length() > otherPath.length():
+            path.pop()
+        while otherPath.length() > path.length():
+            otherPath.pop()
+
+        while path.length() and not path.node() == otherPath.node():
+            path.pop()
+            otherPath.pop()
+
+        return Dag_Node(path) if path.length() else None
 
     # -------------------------------------------------------------------------------------------------
 
     @property
     def order(self):
-        return self.parent.children.index(self)
+        """The index of this node among its siblings, shapes excluded."""
+        if not self.dag:
+            return None
+
+        parentPath = om.MDagPath(self.dag)
+        parentPath.pop()
+
+        node = self.dag.node()
+        for index, path in enumerate(_childPaths(parentPath)):
+            if path.node() == node:
+                return index
 
     def reorder(self, index):
-        cmds.reorder(self.name, r=index)
+        # The API has no reorder, but the full path keeps non unique names working
+        cmds.reorder(self.fullPath, r=index)
 
     # -------------------------------------------------------------------------------------------------
 
@@ -243,7 +413,7 @@ class Dag_Node(Dep_Node):
     @property
     def history(self):
         if self.exists():
-            history = [Dag_Node(i) for i in cmds.listHistory(self.fullPath)]
+            history = Dag_Node.fromNames(cmds.listHistory(self.fullPath) or [])
             return history
         return []
 
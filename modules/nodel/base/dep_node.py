@@ -13,6 +13,8 @@ from modules.nodel.base.attribute_base import Attributes
 
 from modules.nodel.base.dag_dimension import Object_Dimension
 
+from modules.nodel.base import node_registry
+
 
 class Dep_Node(object):
     """Class based way of calling all the information that we need to
@@ -29,8 +31,13 @@ class Dep_Node(object):
             dep.delete()
     """
 
+    __slots__ = ("_node", "_dep", "_handle", "_attrs", "_hash")
+
     def __init__(self, node, nodeType=None):
         self._dep = None
+        self._handle = None
+        self._attrs = None
+        self._hash = None
         self.node = node
 
         # Create on initiate if nodeType is passed
@@ -53,14 +60,48 @@ class Dep_Node(object):
         )
 
     def __eq__(self, other):
-        if isinstance(other, self.__class__):
-            return self.fullPath == other.fullPath
+        if isinstance(other, Dep_Node):
+            # Same MObject means same node, whatever it is called or wherever it is parented now
+            if self.handle is not None and other.handle is not None:
+                return self.handle.isValid() and other.handle.isValid() and \
+                    self.handle.object() == other.handle.object()
+            return self.fullPath is not None and self.fullPath == other.fullPath
         elif self.fullPath == other:
             return True
         elif self.path == other:
             return True
         return False
 
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        """Hash on the node itself so wrappers work as set members and dict keys. The hash follows
+        the node equality compares, it is taken whenever the wrapper is pointed at a node and kept
+        when the node is renamed or deleted, so neither moves a wrapper within a set.
+        A name only compares equal to a wrapper, it does not hash like one,
+        so never mix names and wrappers in one set or as keys of one dict."""
+        if self._hash is None:
+            self._hash = hash(self._node)
+        return self._hash
+
+    @classmethod
+    def fromNames(cls, names):
+        """Wrap many nodes at once, resolving them through a single selection list.
+
+            Args:
+                names(list): The names of the nodes.
+
+            Returns:
+                list: The wrapped nodes.
+
+            Example:
+                joints = Dep_Node.fromNames(cmds.ls(type="joint"))
+        """
+        names = list(names)
+        node_registry.resolveMany(names)
+        return [cls(name) for name in names]
+
     # -------------------------------------------------------------------------------------------------
 
     @property
@@ -70,13 +111,20 @@ class Dep_Node(object):
     @node.setter
     def node(self, node):
         self._dep = None
-        self._node = str(node) if node is not None else None
+        self._handle = None
+        self._attrs = None
+        self._hash = None
+        self._node = open_maya_api.toName(node) if node is not None else None
 
-        if not self.node or not cmds.objExists(self.node):
-            return False
+        # Previously resolved nodes come back from the registry without touching Maya
+        entry = node_registry.resolve(node)
+        if not entry:
+            return None
 
-        self._dep = open_maya_api.toDependencyNode(self.node)
-        return True
+        self._dep = entry.dep
+        self._handle = entry.handle
+        self._hash = entry.handle.hashCode()
+        return entry
 
     # -------------------------------------------------------------------------------------------------
 
@@ -84,11 +132,18 @@ class Dep_Node(object):
     def dep(self):
         return self._dep
 
+    @property
+    def handle(self):
+        return self._handle
+
     # -------------------------------------------------------------------------------------------------
 
     @property
     def a(self):
-        return Attributes(self)
+        # Keep handing back the same Attributes, and with it its cached Attribute objects
+        if self._attrs is None or self._handle is None or not self._handle.isValid():
+            self._attrs = Attributes(self)
+        return self._attrs
 
     @property
     def o(self):
@@ -141,6 +196,7 @@ class Dep_Node(object):
 
     def rename(self, name):
         cmds.rename(self, name)
+        self._attrs = None
         return self
 
     def lock(self, state=True):
@@ -154,7 +210,13 @@ class Dep_Node(object):
     def delete(self):
         if self.fullPath and cmds.objExists(self.fullPath):
             cmds.delete(self.fullPath)
+
+        if self._handle is not None:
+            node_registry.evict(self._handle.hashCode())
+
         self._dep = None
+        self._handle = None
+        self._attrs = None
 
     def create(self, nodeType):
         if self.fullPath:
@@ -0,0 +1,243 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: A build session table of the math nodes made by the Attribute operators,
+        an identical computation reuses the existing node instead of making a new one.
+"""
+
+import contextlib
+
+import maya.cmds as cmds
+
+from modules import six
+
+# Nesting depth of the cseSession() blocks we are in
+_sessionDepth = 0
+
+# (nodeType, operationType, inputs) -> Cse_Entry
+_entries = {}
+
+# hashCode of the node -> key in _entries
+_keys = {}
+
+_stats = {"created": 0, "reused": 0}
+
+
+class Cse_Entry(object):
+    """A math node made during the session, with what it looked like when it was made.
+
+        Args:
+            output(Attribute): The output attribute handed out for the computation.
+            inputs(list): The (attribute name, value) pairs the node was made with.
+            commutative(bool): Whether the key sorted the inputs.
+    """
+
+    __slots__ = ("output", "constants", "connections", "sources", "hits")
+
+    def __init__(self, output, inputs, commutative=False):
+        self.output = output
+        self.constants = [(name, value) for name, value in inputs if _isValue(value)]
+        self.connections = _inputConnections(output.node)
+        self.sources = _sourceHandles(inputs, commutative)
+        self.hits = 0
+
+    def isSameSource(self, inputs, commutative=False):
+        """Check the plugs of a lookup are on the very nodes we were made from, hash codes can collide."""
+        handles = _sourceHandles(inputs, commutative)
+        if len(handles) != len(self.sources):
+            return False
+
+        for handle, source in zip(handles, self.sources):
+            if (handle is None) != (source is None):
+                return False
+            if handle is not None and not handle.object() == source.object():
+                return False
+
+        return True
+
+    def isValid(self):
+        """Check the node still exists and nobody rewired or re-set its inputs since."""
+        node = self.output.node
+        if not node.exists() or _inputConnections(node) != self.connections:
+            return False
+
+        for name, value in self.constants:
+            if not _sameValue(node.a[name].get(), value):
+                return False
+
+        return True
+
+
+# -------------------------------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def cseSession():
+    """Reuse the math nodes of identical computations made by the operators within the block.
+    Reused nodes are shared, so only rewire the nodes returned by the operators outside a session.
+
+        Example:
+            with cseSession():
+                mid_loc.a.tx * 50 >> jnt1.a.rz
+                mid_loc.a.tx * 50 >> jnt2.a.rz
+                report()
+            # Output: >>> CSE: 1 nodes created, 1 nodes saved
+    """
+    global _sessionDepth
+    if not _sessionDepth:
+        clear()
+        _stats.update(created=0, reused=0)
+
+    _sessionDepth += 1
+    try:
+        yield
+    finally:
+        _sessionDepth -= 1
+        if not _sessionDepth:
+            clear()
+
+
+def isActive():
+    return _sessionDepth > 0
+
+
+def clear():
+    _entries.clear()
+    _keys.clear()
+
+
+def report():
+    """Print and return how many nodes the current or last session made and saved.
+
+        Returns:
+            dict: The created and saved node counts.
+    """
+    result = {"created": _stats["created"], "saved": _stats["reused"]}
+    print(">>> CSE: {created} nodes created, {saved} nodes saved".format(**result))
+    return result
+
+
+# -------------------------------------------------------------------------------------------------
+
+def makeKey(nodeType, operationType, inputs, commutative=False):
+    """The key of a computation, plugs by node handle and attribute, constants by value.
+
+        Args:
+            nodeType(str): The type of the math node.
+            operationType(int): The operation of the node, None when it has none.
+            inputs(list): The (attribute name, value) pairs, values are Attributes or constants.
+            commutative(bool): Whether the order of the inputs does not matter, e.g. sums.
+
+        Returns:
+            tuple: The key.
+    """
+    values = [_valueKey(value) for name, value in inputs]
+    if commutative:
+        values = sorted(values, key=repr)
+
+    return nodeType, operationType, tuple(values)
+
+
+def lookup(nodeType, operationType, inputs, commutative=False):
+    """Return the output of an identical node made earlier in the session, None otherwise."""
+    if not _sessionDepth:
+        return None
+
+    key = makeKey(nodeType, operationType, inputs, commutative)
+    entry = _entries.get(key)
+    if entry is None:
+        return None
+
+    if not entry.isValid():
+        _forget(key)
+        return None
+
+    if not entry.isSameSource(inputs, commutative):
+        return None
+
+    entry.hits += 1
+    _stats["reused"] += 1
+    return entry.output
+
+
+def store(nodeType, operationType, inputs, output, commutative=False):
+    """Remember a newly made node, after its inputs have been connected and set."""
+    if not _sessionDepth:
+        return
+
+    key = makeKey(nodeType, operationType, inputs, commutative)
+    _forget(key)
+
+    _entries[key] = Cse_Entry(output, inputs, commutative)
+    _keys[output.node.handle.hashCode()] = key
+    _stats["created"] += 1
+
+
+def release(node):
+    """Ask to edit a node in place, like appending to a plusMinusAverage.
+    Returns False when the node has been handed out more than once, the caller must make a new one."""
+    handle = node.handle
+    key = _keys.get(handle.hashCode()) if handle is not None else None
+    entry = _entries.get(key)
+    if entry is None:
+        return True
+
+    if entry.hits and entry.isValid():
+        return False
+
+    _forget(key)
+    return True
+
+
+def _forget(key):
+    entry = _entries.pop(key, None)
+    if entry is not None:
+        handle = entry.output.node.handle
+        if handle is not None:
+            _keys.pop(handle.hashCode(), None)
+
+
+# -------------------------------------------------------------------------------------------------
+
+def _isValue(value):
+    return isinstance(value, (int, float, list, tuple))
+
+
+def _valueKey(value):
+    if isinstance(value, (int, float)):
+        return "value", float(value)
+
+    if isinstance(value, (list, tuple)):
+        return "value", tuple(float(i) for i in value)
+
+    if isinstance(value, six.string_types):
+        return "plug", value
+
+    handle = value.node.handle
+    return "plug", handle.hashCode() if handle is not None else value.node.fullPath, value.attr
+
+
+def _sourceHandles(inputs, commutative=False):
+    """The node handles of the plug inputs in key order, None for the ones only known by name."""
+    values = [value for name, value in inputs if not _isValue(value) and not isinstance(value, six.string_types)]
+    if commutative:
+        values = sorted(values, key=lambda value: repr(_valueKey(value)))
+
+    return [value.node.handle for value in values]
+
+
+def _inputConnections(node):
+    return sorted(cmds.listConnections(node.fullPath, s=True, d=False, c=True, p=True) or [])
+
+
+def _sameValue(current, value):
+    """Compare a getAttr result to the value the input was set with."""
+    if isinstance(current, list):
+        current = current[0] if current else ()
+    if not isinstance(current, tuple):
+        current = (current,)
+
+    # Scalars set on a compound input are broadcast to every child
+    if isinstance(value, (int, float)):
+        value = (value,) * len(current)
+
+    return len(current) == len(value) and all(abs(a - b) < 1e-9 for a, b in zip(current, value))
@@ -0,0 +1,115 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: An undoable command that applies an MDGModifier, so the edits we make
+        through plugs land in Maya's undo queue as a single step.
+
+        This file is also the Maya plugin, it is loaded the first time run() is called.
+"""
+
+import os
+
+import maya.cmds as cmds
+import maya.OpenMayaMPx as ompx
+
+COMMAND_NAME = "nodelModifier"
+
+# The modifier handed to the next command, commands can not take Python objects as arguments
+_pending = None
+
+
+class Modifier_Command(ompx.MPxCommand):
+    """Takes the pending modifier and holds on to it, doIt/undoIt/redoIt then go straight to it."""
+
+    def __init__(self):
+        ompx.MPxCommand.__init__(self)
+        self._modifier = None
+
+    def isUndoable(self):
+        return True
+
+    def doIt(self, args):
+        # Maya imports the plugin as its own module, the pending modifier lives in ours
+        from modules.nodel.base import modifier_command
+
+        self._modifier, modifier_command._pending = modifier_command._pending, None
+        if self._modifier is None:
+            raise RuntimeError("{} is run through modifier_command.run()".format(COMMAND_NAME))
+
+        try:
+            self._modifier.doIt()
+        except RuntimeError:
+            # Roll back what was applied, a failed command never reaches the undo queue
+            self._modifier.undoIt()
+            raise
+
+    def redoIt(self):
+        self._modifier.doIt()
+
+    def undoIt(self):
+        self._modifier.undoIt()
+
+
+def _creator():
+    return ompx.asMPxPtr(Modifier_Command())
+
+
+def initializePlugin(mobject):
+    ompx.MFnPlugin(mobject).registerCommand(COMMAND_NAME, _creator)
+
+
+def uninitializePlugin(mobject):
+    ompx.MFnPlugin(mobject).deregisterCommand(COMMAND_NAME)
+
+
+# -------------------------------------------------------------------------------------------------
+
+class Call_Edit(object):
+    """An edit made through function set calls, for the data Maya gives no modifier for.
+    run() takes it like a modifier, undo calls the restoring function.
+
+        Example:
+            previous = fnMesh.getPoints()
+            run(Call_Edit(lambda: fnMesh.setPoints(points), lambda: fnMesh.setPoints(previous)))
+    """
+
+    __slots__ = ("_do", "_undo")
+
+    def __init__(self, do, undo):
+        self._do = do
+        self._undo = undo
+
+    def doIt(self):
+        self._do()
+
+    def undoIt(self):
+        self._undo()
+
+
+def load():
+    """Load this file as a plugin, once."""
+    path = os.path.splitext(os.path.abspath(__file__))[0] + ".py"
+    if not cmds.pluginInfo(path, query=True, loaded=True):
+        cmds.loadPlugin(path, quiet=True)
+
+
+def run(modifier):
+    """Apply a modifier as one undoable command, everything it holds reverts with one Ctrl+Z.
+    Nothing stays applied if one of its operations fails.
+
+        Args:
+            modifier(MDGModifier/Call_Edit): The queued edits.
+
+        Example:
+            modifier = om.MDGModifier()
+            setPlugValue(modifier, toMPlug("L_hand_JNT.translateX"), (1,))
+            run(modifier)
+    """
+    global _pending
+    load()
+
+    _pending = modifier
+    try:
+        getattr(cmds, COMMAND_NAME)()
+    finally:
+        _pending = None
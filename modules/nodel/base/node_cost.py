@@ -0,0 +1,238 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Picks the cheapest Maya node type for the math our Attribute operators build,
+        from a per type cost table and the shape of the operands. Opt-in, outside a cheapest()
+        block the operators keep building the node types they always have.
+"""
+
+import contextlib
+
+import maya.cmds as cmds
+
+# Rough relative cost of one evaluation, single channel nodes are the cheapest and
+# plusMinusAverage/multiplyDivide pay for their arrays and three channels.
+# Adjust these to measurements of your own Maya version.
+COSTS = {
+    "addDoubleLinear": 1.0,
+    "multDoubleLinear": 1.0,
+    "floatMath": 1.2,
+    "plusMinusAverage": 2.0,
+    "multiplyDivide": 2.0,
+}
+
+# floatMath ships with the lookdevKit plugin, we only use it when the plugin is already loaded
+_available = {}
+
+# Nesting depth of the cheapest() blocks we are in
+_cheapestDepth = 0
+
+
+class Node_Spec(object):
+    """How to build one operation with a given node type.
+
+        Args:
+            nodeType(str): The Maya node type.
+            operationType(int): The value of the operation attribute, None if the node has none.
+            inputs(tuple): The names of the two input attributes.
+            output(str): The name of the output attribute.
+            commutative(bool): Whether the inputs can be swapped.
+            constant(function): Applied to a constant second operand, e.g. x / 4 -> x * 0.25.(optional)
+
+        Example:
+
+            spec = select("multiply")
+            print(spec.nodeType)
+            Output: multDoubleLinear
+    """
+
+    __slots__ = ("nodeType", "operationType", "inputs", "output", "commutative", "constant")
+
+    def __init__(self, nodeType, operationType, inputs, output, commutative=False, constant=None):
+        self.nodeType = nodeType
+        self.operationType = operationType
+        self.inputs = inputs
+        self.output = output
+        self.commutative = commutative
+        self.constant = constant
+
+    def __repr__(self):
+        return "{0}('{1}', {2})".format(self.__class__.__name__, self.nodeType, self.operationType)
+
+    @property
+    def cost(self):
+        return COSTS.get(self.nodeType, max(COSTS.values()))
+
+    @property
+    def isArray(self):
+        """Whether the node takes any number of inputs, so n operands still need only one node."""
+        return self.nodeType == "plusMinusAverage"
+
+
+def _pma(operationType, compound):
+    suffix = "3D" if compound else "1D"
+    return Node_Spec("plusMinusAverage", operationType,
+                     ("input{}[0]".format(suffix), "input{}[1]".format(suffix)),
+                     "output" + suffix, commutative=operationType == 1)
+
+
+def _md(operationType, compound):
+    suffix = "" if compound else "X"
+    return Node_Spec("multiplyDivide", operationType, ("input1" + suffix, "input2" + suffix),
+                     "output" + suffix, commutative=operationType == 1)
+
+
+def _floatMath(operationType, commutative=False):
+    return Node_Spec("floatMath", operationType, ("floatA", "floatB"), "outFloat", commutative=commutative)
+
+
+def _candidates(operation, compound, constant):
+    """Every way we know to build the operation, whatever it costs."""
+    if compound:
+        return {
+            "add": [_pma(1, True)],
+            "subtract": [_pma(2, True)],
+            "average": [_pma(3, True)],
+            "multiply": [_md(1, True)],
+            "divide": [_md(2, True)],
+            "power": [_md(3, True)],
+        }[operation]
+
+    linear = ("input1", "input2")
+    return {
+        "add": [Node_Spec("addDoubleLinear", None, linear, "output", commutative=True),
+                _floatMath(0, commutative=True), _pma(1, False)],
+        "subtract": ([Node_Spec("addDoubleLinear", None, linear, "output", constant=lambda value: -value)]
+                     if constant else []) + [_floatMath(1), _pma(2, False)],
+        "average": [_pma(3, False)],
+        "multiply": [Node_Spec("multDoubleLinear", None, linear, "output", commutative=True),
+                     _floatMath(2, commutative=True), _md(1, False)],
+        "divide": ([Node_Spec("multDoubleLinear", None, linear, "output", constant=lambda value: 1.0 / value)]
+                   if constant else []) + [_floatMath(3), _md(2, False)],
+        "power": [_floatMath(6), _md(3, False)],
+    }[operation]
+
+
+def _default(operation, compound):
+    """The node the operators build outside cheapest() blocks, what they have always built."""
+    if operation in ("add", "subtract", "average"):
+        return _pma({"add": 1, "subtract": 2, "average": 3}[operation], compound)
+
+    if operation == "multiply" and not compound:
+        return Node_Spec("multDoubleLinear", None, ("input1", "input2"), "output", commutative=True)
+
+    return _md({"multiply": 1, "divide": 2, "power": 3}[operation], compound)
+
+
+# -------------------------------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def cheapest():
+    """Let the Attribute math operators pick the cheapest node type within the block, e.g. an
+    addDoubleLinear for a scalar sum, so check what the results are connected from before reading
+    their nodes. Outside of it they build plusMinusAverage and multiplyDivide nodes as always.
+
+        Example:
+            with cheapest():
+                node.a.tx / 4 >> node2.a.tx
+            # One multDoubleLinear by 0.25 instead of a multiplyDivide
+    """
+    global _cheapestDepth
+    _cheapestDepth += 1
+    try:
+        yield
+    finally:
+        _cheapestDepth -= 1
+
+
+def isCheapest():
+    return _cheapestDepth > 0
+
+
+def isAvailable(nodeType):
+    """Whether Maya knows the node type right now, plugin node types included."""
+    if nodeType not in _available:
+        _available[nodeType] = nodeType in (cmds.allNodeTypes() or [])
+
+    return _available[nodeType]
+
+
+def refresh():
+    """Forget which node types are available, call after loading or unloading plugins."""
+    _available.clear()
+
+
+def select(operation, compound=False, constant=False, count=2, nodeType=None):
+    """Return the cheapest way to build an operation on the given operands.
+
+        Args:
+            operation(str): "add", "subtract", "average", "multiply", "divide" or "power".
+            compound(bool): Whether the operands are parent attributes like translate.
+            constant(bool): Whether the second operand is a constant.
+            count(int): How many operands, two input nodes have to be chained for more than two.
+            nodeType(str): Only consider this node type.(optional)
+
+        Returns:
+            Node_Spec: The cheapest available node.
+
+        Example:
+            print(select("divide", constant=True).nodeType)
+            Output: multDoubleLinear
+    """
+    best, bestCost = None, None
+    for spec in _candidates(operation, compound, constant):
+        if nodeType and spec.nodeType != nodeType or not isAvailable(spec.nodeType):
+            continue
+
+        nodes = 1 if spec.isArray else max(count - 1, 1)
+        cost = spec.cost * nodes
+
+        # On a tie the single array node wins, fewer nodes to dirty and to load
+        if bestCost is None or cost < bestCost or (cost == bestCost and spec.isArray):
+            best, bestCost = spec, cost
+
+    if best is None:
+        raise ValueError(">>> No available node type can {0} these operands: {1}".format(operation, nodeType))
+
+    return best
+
+
+def pick(operation, compound=False, constant=False, count=2, nodeType=None):
+    """Return the node the Attribute operators build for an operation, the cheapest one within a
+    cheapest() block or when a nodeType is given, the one they always built otherwise.
+
+        Example:
+            print(pick("add").nodeType)
+            Output: plusMinusAverage
+    """
+    if nodeType or isCheapest():
+        return select(operation, compound, constant, count, nodeType)
+
+    return _default(operation, compound)
+
+
+def report(nodeTypes=None):
+    """Print and return how many of each math node type the scene uses and what they cost.
+
+        Args:
+            nodeTypes(list): The node types to count, default: every type in COSTS.
+
+        Returns:
+            dict: The count per node type.
+
+        Example:
+            report()
+            Output: >>> multDoubleLinear: 	24 nodes, cost 24.0
+    """
+    counts = {}
+    for nodeType in nodeTypes or sorted(COSTS):
+        if not isAvailable(nodeType):
+            continue
+
+        count = len(cmds.ls(type=nodeType) or [])
+        if count:
+            counts[nodeType] = count
+            print(">>> {0}: \t{1} nodes, cost {2:.1f}".format(nodeType, count, count * COSTS.get(nodeType, 0)))
+
+    print(">>> Total cost: \t{:.1f}".format(sum(count * COSTS.get(key, 0) for key, count in counts.items())))
+    return counts
@@ -0,0 +1,201 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: A session registry of the Maya nodes our wrappers have already resolved,
+        keyed by MObjectHandle so repeated wrapping skips the command round-trips.
+"""
+
+import maya.cmds as cmds
+import maya.OpenMaya as om
+
+from modules import six
+
+from modules.utils import open_maya_api
+
+# hashCode -> Node_Entry
+_entries = {}
+
+# name as it was passed in -> hashCode
+_names = {}
+
+_callbackId = None
+
+
+class Node_Entry(object):
+    """The resolved API objects of a single Maya node. The path is the registry's own,
+    to match names against, wrappers keep a path of their own for the instance they were given.
+
+        Args:
+            obj(MObject): The node to hold on to.
+
+        Example:
+
+            entry = Node_Entry(open_maya_api.toMObject("L_hand_JNT"))
+            print(entry.dag.fullPathName())
+    """
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.handle = om.MObjectHandle(obj)
+        self.dep = om.MFnDependencyNode(obj)
+        self.dag = om.MDagPath.getAPathTo(obj) if obj.hasFn(om.MFn.kDagNode) else None
+        self.names = set()
+
+    @property
+    def hashCode(self):
+        return self.handle.hashCode()
+
+    def isValid(self):
+        return self.handle.isValid()
+
+    def matches(self, name):
+        """Check the name still points at this node, renames and re-parenting included."""
+        if not self.isValid():
+            return False
+
+        if self.dag:
+            return name in (self.dag.partialPathName(), self.dag.fullPathName(), self.dep.name())
+
+        return name == self.dep.name()
+
+
+# -------------------------------------------------------------------------------------------------
+
+def _nodeRemoved(node, *args):
+    """Maya callback evicting entries of deleted nodes."""
+    evict(om.MObjectHandle(node).hashCode())
+
+
+def _addCallback():
+    global _callbackId
+    if _callbackId is None:
+        _callbackId = om.MDGMessage.addNodeRemovedCallback(_nodeRemoved, "dependNode")
+
+
+def register(obj, name=None):
+    """Store the given MObject and return its entry, reusing an existing one if valid.
+
+        Args:
+            obj(MObject): The node to register.
+            name(str): The name used to look it up.(optional)
+
+        Returns:
+            Node_Entry: The registry entry.
+    """
+    _addCallback()
+
+    hashCode = om.MObjectHandle(obj).hashCode()
+    entry = _entries.get(hashCode)
+
+    if not entry or not entry.isValid() or not entry.obj == obj:
+        entry = Node_Entry(obj)
+        _entries[hashCode] = entry
+
+    if name:
+        entry.names.add(name)
+        _names[name] = hashCode
+
+    return entry
+
+
+def lookup(name):
+    """Return the entry registered under the given name if it still points at the same node."""
+    hashCode = _names.get(name)
+    if hashCode is None:
+        return None
+
+    entry = _entries.get(hashCode)
+    if entry and entry.matches(name):
+        return entry
+
+    del _names[name]
+    return None
+
+
+def resolve(node):
+    """Return the entry of a node, only touching Maya when it has not been resolved before.
+
+        Args:
+            node(node/str/MObject/MDagPath): A wrapped node, an API object or the name of a node.
+
+        Returns:
+            Node_Entry: The registry entry or None if the node does not exist.
+
+        Example:
+            entry = resolve("L_hand_JNT")
+            print(entry.dep.typeName())
+            # Output:joint
+    """
+    if node is None:
+        return None
+
+    if isinstance(node, om.MDagPath):
+        return register(node.node()) if node.isValid() else None
+
+    if isinstance(node, om.MObject):
+        return register(node) if not node.isNull() else None
+
+    # Wrapped nodes carry their handle with them
+    handle = getattr(node, "handle", None)
+    if handle is not None and handle.isValid():
+        return register(handle.object())
+
+    name = str(node)
+    entry = lookup(name)
+    if entry:
+        return entry
+
+    if not name or not cmds.objExists(name):
+        return None
+
+    return register(open_maya_api.toMObject(name), name)
+
+
+def resolveMany(nodes):
+    """Return the entries of many nodes, resolving the unknown ones through one selection list.
+
+        Args:
+            nodes(list): Wrapped nodes or the names of them.
+
+        Returns:
+            list: The registry entries, parallel to nodes, None where a node does not exist.
+    """
+    nodes = list(nodes)
+    entries = []
+    missing = []
+
+    for node in nodes:
+        if not isinstance(node, six.string_types):
+            entries.append(resolve(node))
+            continue
+
+        entry = lookup(node)
+        entries.append(entry)
+        if not entry:
+            missing.append(len(entries) - 1)
+
+    names = [nodes[i] for i in missing]
+    for i, name, obj in zip(missing, names, open_maya_api.toMObjects(names)):
+        if obj:
+            entries[i] = register(obj, name)
+
+    return entries
+
+
+def evict(hashCode):
+    """Remove a node from the registry."""
+    entry = _entries.pop(hashCode, None)
+    if entry:
+        for name in entry.names:
+            if _names.get(name) == hashCode:
+                del _names[name]
+
+
+def clear():
+    """Empty the registry, for instance after opening a new scene."""
+    _entries.clear()
+    _names.clear()
+
+
+def size():
+    return len(_entries)
@@ -0,0 +1,136 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Component indices of a mesh or curve held as a range or an int array,
+        the "node.vtx[12]" names are only rendered when asked for.
+"""
+
+import array
+import re
+
+from modules import six
+
+_RANGE_TYPE = type(six.moves.range(0))
+_COMPONENT_PATTERN = re.compile(r"^(?P<node>.+)\.(?P<kind>\w+)\[(?P<start>\d+)(?::(?P<end>\d+))?\]$")
+
+
+class Components(object):
+    """The components of one kind on one node, a list of names to the outside but only
+    indices inside, so a 200k vertex mesh costs a range instead of 200k strings.
+
+        Args:
+            node(str): The node path the names are rendered with.
+            kind(str): The component type, "vtx", "e", "f", "cv"...
+            indices(range/array/list): The component indices.
+
+        Example:
+
+            vertices = body.vertices
+            print(len(vertices), vertices[12])
+            Output: 200000 body_GEO.vtx[12]
+            cmds.select(vertices.ranges())
+    """
+
+    __slots__ = ("node", "kind", "indices")
+
+    def __init__(self, node, kind, indices):
+        self.node = str(node)
+        self.kind = kind
+        self.indices = indices if isinstance(indices, (_RANGE_TYPE, array.array)) else array.array("i", indices)
+
+    def __repr__(self):
+        return "{0}('{1}.{2}', {3})".format(self.__class__.__name__, self.node, self.kind, len(self))
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __iter__(self):
+        for index in self.indices:
+            yield self.name(index)
+
+    def __getitem__(self, item):
+        """ A name for an index, a list of names for a slice, like the flattened list it replaces."""
+        if isinstance(item, slice):
+            return [self.name(index) for index in self.indices[item]]
+        return self.name(self.indices[item])
+
+    def __contains__(self, item):
+        """ An index, or a name on our node like "body_GEO.vtx[3]", a range only if every index is ours."""
+        if not isinstance(item, six.string_types):
+            return item in self.indices
+
+        match = _COMPONENT_PATTERN.match(item)
+        if not match or match.group("node") != self.node or match.group("kind") != self.kind:
+            return False
+
+        start = int(match.group("start"))
+        end = int(match.group("end") or start)
+        indices = self.indices if isinstance(self.indices, _RANGE_TYPE) or start == end else set(self.indices)
+        return all(index in indices for index in six.moves.range(start, end + 1))
+
+    # -------------------------------------------------------------------------------------------------
+
+    def name(self, index):
+        return "{0}.{1}[{2}]".format(self.node, self.kind, index)
+
+    def names(self):
+        """ Every name, flattened like cmds.ls(fl=True)."""
+        return list(self)
+
+    def ranges(self):
+        """ The names with consecutive indices merged, what cmds.ls returns without flattening.
+
+            Example:
+                print(Components("body_GEO", "vtx", [0, 1, 2, 7]).ranges())
+                Output: ['body_GEO.vtx[0:2]', 'body_GEO.vtx[7]']
+        """
+        names = []
+        start = previous = None
+        for index in sorted(set(self.indices)):
+            if previous is not None and index == previous + 1:
+                previous = index
+                continue
+
+            if start is not None:
+                names.append(self._rangeName(start, previous))
+            start = previous = index
+
+        if start is not None:
+            names.append(self._rangeName(start, previous))
+        return names
+
+    def _rangeName(self, start, end):
+        if start == end:
+            return self.name(start)
+        return "{0}.{1}[{2}:{3}]".format(self.node, self.kind, start, end)
+
+    def subset(self, indices):
+        """ The same kind of components on the same node for other indices."""
+        return Components(self.node, self.kind, indices)
+
+    # -------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def fromNames(cls, names):
+        """ Read names like "body_GEO.vtx[3:7]" back into indices, flattened or not.
+        They must all be of one kind on one node.
+        """
+        node = kind = None
+        indices = array.array("i")
+        for name in names:
+            match = _COMPONENT_PATTERN.match(name)
+            if not match:
+                raise ValueError(">>> {} is not a component name".format(name))
+
+            if node is None:
+                node, kind = match.group("node"), match.group("kind")
+            elif (node, kind) != (match.group("node"), match.group("kind")):
+                raise ValueError(">>> {0} is not a {1} component of {2}".format(name, kind, node))
+
+            start = int(match.group("start"))
+            end = int(match.group("end") or start)
+            indices.extend(six.moves.range(start, end + 1))
+
+        if node is None:
+            raise ValueError(">>> No component names given")
+        return cls(node, kind, indices)
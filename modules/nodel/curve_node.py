@@ -6,11 +6,16 @@ About: Our Mesh Node functionality to deal with Maya
 """
 
 import maya.cmds as cmds
+import maya.api.OpenMaya as om2
 from modules.nodel import Dag_Node
+from modules.nodel.base import modifier_command
+from modules.utils import open_maya_api
 
 
 class Curve(Dag_Node):
 
+    __slots__ = ()
+
     def __init__(self, node):
         Dag_Node.__init__(self, node)
         self.node = node
@@ -21,9 +26,7 @@ class Curve(Dag_Node):
 
     @property
     def cvPositions(self):
-        positions = [cmds.xform(cv, q=True, t=True, ws=True) for cv in self.cvs]
-        pos = [(pos[0], pos[1], pos[2]) for pos in positions]
-        return pos
+        return [tuple(point) for point in self.getPoints().tolist()]
 
     @property
     def eps(self):
@@ -31,23 +34,177 @@ class Curve(Dag_Node):
 
     @property
     def epPosition(self):
-        positions = [cmds.xform(ep, q=True, t=True, ws=True) for ep in self.eps]
-        pos = [(pos[0], pos[1], pos[2]) for pos in positions]
-        return pos
+        return [tuple(point) for point in self.getEditPoints().tolist()]
 
     @property
     def shapes(self):
-        shapes = []
-        for shape in cmds.listRelatives(self.fullPath, s=True, f=True, ni=True) or []:
-            shapes.append(Curve(shape))
-
-        return shapes
+        return [Curve(path) for path in self._childPaths(shapes=True)]
 
     @property
     def shape(self):
         shapes = self.shapes
         return Curve(shapes[0]) if len(shapes) else Dag_Node(None)
 
+    # -------------------------------------------------------------------------------------------------
+
+    def _curveFn(self):
+        """ The MFnNurbsCurve of the first curve shape, through the API 2.0 for its array types."""
+        selectionList = om2.MSelectionList()
+        selectionList.add(self.fullPath)
+        path = selectionList.getDagPath(0)
+        if not path.hasFn(om2.MFn.kNurbsCurve):
+            path.extendToShape()
+
+        if not path.hasFn(om2.MFn.kNurbsCurve):
+            raise ValueError(">>> {} is not a nurbs curve".format(self.fullPath))
+        return om2.MFnNurbsCurve(path)
+
+    @property
+    def length(self):
+        return self._curveFn().length()
+
+    @property
+    def domain(self):
+        """ The (start, end) parameter range of the curve."""
+        return self._curveFn().knotDomain
+
+    def getPoints(self, space="world"):
+        """ Every CV position with one getCVs call.
+
+            Args:
+                space (str): "world" or "object".
+
+            Returns:
+                numpy.ndarray: Shape (N, 3).
+
+            Example:
+                print(ctrl.getPoints()[:2])
+                Output: [[0. 0. 1.] [0.7 0. 0.7]]
+        """
+        import numpy as np
+
+        points = self._curveFn().cvPositions(open_maya_api.toMSpace(space))
+        return np.array(points, dtype=np.float64).reshape(-1, 4)[:, :3]
+
+    def setPoints(self, points, space="world"):
+        """ Move every CV with one setCVs call, as a single undo step.
+
+            Args:
+                points (list/numpy.ndarray): Shape (N, 3), one position per CV.
+                space (str): "world" or "object".
+
+            Example:
+                ctrl.setPoints(ctrl.getPoints(space="object") * 2, space="object")
+        """
+        fnCurve = self._curveFn()
+        points = [list(point)[:3] for point in points]
+        if len(points) != fnCurve.numCVs:
+            raise ValueError(">>> {0} has {1} cvs, got {2} points".format(
+                self.fullPath, fnCurve.numCVs, len(points)))
+
+        # MFnNurbsCurve edits skip the undo queue, keep the object space CVs to put back
+        previous = fnCurve.cvPositions(om2.MSpace.kObject)
+        points = om2.MPointArray(points)
+        mSpace = open_maya_api.toMSpace(space)
+
+        def apply(positions, positionSpace):
+            fnCurve = self._curveFn()
+            fnCurve.setCVPositions(positions, positionSpace)
+            fnCurve.updateCurve()
+
+        modifier_command.run(modifier_command.Call_Edit(
+            lambda: apply(points, mSpace), lambda: apply(previous, om2.MSpace.kObject)))
+
+    def getEditPoints(self, space="world"):
+        """ The edit point positions, the points at the knots within the domain.
+
+            Returns:
+                numpy.ndarray: Shape (N, 3).
+        """
+        fnCurve = self._curveFn()
+        start, end = fnCurve.knotDomain
+        parameters = sorted(set(knot for knot in fnCurve.knots() if start <= knot <= end))
+
+        # The last edit point of a closed curve is the first one
+        if fnCurve.form == om2.MFnNurbsCurve.kPeriodic:
+            parameters = parameters[:-1]
+
+        return self.pointsAtParameters(parameters, space=space)
+
+    # -------------------------------------------------------------------------------------------------
+
+    def pointsAtParameters(self, parameters, space="world"):
+        """ The positions on the curve at many parameters.
+
+            Returns:
+                numpy.ndarray: Shape (N, 3).
+        """
+        import numpy as np
+
+        fnCurve = self._curveFn()
+        mSpace = open_maya_api.toMSpace(space)
+        points = np.zeros((len(parameters), 3), dtype=np.float64)
+        for i, parameter in enumerate(parameters):
+            point = fnCurve.getPointAtParam(float(parameter), mSpace)
+            points[i] = (point.x, point.y, point.z)
+
+        return points
+
+    def sampleParameters(self, count, space="world"):
+        """ Evenly spaced parameters over the whole domain.
+
+            Returns:
+                tuple: (parameters, points) shaped (N,) and (N, 3).
+        """
+        import numpy as np
+
+        start, end = self.domain
+        parameters = np.linspace(start, end, count)
+        return parameters, self.pointsAtParameters(parameters, space=space)
+
+    def sampleArcLength(self, count, space="world"):
+        """ Parameters evenly spaced along the length of the curve, for placing joints or
+        controls at equal distances whatever the parameterisation.
+
+            Returns:
+                tuple: (parameters, points) shaped (N,) and (N, 3).
+
+            Example:
+                parameters, points = spineCurve.sampleArcLength(5)
+        """
+        import numpy as np
+
+        fnCurve = self._curveFn()
+        length = fnCurve.length()
+        parameters = np.array([fnCurve.findParamFromLength(distance)
+                               for distance in np.linspace(0, length, count)], dtype=np.float64)
+        return parameters, self.pointsAtParameters(parameters, space=space)
+
+    def closestPoints(self, points, space="world"):
+        """ The closest position on the curve and its parameter for many points.
+
+            Args:
+                points (list/numpy.ndarray): Shape (N, 3).
+                space (str): The space of the points passed and returned.
+
+            Returns:
+                tuple: (points, parameters) shaped (N, 3) and (N,).
+        """
+        import numpy as np
+
+        fnCurve = self._curveFn()
+        mSpace = open_maya_api.toMSpace(space)
+        closest = np.zeros((len(points), 3), dtype=np.float64)
+        parameters = np.zeros(len(points), dtype=np.float64)
+        for i, point in enumerate(points):
+            found, parameter = fnCurve.closestPoint(om2.MPoint(*list(point)[:3]), space=mSpace)
+            closest[i] = (found.x, found.y, found.z)
+            parameters[i] = parameter
+
+        return closest, parameters
+
+    # -------------------------------------------------------------------------------------------------
+
     def clsMove(self, *args, **kwargs):
         cls, clsHdl = cmds.cluster(self.fullPath)
         cmds.move(*args, clsHdl, **kwargs)
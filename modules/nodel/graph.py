@@ -0,0 +1,605 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Walking the dependency graph through the API, yielding light plug handles
+        instead of wrapping every node we pass on the way, and snapshots of the whole
+        graph in flat arrays for scene wide queries.
+"""
+
+import maya.OpenMaya as om
+
+from modules import six
+
+from modules.utils import open_maya_api
+
+UPSTREAM = "upstream"
+DOWNSTREAM = "downstream"
+
+
+class Plug_Handle(object):
+    """A plug reached by a walk, only turned into an Attribute when asked.
+
+        Args:
+            plug(MPlug): The plug.
+            depth(int): How many connections away from the start it is.
+
+        Example:
+
+            for handle in upstream(jnt.a.rx):
+                print(handle.name, handle.nodeType, handle.depth)
+    """
+
+    __slots__ = ("plug", "depth")
+
+    def __init__(self, plug, depth=0):
+        self.plug = plug
+        self.depth = depth
+
+    def __repr__(self):
+        return "{0}('{1}', {2})".format(self.__class__.__name__, self.name, self.depth)
+
+    @property
+    def name(self):
+        return self.plug.name()
+
+    @property
+    def attributeName(self):
+        """The long attribute name with its indices, e.g. "input3D[0].input3Dx"."""
+        return plugAttributeName(self.plug)
+
+    @property
+    def node(self):
+        return self.plug.node()
+
+    @property
+    def nodeName(self):
+        return open_maya_api.toName(self.plug.node())
+
+    @property
+    def nodeType(self):
+        return om.MFnDependencyNode(self.plug.node()).typeName()
+
+    def attribute(self):
+        """Wrap the plug as an Attribute of a Dag_Node or a Dep_Node."""
+        return wrapPlug(self.plug)
+
+
+# -------------------------------------------------------------------------------------------------
+
+def plugAttributeName(plug):
+    """The long attribute path of a plug without the node, with its indices."""
+    return plug.partialName(False, False, False, False, True, True)
+
+
+def wrapNode(obj):
+    """Wrap an MObject as a Dag_Node if it lives in the DAG, as a Dep_Node otherwise."""
+    from modules.nodel import Dep_Node, Dag_Node
+
+    return Dag_Node(obj) if obj.hasFn(om.MFn.kDagNode) else Dep_Node(obj)
+
+
+def wrapPlug(plug):
+    """Wrap an MPlug as an Attribute."""
+    from modules.nodel import Attribute
+
+    return Attribute(wrapNode(plug.node()), plugAttributeName(plug))
+
+
+def connectedPlugs(plug, inputs=True, outputs=False):
+    """The plugs directly connected to a plug, the children of a parent plug included.
+
+        Args:
+            plug(MPlug): The plug to look at.
+            inputs(bool): Return the plugs driving it.
+            outputs(bool): Return the plugs it drives.
+
+        Returns:
+            list: The (connected MPlug, own MPlug) pairs.
+    """
+    plugs = [plug]
+    if plug.isCompound():
+        plugs += [plug.child(i) for i in range(plug.numChildren())]
+
+    pairs = []
+    for own in plugs:
+        connected = om.MPlugArray()
+        own.connectedTo(connected, inputs, outputs)
+        pairs.extend((connected[i], own) for i in range(connected.length()))
+
+    return pairs
+
+
+def plugPath(plug):
+    """The full path of a plug, node full path and long attribute path, to key plugs by."""
+    return "{0}.{1}".format(open_maya_api.toName(plug.node()), plugAttributeName(plug))
+
+
+def nodeConnections(node, inputs=True, outputs=False):
+    """The plugs connected to any attribute of a node, found with one getConnections query.
+
+        Returns:
+            list: The (connected MPlug, own MPlug) pairs.
+    """
+    own = om.MPlugArray()
+    om.MFnDependencyNode(toMObject(node)).getConnections(own)
+
+    pairs = []
+    for i in range(own.length()):
+        connected = om.MPlugArray()
+        own[i].connectedTo(connected, inputs, outputs)
+        pairs.extend((connected[j], own[i]) for j in range(connected.length()))
+
+    return pairs
+
+
+def edges(items, inputs=True, outputs=False):
+    """Every connection of some attributes or nodes, children and array elements included.
+
+        Args:
+            items(list): Attributes, plugs or attribute paths, and nodes for all their attributes.
+            inputs(bool): Return the connections driving them.
+            outputs(bool): Return the connections they drive.
+
+        Returns:
+            list: Unique (source MPlug, destination MPlug) pairs.
+
+        Example:
+            print(len(edges([ctrl], outputs=True)))
+            Output: 12
+    """
+    pairs = []
+    seen = set()
+
+    def add(source, destination):
+        key = (plugPath(source), plugPath(destination))
+        if key not in seen:
+            seen.add(key)
+            pairs.append((source, destination))
+
+    for item in items:
+        if isNode(item):
+            if inputs:
+                for source, own in nodeConnections(item, inputs=True):
+                    add(source, own)
+            if outputs:
+                for destination, own in nodeConnections(item, inputs=False, outputs=True):
+                    add(own, destination)
+            continue
+
+        plug = toPlug(item)
+        plugs = [plug]
+        if plug.isArray():
+            plugs += [plug.connectionByPhysicalIndex(i) for i in range(plug.numConnectedElements())]
+
+        for own in plugs:
+            if inputs:
+                for source, child in connectedPlugs(own, inputs=True):
+                    add(source, child)
+            if outputs:
+                for destination, child in connectedPlugs(own, inputs=False, outputs=True):
+                    add(child, destination)
+
+    return pairs
+
+
+def isNode(item):
+    """Whether an item stands for a whole node rather than one of its attributes."""
+    from modules.nodel import Dep_Node, Attributes
+
+    if isinstance(item, (Dep_Node, Attributes, om.MObject, om.MDagPath)):
+        return True
+
+    return isinstance(item, six.string_types) and "." not in item
+
+
+def toMObject(node):
+    """The MObject of a node, reusing the handle of our wrapped nodes."""
+    from modules.nodel import Attributes
+
+    if isinstance(node, Attributes):
+        node = node.node
+
+    if isinstance(node, om.MObject):
+        return node
+
+    if isinstance(node, om.MDagPath):
+        return node.node()
+
+    handle = getattr(node, "handle", None)
+    if handle is not None and handle.isValid():
+        return handle.object()
+
+    return open_maya_api.toMObject(str(node))
+
+
+def toPlug(item):
+    """The MPlug of an Attribute, a Plug_Handle or an attribute path."""
+    if isinstance(item, om.MPlug):
+        return item
+
+    if isinstance(item, Plug_Handle):
+        return item.plug
+
+    plug = getattr(item, "plug", None)
+    if isinstance(plug, om.MPlug):
+        return plug
+
+    if isinstance(item, six.string_types):
+        return open_maya_api.toMPlug(item)
+
+    raise ValueError(">>> Cannot walk from {!r}, pass an attribute or a plug".format(item))
+
+
+def _matchesType(obj, nodeTypes):
+    if not nodeTypes:
+        return True
+
+    typeName = om.MFnDependencyNode(obj).typeName()
+    for nodeType in nodeTypes:
+        if isinstance(nodeType, six.string_types):
+            if nodeType == typeName:
+                return True
+        elif obj.hasFn(nodeType):
+            return True
+
+    return False
+
+
+def walk(start, direction=UPSTREAM, depth=None, nodeTypes=None, prune=None, depthFirst=True):
+    """Lazily yield the plugs reached from an attribute, one connection at a time through MItDependencyGraph.
+
+        Args:
+            start(Attribute/str/MPlug): The attribute to start from, it is not yielded itself.
+            direction(str): UPSTREAM for what drives it, DOWNSTREAM for what it drives.
+            depth(int): Stop following connections this many hops away.(optional)
+            nodeTypes(list): Only yield plugs on these node types, names or MFn types.
+                The walk still passes through the other nodes.(optional)
+            prune(function): Called with each Plug_Handle, return True to not follow it any further.(optional)
+            depthFirst(bool): Walk depth first, otherwise breadth first.
+
+        Returns:
+            generator: The Plug_Handles.
+
+        Example:
+            for handle in walk(jnt.a.rx, nodeTypes=["transform"], depth=15):
+                print(handle.name)
+            Output: L_arm_CTRL.rotateX
+    """
+    plug = toPlug(start)
+    if isinstance(nodeTypes, six.string_types):
+        nodeTypes = [nodeTypes]
+
+    iterator = om.MItDependencyGraph(
+        plug,
+        om.MFn.kInvalid,
+        om.MItDependencyGraph.kUpstream if direction == UPSTREAM else om.MItDependencyGraph.kDownstream,
+        om.MItDependencyGraph.kDepthFirst if depthFirst else om.MItDependencyGraph.kBreadthFirst,
+        om.MItDependencyGraph.kPlugLevel)
+
+    path = om.MPlugArray()
+    while not iterator.isDone():
+        iterator.getPlugPath(path)
+        level = path.length() - 1
+
+        if level > 0:
+            handle = Plug_Handle(iterator.thisPlug(), level)
+            if _matchesType(handle.node, nodeTypes):
+                yield handle
+
+            if (depth is not None and level >= depth) or (prune and prune(handle)):
+                iterator.prune()
+
+        iterator.next()
+
+
+def upstream(start, **kwargs):
+    """Walk what drives an attribute, see walk()."""
+    return walk(start, UPSTREAM, **kwargs)
+
+
+def downstream(start, **kwargs):
+    """Walk what an attribute drives, see walk()."""
+    return walk(start, DOWNSTREAM, **kwargs)
+
+
+# -------------------------------------------------------------------------------------------------
+
+class Graph_Snapshot(object):
+    """Every node and connection of the scene at one moment, held in flat arrays so the
+    queries run in memory without touching Maya again.
+
+        Args:
+            names(list): The node names, the index of a name is the id of the node.
+            typeNames(list): The distinct node type names, the index is the type code.
+            types(numpy.ndarray): The type code of every node.
+            offsets(numpy.ndarray): CSR row offsets, the downstream nodes of node i are
+                targets[offsets[i]:offsets[i + 1]].
+            targets(numpy.ndarray): CSR column indices, the node ids the edges point at.
+
+        Example:
+
+            graph = snapshot()
+            print(graph.countByType()["multDoubleLinear"])
+            Output: 212
+    """
+
+    __slots__ = ("names", "typeNames", "types", "offsets", "targets", "_ids")
+
+    def __init__(self, names, typeNames, types, offsets, targets):
+        self.names = names
+        self.typeNames = typeNames
+        self.types = types
+        self.offsets = offsets
+        self.targets = targets
+        self._ids = None
+
+    def __repr__(self):
+        return "{0}({1} nodes, {2} edges)".format(self.__class__.__name__, self.nodeCount, self.edgeCount)
+
+    @property
+    def nodeCount(self):
+        return len(self.names)
+
+    @property
+    def edgeCount(self):
+        return len(self.targets)
+
+    def id(self, name):
+        """The id of a node by name, None if it was not in the scene."""
+        if self._ids is None:
+            self._ids = dict((nodeName, i) for i, nodeName in enumerate(self.names))
+        return self._ids.get(name)
+
+    def typeOf(self, nodeId):
+        return self.typeNames[self.types[nodeId]]
+
+    def downstream(self, nodeId):
+        """The ids of the nodes the node drives directly."""
+        return self.targets[self.offsets[nodeId]:self.offsets[nodeId + 1]]
+
+    # -------------------------------------------------------------------------------------------------
+
+    def countByType(self):
+        """The number of nodes of every type.
+
+            Returns:
+                dict: {typeName: count}
+        """
+        import numpy as np
+
+        counts = np.bincount(self.types, minlength=len(self.typeNames))
+        return dict((self.typeNames[i], int(count)) for i, count in enumerate(counts) if count)
+
+    def fanOut(self, top=10):
+        """The nodes driving the most other nodes, the first places a change dirties a lot.
+
+            Returns:
+                list: (name, typeName, count) tuples, highest first.
+        """
+        import numpy as np
+
+        degrees = np.diff(self.offsets)
+        order = np.argsort(-degrees, kind="stable")[:top]
+        return [(self.names[i], self.typeOf(i), int(degrees[i])) for i in order if degrees[i]]
+
+    def fanIn(self, top=10):
+        """The nodes driven by the most other nodes.
+
+            Returns:
+                list: (name, typeName, count) tuples, highest first.
+        """
+        import numpy as np
+
+        degrees = np.bincount(self.targets, minlength=self.nodeCount)
+        order = np.argsort(-degrees, kind="stable")[:top]
+        return [(self.names[i], self.typeOf(i), int(degrees[i])) for i in order if degrees[i]]
+
+    def components(self):
+        """The strongly connected components in reverse topological order, iterative Tarjan.
+
+            Returns:
+                list: Lists of node ids, a node that is not part of a cycle is on its own.
+        """
+        offsets, targets = self.offsets.tolist(), self.targets.tolist()
+        count = self.nodeCount
+        index = [-1] * count
+        low = [0] * count
+        onStack = [False] * count
+        stack = []
+        components = []
+        counter = 0
+
+        for root in range(count):
+            if index[root] != -1:
+                continue
+
+            work = [(root, offsets[root])]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            onStack[root] = True
+
+            while work:
+                node, edge = work[-1]
+                if edge < offsets[node + 1]:
+                    work[-1] = (node, edge + 1)
+                    target = targets[edge]
+                    if index[target] == -1:
+                        index[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        onStack[target] = True
+                        work.append((target, offsets[target]))
+                    elif onStack[target]:
+                        low[node] = min(low[node], index[target])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        onStack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+        return components
+
+    def cycles(self):
+        """The groups of nodes that depend on each other, each one a cycle in the graph.
+
+            Returns:
+                list: Lists of node names.
+        """
+        cycles = []
+        for component in self.components():
+            node = component[0]
+            if len(component) > 1 or node in self.downstream(node).tolist():
+                cycles.append([self.names[i] for i in component])
+
+        return cycles
+
+    def longestChain(self, sources=None, targets=None):
+        """The longest dependency chain from any source node to any target node.
+        A cycle on the way counts as a single step.
+
+            Args:
+                sources(list/function): Node names, or a function taking (name, typeName)
+                    returning True for a source. Default: every node.
+                targets(list/function): The same for the end of the chain. Default: every node.
+
+            Returns:
+                list: The node names along the chain, empty if no source reaches a target.
+
+            Example:
+                chain = graph.longestChain(sources=lambda n, t: n.endswith("_CTRL"), targets=skinJoints)
+                print(len(chain))
+                Output: 38
+        """
+        isSource = self._selector(sources)
+        isTarget = self._selector(targets)
+
+        components = self.components()
+        componentOf = [0] * self.nodeCount
+        for c, component in enumerate(components):
+            for node in component:
+                componentOf[node] = c
+
+        # Tarjan gives reverse topological order, so walk the components backwards
+        length = [0] * len(components)
+        previous = [-1] * len(components)
+        entry = [-1] * len(components)
+        offsets, edges = self.offsets.tolist(), self.targets.tolist()
+
+        best = -1
+        for c in reversed(range(len(components))):
+            if not length[c]:
+                sourceNodes = [node for node in components[c] if isSource(node)]
+                if sourceNodes:
+                    length[c] = 1
+                    entry[c] = sourceNodes[0]
+            if not length[c]:
+                continue
+
+            if any(isTarget(node) for node in components[c]) and (best == -1 or length[c] > length[best]):
+                best = c
+
+            for node in components[c]:
+                for edge in range(offsets[node], offsets[node + 1]):
+                    target = componentOf[edges[edge]]
+                    if target != c and length[c] + 1 > length[target]:
+                        length[target] = length[c] + 1
+                        previous[target] = c
+                        entry[target] = edges[edge]
+
+        chain = []
+        while best != -1:
+            chain.append(self.names[entry[best]])
+            best = previous[best]
+
+        return chain[::-1]
+
+    def _selector(self, nodes):
+        if nodes is None:
+            return lambda nodeId: True
+
+        if callable(nodes):
+            return lambda nodeId: nodes(self.names[nodeId], self.typeOf(nodeId))
+
+        ids = set(self.id(name) for name in nodes)
+        return lambda nodeId: nodeId in ids
+
+
+def snapshot(hierarchy=True):
+    """Walk every node and connection of the scene once with MItDependencyNodes.
+
+        Args:
+            hierarchy(bool): Also add an edge from every DAG parent to its children,
+                as a parent drives the world matrix of everything below it.
+
+        Returns:
+            Graph_Snapshot: The scene held in flat arrays.
+
+        Example:
+            graph = snapshot()
+            print(graph.fanOut(top=1))
+            Output: [('|troll|BASE_GRP|global_CTRL', 'transform', 48)]
+    """
+    import numpy as np
+
+    # hashCode -> [(MObject, id)], hash codes are not unique so keep the objects to compare
+    ids = {}
+    objects = []
+    names = []
+    typeCodes = {}
+    types = []
+
+    iterator = om.MItDependencyNodes()
+    while not iterator.isDone():
+        obj = iterator.thisNode()
+        ids.setdefault(om.MObjectHandle(obj).hashCode(), []).append((obj, len(objects)))
+        objects.append(obj)
+        names.append(open_maya_api.toName(obj))
+        typeName = om.MFnDependencyNode(obj).typeName()
+        types.append(typeCodes.setdefault(typeName, len(typeCodes)))
+        iterator.next()
+
+    def idOf(obj):
+        for candidate, nodeId in ids.get(om.MObjectHandle(obj).hashCode(), ()):
+            if candidate == obj:
+                return nodeId
+
+    offsets = [0]
+    targets = []
+    plugs = om.MPlugArray()
+    destinations = om.MPlugArray()
+    for obj in objects:
+        downstreamIds = set()
+
+        om.MFnDependencyNode(obj).getConnections(plugs)
+        for i in range(plugs.length()):
+            plugs[i].connectedTo(destinations, False, True)
+            for j in range(destinations.length()):
+                downstreamIds.add(idOf(destinations[j].node()))
+
+        if hierarchy and obj.hasFn(om.MFn.kDagNode):
+            fnDag = om.MFnDagNode(obj)
+            for i in range(fnDag.childCount()):
+                downstreamIds.add(idOf(fnDag.child(i)))
+
+        downstreamIds.discard(None)
+        targets.extend(sorted(downstreamIds))
+        offsets.append(len(targets))
+
+    typeNames = [None] * len(typeCodes)
+    for typeName, code in typeCodes.items():
+        typeNames[code] = typeName
+
+    return Graph_Snapshot(names, typeNames, np.array(types, dtype=np.int32),
+                          np.array(offsets, dtype=np.int64), np.array(targets, dtype=np.int32))
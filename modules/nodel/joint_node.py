@@ -7,48 +7,33 @@ About: Our Joint Node functionality to deal with Maya
 from modules.controller_lib import Controller
 from modules.nodel import Dag_Node
 import maya.cmds as cmds
+import maya.OpenMaya as om
 
 
 class Joint(Dag_Node):
 
+    __slots__ = ()
+
     def __init__(self, node):
         Dag_Node.__init__(self, node)
         self.node = node
 
     @property
     def children(self):
-        shapes = self.shapes
-        children = []
-        for child in cmds.listRelatives(self.fullPath, c=True, f=True, ni=True) or []:
-            if child not in shapes:
-                children.append(Joint(child))
-
-        return children
+        return [Joint(path) for path in self._childPaths()]
 
     @property
     def allChildren(self):
-        allChildren = []
-        for child in cmds.listRelatives(self.fullPath, ad=True, f=True, ni=True) or []:
-            allChildren.append(Joint(child))
-        return allChildren
+        return Joint.fromNames(cmds.listRelatives(self.fullPath, ad=True, f=True, ni=True) or [])
 
     @property
     def parent(self):
-        parent = cmds.listRelatives(self.fullPath, p=True, f=True)
-        if parent:
-            if cmds.objectType(parent[0]) == 'joint':
-                return Joint(parent[0])
-            return Dag_Node(parent[0])
-
-    @property
-    def allParents(self):
-        parents = []
-        parent = self.parent
-        while parent:
-            parents.append(parent)
-            parent = parent.parent
+        for parent in self.iterParents():
+            return parent
 
-        return parents
+    def iterParents(self):
+        for path in self._parentPaths():
+            yield Joint(path) if path.hasFn(om.MFn.kJoint) else Dag_Node(path)
 
     def createControl(self, prefix, typ="ctrlCircle", size=1.0, matchMove=False, **kwargs):
         """
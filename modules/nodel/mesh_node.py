@@ -7,31 +7,161 @@ About: Our Mesh Node functionality to deal with Maya
 
 import maya.cmds as cmds
 import maya.mel as mel
+import maya.api.OpenMaya as om2
 from modules.nodel import Dag_Node
+from modules.nodel.base import modifier_command
+from modules.nodel.components import Components
+from modules.utils import open_maya_api
 from modules.utils import weights
 
 
 class Mesh(Dag_Node):
 
+    __slots__ = ()
+
     def __init__(self, node):
         Dag_Node.__init__(self, node)
 
         # Check that we are on the transform and not the shape node
-        if cmds.objectType(node) == "mesh":
+        if self.dep and self.dep.typeName() == "mesh":
             self.node = self.parent.node
 
     # ------------------------------------------------------------------------------------------------- FORMATION
     @property
     def vertices(self):
-        return cmds.ls(self.fullPath + ".vtx[*]", fl=1)
+        return Components(self.path, "vtx", range(self.vertexCount))
 
     @property
     def edges(self):
-        return cmds.ls(self.fullPath + ".e[*]", fl=1)
+        return Components(self.path, "e", range(self.edgeCount))
 
     @property
     def faces(self):
-        return cmds.ls(self.fullPath + ".f[*]", fl=1)
+        return Components(self.path, "f", range(self.faceCount))
+
+    @property
+    def vertexCount(self):
+        return self._meshFn().numVertices
+
+    @property
+    def edgeCount(self):
+        return self._meshFn().numEdges
+
+    @property
+    def faceCount(self):
+        return self._meshFn().numPolygons
+
+    # ------------------------------------------------------------------------------------------------- POINTS
+    def _meshFn(self):
+        """ The MFnMesh of the mesh shape, through the API 2.0 for its array types."""
+        selectionList = om2.MSelectionList()
+        selectionList.add(self.fullPath)
+        path = selectionList.getDagPath(0)
+        if not path.hasFn(om2.MFn.kMesh):
+            path.extendToShape()
+
+        if not path.hasFn(om2.MFn.kMesh):
+            raise ValueError(">>> {} is not a mesh".format(self.fullPath))
+        return om2.MFnMesh(path)
+
+    def points(self, space="world"):
+        """ Every vertex position with one getPoints call.
+
+            Args:
+                space (str): "world" or "object".
+
+            Returns:
+                numpy.ndarray: Shape (N, 3).
+
+            Example:
+                print(body.points()[:1])
+                Output: [[0. 142.3 4.1]]
+        """
+        import numpy as np
+
+        points = self._meshFn().getPoints(open_maya_api.toMSpace(space))
+        return np.array(points, dtype=np.float64).reshape(-1, 4)[:, :3]
+
+    def setPoints(self, points, space="world"):
+        """ Move every vertex with one setPoints call, as a single undo step.
+
+            Args:
+                points (list/numpy.ndarray): Shape (N, 3), one position per vertex.
+                space (str): "world" or "object".
+
+            Example:
+                body.setPoints(body.points(space="object") * [-1, 1, 1], space="object")
+        """
+        fnMesh = self._meshFn()
+        points = [list(point)[:3] for point in points]
+        if len(points) != fnMesh.numVertices:
+            raise ValueError(">>> {0} has {1} vertices, got {2} points".format(
+                self.fullPath, fnMesh.numVertices, len(points)))
+
+        # MFnMesh edits skip the undo queue, keep the object space points to put back
+        previous = fnMesh.getPoints(om2.MSpace.kObject)
+        points = om2.MPointArray(points)
+        mSpace = open_maya_api.toMSpace(space)
+
+        def apply(positions, positionSpace):
+            fnMesh = self._meshFn()
+            fnMesh.setPoints(positions, positionSpace)
+            fnMesh.updateSurface()
+
+        modifier_command.run(modifier_command.Call_Edit(
+            lambda: apply(points, mSpace), lambda: apply(previous, om2.MSpace.kObject)))
+
+    # ------------------------------------------------------------------------------------------------- ADJACENCY
+    def faceVertices(self):
+        """ The vertices of every face, straight from MFnMesh.getVertices.
+
+            Returns:
+                tuple: (counts, indices) arrays, face i uses the next counts[i] indices.
+        """
+        import numpy as np
+
+        counts, indices = self._meshFn().getVertices()
+        return np.array(counts, dtype=np.int32), np.array(indices, dtype=np.int32)
+
+    def vertexPairs(self):
+        """ The two vertices of every edge, worked out from the faces without any string.
+        Sorted by vertex rather than in edge id order.
+
+            Returns:
+                numpy.ndarray: Shape (E, 2), the lower vertex first.
+        """
+        import numpy as np
+
+        counts, indices = self.faceVertices()
+        starts = np.repeat(np.cumsum(counts) - counts, counts)
+        local = np.arange(len(indices)) - starts
+        following = indices[starts + (local + 1) % np.repeat(counts, counts)]
+
+        pairs = np.sort(np.stack([indices, following], axis=1), axis=1)
+        return np.unique(pairs, axis=0)
+
+    def vertexNeighbours(self):
+        """ The vertices sharing an edge with each vertex, in CSR form.
+
+            Returns:
+                tuple: (offsets, neighbours) arrays, the neighbours of vertex i are
+                    neighbours[offsets[i]:offsets[i + 1]].
+
+            Example:
+                offsets, neighbours = body.vertexNeighbours()
+                print(neighbours[offsets[12]:offsets[13]])
+                Output: [11 13 52 1012]
+        """
+        import numpy as np
+
+        pairs = self.vertexPairs()
+        sources = np.concatenate([pairs[:, 0], pairs[:, 1]])
+        targets = np.concatenate([pairs[:, 1], pairs[:, 0]])
+
+        order = np.lexsort((targets, sources))
+        offsets = np.zeros(self.vertexCount + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=self.vertexCount), out=offsets[1:])
+        return offsets, targets[order].astype(np.int32)
 
     # ------------------------------------------------------------------------------------------------- TYPE
 
@@ -49,7 +179,7 @@ class Mesh(Dag_Node):
     @property
     def joints(self):
         if self.skinCluster.exists():
-            influences = [Dag_Node(i) for i in cmds.skinCluster(self.skinCluster, q=1, inf=1)]
+            influences = Dag_Node.fromNames(cmds.skinCluster(self.skinCluster, q=1, inf=1))
             return influences
 
     @property
@@ -87,26 +217,64 @@ class Mesh(Dag_Node):
     def copyWeightsFrom(self, item):
         Mesh(item).copyWeightsTo(self)
 
-    def saveSkinWeights(self, weightsFolder):
+    def saveSkinWeights(self, weightsFolder, fileFormat=None):
+        """ Save the skin weights, as a binary .npz when NumPy is available and as XML otherwise.
+
+            Args:
+                weightsFolder (str): The folder to save in.
+                fileFormat (str): Force weights.FORMAT_BINARY or weights.FORMAT_XML.(optional)
+        """
         geoObject = str(self.node)
         geoSkinClusterNode = str(self.skinCluster)
         if not geoSkinClusterNode:
             print('# no skinCluster found on %s, skipping saving skin weights' % geoObject)
             return
         influences = [str(joint.node) for joint in self.joints]
-        weights.saveWeights(geoObject, weightsFolder, geoSkinClusterNode, influences)
+        return weights.saveWeights(geoObject, weightsFolder, geoSkinClusterNode, influences, fileFormat=fileFormat)
 
     def loadSkinWeights(self, weightsFolder):
+        """ Load the skin weights from whichever format was saved, the binary one first."""
         geoObject = str(self.node)
-        weights.loadWeights(geoObject, weightsFolder)
+        return weights.loadWeights(geoObject, weightsFolder)
+
+    @classmethod
+    def saveSkinWeightsMany(cls, meshes, weightsFolder, fileFormat=None, workers=4, incremental=True):
+        """ Save the skin weights of many meshes, writing the files on a thread pool while
+        the next skinCluster is read. Meshes without a skinCluster are skipped, and so are
+        the meshes whose weights did not change since the last save when incremental.
+
+            Example:
+                Mesh.saveSkinWeightsMany(modelGrp.iterDescendants(type="mesh"), weightsFolder)
+        """
+        entries = []
+        for mesh in _uniqueMeshes(meshes):
+            skinCluster = str(mesh.skinCluster)
+            if not skinCluster:
+                print('# no skinCluster found on %s, skipping saving skin weights' % mesh.node)
+                continue
+            entries.append((str(mesh.node), skinCluster, [str(joint.node) for joint in mesh.joints]))
+
+        return weights.saveWeightsMany(entries, weightsFolder, fileFormat=fileFormat, workers=workers,
+                                       incremental=incremental)
+
+    @classmethod
+    def loadSkinWeightsMany(cls, meshes, weightsFolder, workers=4):
+        """ Load the skin weights of many meshes, decoding the files on a thread pool while
+        the skinClusters are built and weighted on the main thread.
+
+            Example:
+                Mesh.loadSkinWeightsMany(modelGrp.iterDescendants(type="mesh"), weightsFolder)
+        """
+        geoObjects = [str(mesh.node) for mesh in _uniqueMeshes(meshes)]
+        return weights.loadWeightsMany(geoObjects, weightsFolder, workers=workers)
 
     # ------------------------------------------------------------------------------------------------- TOPOLOGY
     def deleteTweaks(self):
         if self.exists():
-            tweaks = list(set([i.name for i in self.history if cmds.objectType(i.name) == "tweak"]))
+            tweaks = set(i for i in self.history if i.type == "tweak")
 
             if tweaks:
-                cmds.delete(tweaks)
+                cmds.delete([i.fullPath for i in tweaks])
 
     # ------------------------------------------------------------------------------------------------- DUPLICATE
     def duplicate(self, **kwargs):
@@ -114,3 +282,8 @@ class Mesh(Dag_Node):
             raise ValueError(">>> No item to duplicate")
 
         return Mesh(cmds.duplicate(self.fullPath, **kwargs)[0])
+
+
+def _uniqueMeshes(meshes):
+    """Wrap meshes or their shapes once per transform, in a stable order."""
+    return sorted(set(Mesh(mesh) for mesh in meshes), key=lambda mesh: mesh.fullPath)
@@ -0,0 +1,149 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Tests for our batched attribute edits
+"""
+
+from modules.nodel import Dag_Node as Dag, batch, disconnect, rewire
+from modules.nodel.base import attribute_batch
+
+import maya.cmds as cmds
+import numpy as np
+
+import unittest
+
+
+class Test_Attribute_Batch(unittest.TestCase):
+    def setUp(self):
+        self.sphereName = "sphere_GEO"
+        self.sphere = Dag(cmds.polySphere(n=self.sphereName)[0])
+
+        self.cubeName = "cube_GEO"
+        self.cube = Dag(cmds.polyCube(n=self.cubeName)[0])
+
+    def tearDown(self) -> None:
+        self.sphere.delete()
+        self.cube.delete()
+
+    def test_batch_queues_until_exit(self):
+        with batch() as edits:
+            self.sphere.a.tx >> self.cube.a.tx
+            self.sphere.a.r >> self.cube.a.r
+            self.cube.a.sy.set(2)
+            self.assertFalse(cmds.isConnected(self.sphere.a.tx, self.cube.a.tx))
+
+        self.assertEqual(edits.count, 5)
+        self.assertTrue(cmds.isConnected(self.sphere.a.tx, self.cube.a.tx))
+        self.assertTrue(cmds.isConnected(self.sphere.a.rz, self.cube.a.rz))
+        self.assertEqual(self.cube.a.sy.get(), 2)
+        self.assertIsNone(attribute_batch.current())
+
+    def test_batch_disconnect(self):
+        self.sphere.a.tx >> self.cube.a.tx
+        with batch():
+            self.cube.a.tx.disconnect()
+            self.sphere.a.ty >> self.cube.a.ty
+
+        self.assertFalse(cmds.isConnected(self.sphere.a.tx, self.cube.a.tx))
+        self.assertTrue(cmds.isConnected(self.sphere.a.ty, self.cube.a.ty))
+
+    def test_batch_nothing_applied_on_error(self):
+        with self.assertRaises(ValueError):
+            with batch():
+                self.sphere.a.tx >> self.cube.a.tx
+                self.sphere.a.t >> self.cube.a.ty
+
+        self.assertFalse(cmds.isConnected(self.sphere.a.tx, self.cube.a.tx))
+
+    def test_batch_locked(self):
+        self.cube.a.tx.set(l=True)
+        with self.assertRaises(ValueError):
+            with batch():
+                self.sphere.a.tx >> self.cube.a.tx
+
+    def test_batch_flags_keep_order(self):
+        with batch():
+            self.cube.a.tz.set(3)
+            self.cube.a.tz.set(l=True, k=False)
+
+        self.assertEqual(self.cube.a.tz.get(), 3)
+        self.assertTrue(self.cube.a.tz.get(l=True))
+
+    def test_batch_melValue(self):
+        self.assertEqual(attribute_batch._melValue(np.float64(1.5)), "1.5")
+        self.assertEqual(attribute_batch._melValue((np.int64(3), True, "a")), '3 1 "a"')
+
+        with self.assertRaises(ValueError):
+            attribute_batch._melValue(object())
+
+    def test_batch_nested(self):
+        with batch() as outer:
+            with batch() as inner:
+                self.sphere.a.tx >> self.cube.a.tx
+            self.assertIs(outer, inner)
+            self.assertFalse(cmds.isConnected(self.sphere.a.tx, self.cube.a.tx))
+
+        self.assertTrue(cmds.isConnected(self.sphere.a.tx, self.cube.a.tx))
+
+    def test_batch_undo(self):
+        with batch():
+            self.sphere.a.tx >> self.cube.a.tx
+            self.sphere.a.r >> self.cube.a.r
+            self.cube.a.sy.set(2)
+            self.cube.a.sz.set(l=True)
+
+        cmds.undo()
+        self.assertFalse(cmds.isConnected(self.sphere.a.tx, self.cube.a.tx))
+        self.assertFalse(cmds.isConnected(self.sphere.a.rz, self.cube.a.rz))
+        self.assertEqual(self.cube.a.sy.get(), 1)
+        self.assertFalse(self.cube.a.sz.get(l=True))
+
+        cmds.redo()
+        self.assertTrue(cmds.isConnected(self.sphere.a.tx, self.cube.a.tx))
+        self.assertEqual(self.cube.a.sy.get(), 2)
+
+
+class Test_Attribute_Rewire(unittest.TestCase):
+    def setUp(self):
+        self.sphere = Dag(cmds.polySphere(n="sphere_GEO")[0])
+        self.cube = Dag(cmds.polyCube(n="cube_GEO")[0])
+        self.cone = Dag(cmds.polyCone(n="cone_GEO")[0])
+
+        self.sphere.a.tx >> self.cube.a.tx
+        self.sphere.a.r >> self.cube.a.r
+        self.sphere.a.sy >> self.cone.a.sy
+
+    def tearDown(self) -> None:
+        for node in (self.sphere, self.cube, self.cone):
+            node.delete()
+
+    def test_disconnect_many(self):
+        self.assertEqual(disconnect([self.cube.a.tx, self.cube.a.r]), 2)
+        self.assertFalse(cmds.isConnected(self.sphere.a.tx, self.cube.a.tx))
+        self.assertFalse(cmds.isConnected(self.sphere.a.r, self.cube.a.r))
+        self.assertTrue(cmds.isConnected(self.sphere.a.sy, self.cone.a.sy))
+
+    def test_disconnectAll_outputs(self):
+        self.assertEqual(self.sphere.a.disconnectAll(inputs=False, outputs=True), 3)
+        self.assertFalse(cmds.listConnections(self.cube.a.r, source=True, destination=False))
+        self.assertFalse(cmds.isConnected(self.sphere.a.sy, self.cone.a.sy))
+
+    def test_disconnectAll_inputs_only(self):
+        self.cube.a.disconnectAll()
+        self.assertFalse(cmds.isConnected(self.sphere.a.tx, self.cube.a.tx))
+        self.assertTrue(cmds.isConnected(self.sphere.a.sy, self.cone.a.sy))
+
+    def test_rewire_attribute(self):
+        self.assertEqual(rewire(self.sphere.a.r, self.cone.a.r), 1)
+        self.assertTrue(cmds.isConnected(self.cone.a.r, self.cube.a.r))
+        self.assertTrue(cmds.isConnected(self.sphere.a.tx, self.cube.a.tx))
+
+    def test_rewire_node(self):
+        rewire(self.sphere, self.cone)
+        self.assertTrue(cmds.isConnected(self.cone.a.tx, self.cube.a.tx))
+        self.assertTrue(cmds.isConnected(self.cone.a.r, self.cube.a.r))
+        self.assertFalse(cmds.listConnections(self.sphere.a.sy, source=False, destination=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Tests for our lazy attribute expressions
+"""
+
+from modules.nodel import Dag_Node as Dag, lazy
+from modules.nodel.base import attribute_expression, node_cost
+from modules.nodel.base.attribute_expression import Expression
+
+import maya.cmds as cmds
+
+import unittest
+
+
+class Test_Attribute_Expression(unittest.TestCase):
+    def setUp(self):
+        self.sphereName = "sphere_GEO"
+        self.sphere = Dag(cmds.polySphere(n=self.sphereName)[0])
+        self.sphere.a.t.set(1, 2, 3)
+
+        self.cubeName = "cube_GEO"
+        self.cube = Dag(cmds.polyCube(n=self.cubeName)[0])
+
+    def tearDown(self) -> None:
+        for node in cmds.ls(type=[i for i in node_cost.COSTS if node_cost.isAvailable(i)]):
+            if node.startswith(self.sphereName):
+                cmds.delete(node)
+        self.sphere.delete()
+        self.cube.delete()
+
+    def test_expression_eager_by_default(self):
+        self.assertFalse(attribute_expression.isLazy())
+        self.assertNotIsInstance(self.sphere.a.tx * 2, Expression)
+
+    def test_expression_lazy_builds_no_nodes(self):
+        before = len(cmds.ls(type="multDoubleLinear"))
+        with lazy():
+            expression = self.sphere.a.tx * 2
+        self.assertIsInstance(expression, Expression)
+        self.assertEqual(len(cmds.ls(type="multDoubleLinear")), before)
+
+    def test_expression_constant_folding(self):
+        with lazy():
+            expression = self.sphere.a.tx * 2 * 3 / 6 + 0
+        self.assertEqual(attribute_expression.simplify(expression).operation, attribute_expression.PLUG)
+
+        folded = attribute_expression.simplify(Expression.wrap(2) * 3 + 1)
+        self.assertEqual(folded.operands, 7)
+
+    def test_expression_dead_branch(self):
+        with lazy():
+            (self.sphere.a.tx + self.sphere.a.ty) * 0 >> self.cube.a.tx
+        self.assertIsNone(self.cube.a.tx.connectionInput)
+        self.assertEqual(self.cube.a.tx.get(), 0)
+
+    def test_expression_flatten_sum(self):
+        before = len(cmds.ls(type="plusMinusAverage"))
+        with lazy():
+            self.sphere.a.tx + self.sphere.a.ty + self.sphere.a.tz + 4 >> self.cube.a.tx
+        self.assertEqual(len(cmds.ls(type="plusMinusAverage")), before + 1)
+        self.assertAlmostEqual(self.cube.a.tx.get(), 10)
+
+    def test_expression_subtract(self):
+        with lazy():
+            self.sphere.a.tz - self.sphere.a.tx - 1 >> self.cube.a.tx
+            self.sphere.a.tx + self.sphere.a.ty - self.sphere.a.tz >> self.cube.a.ty
+        self.assertAlmostEqual(self.cube.a.tx.get(), 1)
+        self.assertAlmostEqual(self.cube.a.ty.get(), 0)
+
+    def test_expression_product_and_divide(self):
+        with lazy():
+            self.sphere.a.ty * self.sphere.a.tz / self.sphere.a.ty * 2 >> self.cube.a.tx
+            self.sphere.a.tz ** 2 >> self.cube.a.ty
+        self.assertAlmostEqual(self.cube.a.tx.get(), 6)
+        self.assertAlmostEqual(self.cube.a.ty.get(), 9)
+
+    def test_expression_compound(self):
+        with lazy():
+            self.sphere.a.t * 2 + 1 >> self.cube.a.t
+        self.assertEqual(self.cube.a.t.get(), [(3.0, 5.0, 7.0)])
+
+    def test_expression_attribute_paths(self):
+        with lazy():
+            expression = self.sphere.a.tx + "sphere_GEO.ty" - "sphere_GEO.tz" + 4
+            (expression * "sphere_GEO.tz") >> self.cube.a.tx
+        self.assertAlmostEqual(self.cube.a.tx.get(), 12)
+        self.assertEqual(expression.firstPlug.fullPath, self.sphere.a.tx.fullPath)
+
+        with lazy():
+            self.assertRaises(ValueError, Expression.wrap, "sphere_GEO.missingAttr")
+
+    def test_expression_mixed_compound(self):
+        with lazy():
+            expression = self.sphere.a.t + self.sphere.a.tx
+        self.assertRaises(ValueError, expression.compile)
+
+    def test_expression_compiles_once(self):
+        with lazy():
+            expression = self.sphere.a.tx + self.sphere.a.ty
+        self.assertIs(expression.compile(), expression.compile())
+        self.assertEqual(expression.node.type, "plusMinusAverage")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,7 +10,7 @@ import maya.cmds as cmds
 
 import unittest
 
-from modules.nodel.base.attribute_base import Attribute
+from modules.nodel.base.attribute_base import Attribute, Attributes
 
 
 class Test_Attributes_Base(unittest.TestCase):
@@ -48,6 +48,25 @@ class Test_Attributes(Test_Attributes_Base):
     def test_attributes__getattr__(self):
         self.assertTrue(isinstance(self.sphere.a.rx, Attribute))
 
+    def test_attributes_cache(self):
+        self.assertIs(self.sphere.a, self.sphere.a)
+        self.assertIs(self.sphere.a.tx, self.sphere.a["tx"])
+
+        attr = self.sphere.a.tx
+        self.sphere.rename("sphere_002_GEO")
+        self.assertIsNot(self.sphere.a.tx, attr)
+        self.assertEqual(self.sphere.a.tx.fullPath, "|sphere_GEO_OFF_GRP|sphere_002_GEO.tx")
+        self.sphere.rename(self.sphereName)
+
+    def test_attributes_cache_add_delete(self):
+        missing = self.sphere.a.attr_item_2
+        self.sphere.a.add(ln="attr_item_2", at="float", k=1)
+        self.assertIsNot(self.sphere.a.attr_item_2, missing)
+        self.assertTrue(self.sphere.a.attr_item_2.exists())
+
+        self.sphere.a.attr_item_2.delete()
+        self.assertFalse(self.sphere.a.attr_item_2.exists())
+
     def test_attributes_list(self):
         expectedResult = ["message", "caching"]
         expectedResultLength = 200
@@ -65,6 +84,37 @@ class Test_Attributes(Test_Attributes_Base):
         self.sphere.a.attr_item_1.delete()
         self.assertFalse(self.sphere.a.attr_item_1.exists())
 
+    def test_attributes_getMany_setMany(self):
+        self.sphere.a.setMany({"tx": 5, "ry": 45, "s": (1, 2, 3)})
+        result = self.sphere.a.getMany(["tx", "ry", "s"])
+        self.assertEqual(result["tx"], 5)
+        self.assertEqual(round(result["ry"], 4), 45)
+        self.assertEqual(result["s"], [(1, 2, 3)])
+
+    def test_attributes_setMany_state(self):
+        attrs = ["tx", "ty", "tz"]
+        self.sphere.a.setMany(attrs, lock=True, keyable=False, channelBox=False)
+        for attr in attrs:
+            self.assertTrue(cmds.getAttr(self.sphere.a[attr].fullPath, lock=True))
+            self.assertFalse(cmds.getAttr(self.sphere.a[attr].fullPath, keyable=True))
+
+        self.sphere.a.setMany({"tx": 3}, lock=False)
+        self.assertEqual(self.sphere.a.tx.get(), 3)
+        self.assertFalse(cmds.getAttr(self.sphere.a.tx.fullPath, lock=True))
+
+    def test_attributes_setBulk(self):
+        Attributes.setBulk({self.sphereName: {"tx": 7}, self.cubeName: {"tx": 8, "v": 0}})
+        self.assertEqual(self.sphere.a.tx.get(), 7)
+        self.assertEqual(self.cube.a.tx.get(), 8)
+        self.assertEqual(self.cube.a.v.get(), False)
+
+    def test_attributes_setMany_undo(self):
+        self.sphere.a.setMany({"tx": 5, "ty": 6}, lock=True, keyable=False)
+        cmds.undo()
+        self.assertEqual(self.sphere.a.getMany(["tx", "ty"]), {"tx": 1, "ty": 1})
+        self.assertFalse(cmds.getAttr(self.sphere.a.tx.fullPath, lock=True))
+        self.assertTrue(cmds.getAttr(self.sphere.a.ty.fullPath, keyable=True))
+
     def test_attributes_zeroAttributes(self):
         self.assertEqual(self.sphere.a.rx.get(), 1)
         self.sphere.a.zeroAttributes()
@@ -250,6 +300,46 @@ class Test_Attribute_Base(Test_Attributes_Base):
         self.assertEqual(self.sphere.a.rx.get(), 1)
         self.assertEqual(self.cube.a.ry.get(), 2)
 
+    def test_attribute_plug(self):
+        plug = self.sphere.a.rx.plug
+        self.assertEqual(plug.partialName(False, False, False, False, False, True), "rotateX")
+        self.assertIsNone(self.sphere.a.attr_item_2.plug)
+
+    def test_attribute_get_set_plug_values(self):
+        self.sphere.a.t.set(1, 2, 3)
+        self.assertEqual(self.sphere.a.t.get(), [(1, 2, 3)])
+        self.assertEqual(self.sphere.a.t.get(), cmds.getAttr(self.sphere.a.t.fullPath))
+
+        self.sphere.a.rx.set(90)
+        self.assertEqual(round(self.sphere.a.rx.get(), 4), 90)
+
+        self.sphere.a.v.set(False)
+        self.assertEqual(self.sphere.a.v.get(), False)
+
+        matrix = self.sphere.a.matrix.get()
+        self.assertEqual(len(matrix), 16)
+        self.assertEqual([round(i, 4) for i in matrix], [round(i, 4) for i in cmds.getAttr(self.sphere.a.matrix)])
+
+    def test_attribute_set_undo(self):
+        self.sphere.a.t.set(4, 5, 6)
+        self.sphere.a.rx.set(30)
+        cmds.undo()
+        self.assertEqual(round(self.sphere.a.rx.get(), 4), 1)
+        cmds.undo()
+        self.assertEqual(self.sphere.a.t.get(), [(1, 1, 1)])
+        cmds.redo()
+        self.assertEqual(self.sphere.a.t.get(), [(4, 5, 6)])
+
+    def test_attribute_set_connected_RuntimeError(self):
+        self.cube.a.tx >> self.plane.a.tx
+        with self.assertRaises(RuntimeError):
+            self.plane.a.tx.set(5)
+
+    def test_attribute_set_parent_connected_RuntimeError(self):
+        self.cube.a.t >> self.plane.a.t
+        with self.assertRaises(RuntimeError):
+            self.plane.a.tx.set(5)
+
     def test_attribute_set_AttributeError(self):
         with self.assertRaises(AttributeError):
             self.sphere.set(2) # AttributeError: 'Dag_Node' object has no attribute 'set'
@@ -286,6 +376,37 @@ class Test_Attribute_Base(Test_Attributes_Base):
         self.assertEqual(self.sphere.a.rx.parent, self.sphere.a.r)
 
 
+    def test_attribute_schema(self):
+        schema = self.sphere.a.r.schema
+        self.assertEqual(schema.children, ("rotateX", "rotateY", "rotateZ"))
+        self.assertIsNone(schema.parent)
+        self.assertFalse(schema.multi)
+        self.assertEqual(self.sphere.a.rx.schema.parent, "rotate")
+
+        # Static attributes are shared between nodes of the same type
+        self.assertIs(self.cube.a.r.schema, schema)
+
+    def test_attribute_schema_dynamic(self):
+        self.sphere.a.add(ln="attr_item_3", at="double3")
+        self.sphere.a.add(ln="attr_item_3X", at="double", p="attr_item_3")
+        self.sphere.a.add(ln="attr_item_3Y", at="double", p="attr_item_3")
+        self.sphere.a.add(ln="attr_item_3Z", at="double", p="attr_item_3")
+
+        self.assertEqual(len(self.sphere.a.attr_item_3.children), 3)
+        self.assertTrue(self.sphere.a.attr_item_3.schema.dynamic)
+        self.assertIsNone(self.cube.a.attr_item_3.schema)
+
+        self.sphere.a.attr_item_3.delete()
+        self.assertIsNone(self.sphere.a.attr_item_3.schema)
+
+    def test_attribute_schema_deleted_outside(self):
+        self.sphere.a.add(ln="attr_item_4", at="double", k=1)
+        self.assertTrue(self.sphere.a.attr_item_4.schema.dynamic)
+
+        cmds.deleteAttr(self.sphere.fullPath, attribute="attr_item_4")
+        self.assertIsNone(self.sphere.a.attr_item_4.schema)
+        self.assertEqual(self.sphere.a.attr_item_4.children, [])
+
     def test_attribute_connectionInput(self):
         self.cube.a.t >> self.sphere.a.t
         self.cube.a.t >> self.plane.a.t
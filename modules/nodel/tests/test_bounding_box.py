@@ -0,0 +1,55 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Tests for our bounding box value
+"""
+
+from modules.nodel import Bounding_Box
+
+import unittest
+
+
+class Test_Bounding_Box(unittest.TestCase):
+    def setUp(self):
+        self.box = Bounding_Box([-1, -2, -3, 1, 2, 3])
+
+    def test_bounding_box_minMax(self):
+        self.assertEqual(self.box.min, (-1, -2, -3))
+        self.assertEqual(self.box.max, (1, 2, 3))
+        self.assertEqual(Bounding_Box.fromMinMax(self.box.min, self.box.max), self.box)
+
+    def test_bounding_box_size(self):
+        self.assertEqual(self.box.size, (2, 4, 6))
+        self.assertEqual((self.box.width, self.box.height, self.box.depth), (2, 4, 6))
+        self.assertEqual(self.box.volume, 48)
+
+    def test_bounding_box_centre(self):
+        self.assertEqual(Bounding_Box([0, 0, 0, 2, 4, 6]).centre, (1, 2, 3))
+        self.assertEqual(self.box.center, self.box.centre)
+
+    def test_bounding_box_indexes_like_xform(self):
+        self.assertEqual(self.box[3] - self.box[0], 2)
+        self.assertEqual(list(self.box), [-1, -2, -3, 1, 2, 3])
+        self.assertEqual(self.box, [-1, -2, -3, 1, 2, 3])
+
+    def test_bounding_box_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.box._values = (0,) * 6
+        with self.assertRaises(TypeError):
+            self.box[0] = 5
+
+    def test_bounding_box_wrong_size(self):
+        with self.assertRaises(ValueError):
+            Bounding_Box([0, 0, 0])
+
+    def test_bounding_box_contains(self):
+        self.assertTrue(self.box.contains((1, 0, -3)))
+        self.assertFalse(self.box.contains((1.1, 0, 0)))
+
+    def test_bounding_box_union(self):
+        other = Bounding_Box([0, 0, 0, 5, 1, 1])
+        self.assertEqual(self.box.union(other), [-1, -2, -3, 5, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Tests for our compact component containers
+"""
+
+from modules.nodel import Components
+
+import unittest
+
+
+class Test_Components(unittest.TestCase):
+    def setUp(self):
+        self.vertices = Components("body_GEO", "vtx", range(10))
+
+    def test_components_names(self):
+        self.assertEqual(len(self.vertices), 10)
+        self.assertEqual(self.vertices[3], "body_GEO.vtx[3]")
+        self.assertEqual(self.vertices[-1], "body_GEO.vtx[9]")
+        self.assertEqual(self.vertices[0:2], ["body_GEO.vtx[0]", "body_GEO.vtx[1]"])
+        self.assertEqual(self.vertices.names()[5], "body_GEO.vtx[5]")
+
+    def test_components_contains(self):
+        self.assertIn(4, self.vertices)
+        self.assertIn("body_GEO.vtx[4]", self.vertices)
+        self.assertNotIn("body_GEO.e[4]", self.vertices)
+        self.assertNotIn(10, self.vertices)
+        self.assertNotIn("other_GEO.vtx[3]", self.vertices)
+        self.assertIn("body_GEO.vtx[2:9]", self.vertices)
+        self.assertNotIn("body_GEO.vtx[3:40]", self.vertices)
+        self.assertNotIn("body_GEO.vtx[5:7]", self.vertices.subset([5, 7]))
+
+    def test_components_ranges(self):
+        self.assertEqual(self.vertices.ranges(), ["body_GEO.vtx[0:9]"])
+        self.assertEqual(self.vertices.subset([0, 1, 2, 7]).ranges(), ["body_GEO.vtx[0:2]", "body_GEO.vtx[7]"])
+        self.assertEqual(self.vertices.subset([]).ranges(), [])
+        self.assertEqual(self.vertices.subset([3, 3, 4]).ranges(), ["body_GEO.vtx[3:4]"])
+
+    def test_components_fromNames(self):
+        components = Components.fromNames(["body_GEO.vtx[3:5]", "body_GEO.vtx[9]"])
+        self.assertEqual(list(components.indices), [3, 4, 5, 9])
+        self.assertEqual(components.kind, "vtx")
+
+        with self.assertRaises(ValueError):
+            Components.fromNames(["body_GEO.vtx[3]", "body_GEO.f[1]"])
+        with self.assertRaises(ValueError):
+            Components.fromNames(["body_GEO"])
+
+
+if __name__ == "__main__":
+    unittest.main()
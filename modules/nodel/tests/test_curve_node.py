@@ -0,0 +1,78 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Tests for our Curve Node Functionality
+"""
+
+from modules.nodel import Curve
+
+import maya.cmds as cmds
+import numpy as np
+
+import unittest
+
+
+class Test_Curve(unittest.TestCase):
+    def setUp(self):
+        self.line = Curve(cmds.curve(n="line_CRV", d=1, p=[(0, 0, 0), (0, 5, 0), (0, 10, 0)]))
+        self.line.a.tx.set(2)
+
+        self.circle = Curve(cmds.circle(n="circle_CRV", nr=(0, 1, 0), r=2, ch=0)[0])
+
+    def tearDown(self) -> None:
+        self.line.delete()
+        self.circle.delete()
+
+    def test_curve_getPoints(self):
+        self.assertEqual(self.line.getPoints().tolist(), [[2, 0, 0], [2, 5, 0], [2, 10, 0]])
+        self.assertEqual(self.line.getPoints(space="object")[:, 0].tolist(), [0, 0, 0])
+        self.assertEqual(self.circle.getPoints().shape, (8, 3))
+
+    def test_curve_cvPositions(self):
+        self.assertEqual(self.line.cvPositions, [(2, 0, 0), (2, 5, 0), (2, 10, 0)])
+
+    def test_curve_setPoints(self):
+        points = self.circle.getPoints(space="object")
+        self.circle.setPoints(points * 2, space="object")
+        self.assertTrue(np.allclose(self.circle.getPoints(space="object"), points * 2))
+
+        with self.assertRaises(ValueError):
+            self.circle.setPoints(points[:3])
+
+    def test_curve_setPoints_undo(self):
+        points = self.circle.getPoints(space="object")
+        self.circle.setPoints(points * 2, space="object")
+        cmds.undo()
+        self.assertTrue(np.allclose(self.circle.getPoints(space="object"), points))
+
+        cmds.redo()
+        self.assertTrue(np.allclose(self.circle.getPoints(space="object"), points * 2))
+
+    def test_curve_epPosition(self):
+        self.assertEqual(len(self.circle.epPosition), len(cmds.ls(self.circle.fullPath + ".ep[*]", fl=1)))
+        self.assertEqual([list(i) for i in self.line.epPosition], [[2, 0, 0], [2, 5, 0], [2, 10, 0]])
+
+    def test_curve_sampleParameters(self):
+        parameters, points = self.line.sampleParameters(5)
+        self.assertEqual(parameters.tolist(), [0, 0.5, 1, 1.5, 2])
+        self.assertTrue(np.allclose(points[:, 1], [0, 2.5, 5, 7.5, 10]))
+
+    def test_curve_sampleArcLength(self):
+        self.assertAlmostEqual(self.line.length, 10)
+        parameters, points = self.line.sampleArcLength(3)
+        self.assertTrue(np.allclose(points, [[2, 0, 0], [2, 5, 0], [2, 10, 0]]))
+
+    def test_curve_closestPoints(self):
+        points, parameters = self.line.closestPoints([[5, 2.5, 0], [0, 20, 0]])
+        self.assertTrue(np.allclose(points, [[2, 2.5, 0], [2, 10, 0]]))
+        self.assertTrue(np.allclose(parameters, [0.5, 2]))
+
+    def test_curve_not_a_curve(self):
+        sphere = Curve(cmds.polySphere(n="sphere_GEO")[0])
+        with self.assertRaises(ValueError):
+            sphere.getPoints()
+        sphere.delete()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ Created:2023
 About: Tests for our Dag Dimension Functionality
 """
 
-from modules.nodel import Dag_Node as Dag
+from modules.nodel import Dag_Node as Dag, Bounding_Box, positions, bounds
 
 import maya.cmds as cmds
 
@@ -45,6 +45,19 @@ class Test_Object_Dimension(unittest.TestCase):
         testResult = lambda x: self.sphere.o.bb
         self.assertEqual(expectedResult.__code__.co_code, testResult.__code__.co_code)
 
+    def test_dag_dimension_boundingBox(self):
+        box = self.cube.o.boundingBox
+        self.assertIsInstance(box, Bounding_Box)
+        self.assertEqual([round(i, 4) for i in box.size], [1, 2, 3])
+        self.assertEqual(round(box.volume, 4), 6)
+
+    def test_dag_dimension_bounds(self):
+        self.cube.a.t.set(10, 0, 0)
+        result = bounds([self.sphere, self.cube])
+        self.assertEqual(result.shape, (2, 6))
+        self.assertEqual([round(i, 4) for i in result[1]], [9.5, -1, -1.5, 10.5, 1, 1.5])
+        self.assertEqual([round(i, 4) for i in bounds([self.cube], worldSpace=False)[0]], [-0.5, -1, -1.5, 0.5, 1, 1.5])
+
     def test_dag_dimension_width(self):
         self.assertEqual(round(self.sphere.o.width, 2), 2.0)
         self.assertEqual(round(self.cube.o.width, 2), 1.0)
@@ -71,6 +84,36 @@ class Test_Object_Dimension(unittest.TestCase):
         [self.sphere.a[i].set(1) for i in self.attrs]
         self.assertEqual(self.sphere.o.position, [1, 1, 1, 1, 1, 1])
 
+    def test_dag_dimension_position_pivot(self):
+        self.sphere.a.t.set(1, 2, 3)
+        self.sphere.o.copyPivotFrom(self.cube)
+        self.assertEqual([round(i, 4) for i in self.sphere.o.position], [0, 0, 0, 0, 0, 0])
+
+    def test_dag_dimension_position_no_temp_nodes(self):
+        before = len(cmds.ls())
+        self.sphere.o.position
+        self.assertEqual(len(cmds.ls()), before)
+
+    def test_dag_dimension_rotation(self):
+        self.sphere.a.r.set(10, 20, 30)
+        self.assertEqual([round(i, 4) for i in self.sphere.o.rotation], [10, 20, 30])
+
+    def test_dag_dimension_scale(self):
+        self.sphere.a.s.set(1, 2, -3)
+        self.assertEqual([round(abs(i), 4) for i in self.sphere.o.scale], [1, 2, 3])
+        self.assertLess(self.sphere.o.scale[0], 0)
+
+    def test_dag_dimension_positions(self):
+        self.cube.a.t.set(4, 5, 6)
+        self.cube.a.ry.set(45)
+        result = positions([self.sphere, self.cube])
+        self.assertEqual(result.shape, (2, 6))
+        self.assertEqual([round(i, 4) for i in result[1]], [4, 5, 6, 0, 45, 0])
+        self.assertEqual(result[1].tolist(), self.cube.o.position)
+
+        with self.assertRaises(ValueError):
+            positions(["missing_GEO"])
+
     def test_dag_dimension_copyPivotTo(self):
         tempDag = Dag(cmds.group(em=1, w=1))
         self.sphere.a.tx.set(1)
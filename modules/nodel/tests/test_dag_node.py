@@ -5,6 +5,7 @@ About: Tests for our Dag_Node Functionality
 """
 
 from modules.nodel import Dag_Node
+from modules.utils import benchmark
 
 import maya.cmds as cmds
 
@@ -83,6 +84,15 @@ class Test_Dag_Node(Test_Dag_Node_Base):
     def test_dag_node_shape(self):
         self.assertEqual(self.sphere.shape.name, self.sphereName + "Shape")
 
+    def test_dag_node_slots(self):
+        self.assertFalse(hasattr(self.sphere, "__dict__"))
+        self.assertFalse(hasattr(self.sphere.a, "__dict__"))
+        self.assertFalse(hasattr(self.sphere.a.tx, "__dict__"))
+
+        result = benchmark.wrapperMemory(Dag_Node, [self.sphereName, self.jointName])
+        self.assertEqual(result["count"], 2)
+        self.assertFalse(result["hasDict"])
+
 
 class Test_Dag_Node_Hierarchy(Test_Dag_Node_Base):
     def setUp(self) -> None:
@@ -117,6 +127,39 @@ class Test_Dag_Node_Hierarchy(Test_Dag_Node_Base):
     def test_dag_node_allChildren(self):
         self.assertEqual(len(self.grp1.allChildren), 7)
 
+    def test_dag_node_iterChildren(self):
+        children = self.grp1.iterChildren()
+        self.assertEqual(next(children), self.sphere)
+        self.assertEqual(len(list(children)), 4)
+
+    def test_dag_node_iterShapes(self):
+        shapes = list(self.sphere.iterShapes())
+        self.assertEqual(len(shapes), 1)
+        self.assertEqual(shapes[0].type, "mesh")
+        self.assertEqual(list(self.grp1.iterShapes()), [])
+
+    def test_dag_node_iter_instances(self):
+        instance = Dag_Node(cmds.instance(self.sphere.fullPath, n="sphere_INST")[0])
+        shape = next(instance.iterShapes())
+        original = next(self.sphere.iterShapes())
+
+        self.assertEqual(shape, original)
+        self.assertEqual(shape.parent.fullPath, instance.fullPath)
+        self.assertEqual(original.parent.fullPath, self.sphere.fullPath)
+        self.assertEqual(Dag_Node(shape.fullPath).fullPath, shape.fullPath)
+        self.assertIsNot(shape.dag, original.dag)
+
+        instance.delete()
+
+    def test_dag_node_iterDescendants(self):
+        self.assertEqual(len(list(self.grp1.iterDescendants())), 7)
+        self.assertEqual(len(list(self.grp1.iterDescendants(type="mesh"))), 1)
+
+        depthFirst = [i.name for i in self.grp1.iterDescendants(type="transform")]
+        breadthFirst = [i.name for i in self.grp1.iterDescendants(type="transform", depthFirst=False)]
+        self.assertEqual(sorted(depthFirst), sorted(breadthFirst))
+        self.assertLess(breadthFirst.index("OFFSET_6_GRP"), breadthFirst.index("OFFSET_5_GRP"))
+
     def test_dag_node_parent(self):
         self.assertEqual(Dag_Node(self.grp5).parent, Dag_Node(self.grp4))
 
@@ -125,6 +168,31 @@ class Test_Dag_Node_Hierarchy(Test_Dag_Node_Base):
         self.assertEqual(len(Dag_Node(self.grp4).allParents), 1)
         self.assertEqual(len(Dag_Node(self.grp5).allParents), 2)
 
+    def test_dag_node_iterParents(self):
+        parents = Dag_Node(self.grp5).iterParents()
+        self.assertEqual(next(parents), Dag_Node(self.grp4))
+        self.assertEqual(len(list(parents)), 1)
+        self.assertIsNone(self.grp1.parent)
+
+    def test_dag_node_depth(self):
+        self.assertEqual(self.grp1.depth, 0)
+        self.assertEqual(Dag_Node(self.grp5).depth, 2)
+
+    def test_dag_node_isDescendantOf(self):
+        self.assertTrue(Dag_Node(self.grp5).isDescendantOf(self.grp1))
+        self.assertTrue(Dag_Node(self.grp5).isDescendantOf(self.grp4))
+        self.assertFalse(Dag_Node(self.grp4).isDescendantOf(self.grp5))
+        self.assertFalse(Dag_Node(self.grp5).isDescendantOf(self.grp2))
+
+    def test_dag_node_commonAncestor(self):
+        self.assertEqual(Dag_Node(self.grp5).commonAncestor(self.grp2), self.grp1)
+        self.assertEqual(Dag_Node(self.grp5).commonAncestor(self.grp4), Dag_Node(self.grp4))
+        self.assertIsNone(self.grp1.commonAncestor(self.joint))
+
+    def test_dag_node_order(self):
+        self.assertEqual(self.sphere.order, 0)
+        self.assertEqual(Dag_Node(self.grp2).order, 1)
+
     def test_dag_node_order_and_reorder(self):
         self.assertTrue(self.sphere.order == 0)
         self.sphere.reorder(3)
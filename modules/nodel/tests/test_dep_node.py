@@ -46,6 +46,31 @@ class Test_Dep_Node(unittest.TestCase):
         self.assertTrue(self.sphere.path == self.sphereName)
         self.assertFalse(self.sphere == self.joint)
 
+    def test_dep_node__hash__(self):
+        self.assertEqual(hash(self.sphere), hash(self.object))
+        self.assertEqual(len({self.sphere, self.object, self.joint}), 2)
+        self.assertIn(Dep_Node(self.sphereName), {self.sphere: 1})
+
+    def test_dep_node__hash__stable(self):
+        nodes = {self.sphere, self.joint}
+        expected = hash(self.joint)
+        self.joint.delete()
+        self.assertEqual(hash(self.joint), expected)
+        self.assertIn(self.joint, nodes)
+        self.assertIn(self.sphere, nodes)
+
+    def test_dep_node__hash__create(self):
+        node = Dep_Node("hash_MD")
+        hash(node)
+        node.create("multiplyDivide")
+        self.assertEqual(hash(node), hash(Dep_Node("hash_MD")))
+        node.delete()
+
+    def test_dep_node__eq__after_rename(self):
+        self.object.rename("sphere_002")
+        self.assertTrue(self.sphere == self.object)
+        self.object.rename(self.sphereName)
+
     def test_dep_node_getter(self):
         self.assertEqual(self.sphere.node, self.sphereName)
         self.assertEqual(self.object.node, self.sphere.node)
@@ -116,6 +141,12 @@ class Test_Dep_Node(unittest.TestCase):
         self.assertFalse(self.object.exists())
         self.assertFalse(self.sphere.exists())
 
+    def test_dep_node_fromNames(self):
+        nodes = Dep_Node.fromNames([self.sphereName, self.jointName, "FAKE OBJECT"])
+        self.assertEqual(nodes[0], self.sphere)
+        self.assertEqual(nodes[1], self.joint)
+        self.assertFalse(nodes[2].exists())
+
     def test_dep_node_create_mutiplyDivide_node(self):
         mdNode = Dep_Node("geo_md", "multiplyDivide")
         self.assertTrue(mdNode.exists())
@@ -0,0 +1,94 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Tests for our common subexpression reuse
+"""
+
+from modules.nodel import Dag_Node as Dag, cseSession, lazy
+from modules.nodel.base import expression_cache, node_cost
+
+import maya.cmds as cmds
+
+import unittest
+
+
+class Test_Expression_Cache(unittest.TestCase):
+    def setUp(self):
+        self.sphereName = "sphere_GEO"
+        self.sphere = Dag(cmds.polySphere(n=self.sphereName)[0])
+        self.sphere.a.tx.set(2)
+
+        self.cubeName = "cube_GEO"
+        self.cube = Dag(cmds.polyCube(n=self.cubeName)[0])
+
+    def tearDown(self) -> None:
+        for node in cmds.ls(type=[i for i in node_cost.COSTS if node_cost.isAvailable(i)]):
+            if node.startswith(self.sphereName):
+                cmds.delete(node)
+        self.sphere.delete()
+        self.cube.delete()
+
+    def test_expression_cache_reuses_node(self):
+        with cseSession():
+            first = self.sphere.a.tx * 50
+            second = self.sphere.a.tx * 50
+            third = self.sphere.a.tx * 20
+            report = expression_cache.report()
+
+        self.assertEqual(first.node, second.node)
+        self.assertNotEqual(first.node, third.node)
+        self.assertEqual(report, {"created": 2, "saved": 1})
+
+    def test_expression_cache_commutative(self):
+        with cseSession():
+            first = self.sphere.a.tx + self.sphere.a.ty
+            second = self.sphere.a.ty + self.sphere.a.tx
+            third = self.sphere.a.tx - self.sphere.a.ty
+            fourth = self.sphere.a.ty - self.sphere.a.tx
+
+        self.assertEqual(first.node, second.node)
+        self.assertNotEqual(third.node, fourth.node)
+
+    def test_expression_cache_outside_session(self):
+        self.assertFalse(expression_cache.isActive())
+        self.assertIsNone(expression_cache.lookup("multDoubleLinear", None, [("input1", self.sphere.a.tx)]))
+
+    def test_expression_cache_rewired_node(self):
+        with cseSession():
+            first = self.sphere.a.tx * 50
+            self.cube.a.ty >> first.node.a.input2
+            second = self.sphere.a.tx * 50
+
+        self.assertNotEqual(first.node, second.node)
+
+    def test_expression_cache_same_source(self):
+        inputs = [("input1", self.sphere.a.tx), ("input2", 50)]
+        with cseSession():
+            output = self.sphere.a.tx * 50
+            entry = expression_cache._entries[expression_cache.makeKey("multDoubleLinear", None, inputs, True)]
+
+            self.assertTrue(entry.isSameSource(inputs, commutative=True))
+            self.assertFalse(entry.isSameSource([("input1", self.cube.a.tx), ("input2", 50)], commutative=True))
+            self.assertEqual(entry.output.node, output.node)
+
+    def test_expression_cache_shared_node_not_appended(self):
+        with cseSession():
+            first = self.sphere.a.tx + self.sphere.a.ty
+            second = self.sphere.a.tx + self.sphere.a.ty
+            third = second + self.sphere.a.tz
+
+        self.assertNotEqual(first.node, third.node)
+        self.assertEqual(cmds.getAttr(first.node.a.input1D, size=True), 2)
+
+    def test_expression_cache_lazy(self):
+        with cseSession(), lazy():
+            self.sphere.a.tx * self.sphere.a.ty + 1 >> self.cube.a.tx
+            self.sphere.a.tx * self.sphere.a.ty + 1 >> self.cube.a.ty
+            report = expression_cache.report()
+
+        self.assertEqual(report["saved"], 2)
+        self.assertEqual(self.cube.a.tx.connectionInput.node, self.cube.a.ty.connectionInput.node)
+
+
+if __name__ == "__main__":
+    unittest.main()
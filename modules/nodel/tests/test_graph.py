@@ -0,0 +1,117 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Tests for our dependency graph walker
+"""
+
+from modules.nodel import Dag_Node as Dag, Dep_Node as Dep, graph
+
+import maya.cmds as cmds
+
+import unittest
+
+
+class Test_Graph_Base(unittest.TestCase):
+    def setUp(self):
+        self.sphereName = "sphere_GEO"
+        self.sphere = Dag(cmds.polySphere(n=self.sphereName)[0])
+
+        self.cubeName = "cube_GEO"
+        self.cube = Dag(cmds.polyCube(n=self.cubeName)[0])
+
+        # sphere.tx -> mdl -> md -> cube.tx
+        self.mdl = Dep("graph_MDL", "multDoubleLinear")
+        self.md = Dep("graph_MD", "multiplyDivide")
+        self.sphere.a.tx >> self.mdl.a.input1
+        self.mdl.a.output >> self.md.a.input1X
+        self.md.a.outputX >> self.cube.a.tx
+
+    def tearDown(self) -> None:
+        for node in (self.mdl, self.md, self.sphere, self.cube):
+            if node.exists():
+                node.delete()
+
+
+class Test_Graph_Walk(Test_Graph_Base):
+    def test_graph_upstream(self):
+        nodes = [handle.nodeName for handle in graph.upstream(self.cube.a.tx)]
+        self.assertIn("graph_MD", nodes)
+        self.assertIn("graph_MDL", nodes)
+        self.assertIn(self.sphere.fullPath, nodes)
+
+    def test_graph_downstream(self):
+        handles = list(graph.downstream(self.sphere.a.tx, nodeTypes=["transform"]))
+        self.assertEqual(len(handles), 1)
+        self.assertEqual(handles[0].attribute().fullPath, self.cube.a.translateX.fullPath)
+
+    def test_graph_depth(self):
+        handles = list(graph.upstream(self.cube.a.tx, depth=1))
+        self.assertTrue(all(handle.depth <= 1 for handle in handles))
+        self.assertEqual(set(handle.nodeName for handle in handles), {"graph_MD"})
+
+    def test_graph_prune(self):
+        nodes = [handle.nodeName for handle in graph.upstream(self.cube.a.tx,
+                                                              prune=lambda h: h.nodeType == "multDoubleLinear")]
+        self.assertIn("graph_MDL", nodes)
+        self.assertNotIn(self.sphere.fullPath, nodes)
+
+    def test_graph_lazy(self):
+        walker = graph.upstream(self.cube.a.tx)
+        self.assertEqual(next(walker).nodeName, "graph_MD")
+
+
+class Test_Graph_Connections(Test_Graph_Base):
+    def test_graph_connectionInput(self):
+        source = self.mdl.a.input1.connectionInput
+        self.assertEqual(source.fullPath, self.sphere.a.translateX.fullPath)
+        self.assertIsInstance(self.md.a.input1X.connectionInput.node, Dep)
+        self.assertNotIsInstance(self.md.a.input1X.connectionInput.node, Dag)
+
+    def test_graph_connectionOutputs(self):
+        outputs = self.md.a.outputX.connectionOutputs
+        self.assertEqual(len(outputs), 1)
+        self.assertEqual(outputs[0].attr, "translateX")
+
+
+class Test_Graph_Snapshot(Test_Graph_Base):
+    def setUp(self):
+        super(Test_Graph_Snapshot, self).setUp()
+        self.snapshot = graph.snapshot()
+
+    def test_graph_snapshot_arrays(self):
+        self.assertEqual(len(self.snapshot.offsets), self.snapshot.nodeCount + 1)
+        self.assertEqual(self.snapshot.offsets[-1], self.snapshot.edgeCount)
+        self.assertEqual(self.snapshot.typeOf(self.snapshot.id("graph_MDL")), "multDoubleLinear")
+
+    def test_graph_snapshot_countByType(self):
+        counts = self.snapshot.countByType()
+        self.assertEqual(counts["multDoubleLinear"], len(cmds.ls(type="multDoubleLinear")))
+        self.assertEqual(sum(counts.values()), self.snapshot.nodeCount)
+
+    def test_graph_snapshot_downstream(self):
+        downstream = self.snapshot.downstream(self.snapshot.id("graph_MDL")).tolist()
+        self.assertIn(self.snapshot.id("graph_MD"), downstream)
+
+    def test_graph_snapshot_longestChain(self):
+        chain = self.snapshot.longestChain(sources=[self.sphere.fullPath], targets=[self.cube.fullPath])
+        self.assertEqual(chain, [self.sphere.fullPath, "graph_MDL", "graph_MD", self.cube.fullPath])
+        self.assertEqual(self.snapshot.longestChain(sources=[self.cube.fullPath], targets=["graph_MDL"]), [])
+
+    def test_graph_snapshot_fanOut(self):
+        self.sphere.a.tx >> self.cube.a.tz
+        self.sphere.a.ty >> Dep("graph_ADL", "addDoubleLinear").a.input1
+        snapshot = graph.snapshot()
+        fanOut = dict((name, count) for name, _, count in snapshot.fanOut(top=snapshot.nodeCount))
+        self.assertGreaterEqual(fanOut[self.sphere.fullPath], 3)
+        cmds.delete("graph_ADL")
+
+    def test_graph_snapshot_cycles(self):
+        self.assertFalse([i for i in self.snapshot.cycles() if "graph_MD" in i])
+        self.md.a.outputY >> self.mdl.a.input2
+        cycles = [i for i in graph.snapshot().cycles() if "graph_MD" in i]
+        self.assertEqual(len(cycles), 1)
+        self.assertEqual(set(cycles[0]), {"graph_MD", "graph_MDL"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ from modules.nodel import Dep_Node as Dep
 from modules.nodel import Mesh
 
 import maya.cmds as cmds
+import numpy as np
 
 import unittest
 
@@ -52,6 +53,65 @@ class Test_Mesh(unittest.TestCase):
         self.assertEqual(self.sphere.faces[0], self.sphereName + ".f[0]")
         self.assertEqual(self.sphere.faces[1], self.sphereName + ".f[1]")
 
+    def test_mesh_node_counts(self):
+        self.assertEqual(self.cube.vertexCount, 8)
+        self.assertEqual(self.cube.edgeCount, 12)
+        self.assertEqual(self.cube.faceCount, 6)
+        self.assertEqual(len(self.sphere.vertices), len(cmds.ls(self.sphere.fullPath + ".vtx[*]", fl=1)))
+
+    def test_mesh_node_components_ranges(self):
+        self.assertEqual(self.cube.faces.ranges(), [self.cubeName + ".f[0:5]"])
+
+    # ------------------------------------------------------------------------------------------------- POINTS
+    def test_mesh_node_points(self):
+        self.cube.a.ty.set(10)
+        points = self.cube.points()
+        self.assertEqual(points.shape, (8, 3))
+        self.assertEqual(points[:, 1].min(), 9)
+        self.assertEqual(self.cube.points(space="object")[:, 1].min(), -1)
+        self.assertEqual(points[0].tolist(), cmds.xform(self.cube.vertices[0], q=1, ws=1, t=1))
+
+    def test_mesh_node_setPoints(self):
+        points = self.cube.points(space="object")
+        self.cube.setPoints(points * 2, space="object")
+        self.assertTrue(np.allclose(self.cube.points(space="object"), points * 2))
+
+        with self.assertRaises(ValueError):
+            self.cube.setPoints(points[:2])
+
+    def test_mesh_node_setPoints_undo(self):
+        points = self.cube.points(space="object")
+        self.cube.setPoints(points * 2, space="object")
+        cmds.undo()
+        self.assertTrue(np.allclose(self.cube.points(space="object"), points))
+
+        cmds.redo()
+        self.assertTrue(np.allclose(self.cube.points(space="object"), points * 2))
+
+    # ------------------------------------------------------------------------------------------------- ADJACENCY
+    def test_mesh_node_faceVertices(self):
+        counts, indices = self.cube.faceVertices()
+        self.assertEqual(counts.tolist(), [4] * 6)
+        self.assertEqual(len(indices), 24)
+
+    def test_mesh_node_vertexPairs(self):
+        self.assertEqual(len(self.cube.vertexPairs()), self.cube.edgeCount)
+        self.assertEqual(len(self.sphere.vertexPairs()), self.sphere.edgeCount)
+
+    def test_mesh_node_vertexNeighbours(self):
+        offsets, neighbours = self.cube.vertexNeighbours()
+        self.assertEqual(len(offsets), 9)
+        expected = cmds.polyListComponentConversion(self.cube.vertices[0], toEdge=True)
+        expected = cmds.ls(cmds.polyListComponentConversion(expected, toVertex=True), fl=True)
+        found = [self.cube.vertices[i] for i in neighbours[offsets[0]:offsets[1]]]
+        self.assertEqual(sorted(found), sorted(i for i in expected if i != self.cube.vertices[0]))
+
+    def test_mesh_node_shape_hash(self):
+        shape = Mesh(cmds.listRelatives(self.sphere.fullPath, shapes=True, fullPath=True)[0])
+        self.assertTrue(shape == self.sphere)
+        self.assertEqual(hash(shape), hash(self.sphere))
+        self.assertIn(shape, {self.sphere})
+
     # ------------------------------------------------------------------------------------------------- TYPE
     def test_mesh_node_type(self):
         self.assertEqual(self.sphere.type, "mesh")
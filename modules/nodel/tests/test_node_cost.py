@@ -0,0 +1,80 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Tests for our math node type selection
+"""
+
+from modules.nodel import Dag_Node as Dag
+from modules.nodel.base import node_cost
+
+import maya.cmds as cmds
+
+import unittest
+
+
+class Test_Node_Cost(unittest.TestCase):
+    def setUp(self):
+        self.sphereName = "sphere_GEO"
+        self.sphere = Dag(cmds.polySphere(n=self.sphereName)[0])
+        self.sphere.a.t.set(1, 2, 4)
+
+        self.cubeName = "cube_GEO"
+        self.cube = Dag(cmds.polyCube(n=self.cubeName)[0])
+
+    def tearDown(self) -> None:
+        for node in cmds.ls(type=[i for i in node_cost.COSTS if node_cost.isAvailable(i)]):
+            if node.startswith(self.sphereName):
+                cmds.delete(node)
+        self.sphere.delete()
+        self.cube.delete()
+
+    def test_node_cost_select_scalar(self):
+        self.assertEqual(node_cost.select("add").nodeType, "addDoubleLinear")
+        self.assertEqual(node_cost.select("multiply").nodeType, "multDoubleLinear")
+        self.assertEqual(node_cost.select("divide", constant=True).nodeType, "multDoubleLinear")
+        self.assertEqual(node_cost.select("add", count=4).nodeType, "plusMinusAverage")
+
+    def test_node_cost_select_compound(self):
+        self.assertEqual(node_cost.select("add", compound=True).nodeType, "plusMinusAverage")
+        self.assertEqual(node_cost.select("power", compound=True).nodeType, "multiplyDivide")
+
+    def test_node_cost_select_nodeType(self):
+        spec = node_cost.select("add", nodeType="plusMinusAverage")
+        self.assertEqual(spec.output, "output1D")
+        self.assertRaises(ValueError, node_cost.select, "power", nodeType="addDoubleLinear")
+
+    def test_node_cost_pick(self):
+        self.assertEqual(node_cost.pick("add").output, "output1D")
+        self.assertEqual(node_cost.pick("divide", constant=True).output, "outputX")
+        with node_cost.cheapest():
+            self.assertEqual(node_cost.pick("add").nodeType, "addDoubleLinear")
+        self.assertFalse(node_cost.isCheapest())
+
+    def test_node_cost_operators_default(self):
+        added = self.sphere.a.tx + self.sphere.a.ty
+        divided = self.sphere.a.tz / 4
+        self.assertEqual(added.node.type, "plusMinusAverage")
+        self.assertEqual(divided.node.type, "multiplyDivide")
+        self.assertAlmostEqual(added.node.a.output1D.get(), 3)
+        self.assertAlmostEqual(divided.node.a.outputX.get(), 1)
+
+    def test_node_cost_operators(self):
+        with node_cost.cheapest():
+            added = self.sphere.a.tx + self.sphere.a.ty
+            divided = self.sphere.a.tz / 4
+        self.assertEqual(added.node.type, "addDoubleLinear")
+        self.assertEqual(divided.node.type, "multDoubleLinear")
+
+        added >> self.cube.a.tx
+        divided >> self.cube.a.ty
+        self.assertAlmostEqual(self.cube.a.tx.get(), 3)
+        self.assertAlmostEqual(self.cube.a.ty.get(), 1)
+
+    def test_node_cost_report(self):
+        self.sphere.a.tx * 2
+        report = node_cost.report()
+        self.assertGreaterEqual(report["multDoubleLinear"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Tests for our node registry functionality
+"""
+
+from modules.nodel import Dep_Node, Dag_Node
+from modules.nodel.base import node_registry
+
+import maya.cmds as cmds
+
+import unittest
+
+
+class Test_Node_Registry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sphereName = "sphere_001"
+        self.sphere = Dag_Node(cmds.polySphere(n=self.sphereName)[0])
+
+    def tearDown(self) -> None:
+        if cmds.objExists(self.sphereName):
+            cmds.delete(self.sphereName)
+
+    def test_node_registry_resolve(self):
+        entry = node_registry.resolve(self.sphereName)
+        self.assertEqual(entry.dep.name(), self.sphereName)
+        self.assertEqual(entry.dag.fullPathName(), "|" + self.sphereName)
+
+    def test_node_registry_reuses_entry(self):
+        other = Dag_Node(self.sphereName)
+        self.assertIs(other.dag, self.sphere.dag)
+        self.assertIs(Dep_Node(self.sphere).dep, self.sphere.dep)
+
+    def test_node_registry_fake_object(self):
+        self.assertIsNone(node_registry.resolve("FAKE OBJECT"))
+
+    def test_node_registry_rename(self):
+        self.sphere.rename("sphere_002")
+        self.assertIsNone(node_registry.lookup(self.sphereName))
+        self.assertFalse(Dag_Node(self.sphereName).exists())
+        self.sphere.rename(self.sphereName)
+
+    def test_node_registry_evict_on_delete(self):
+        hashCode = self.sphere.handle.hashCode()
+        cmds.delete(self.sphereName)
+        self.assertNotIn(hashCode, node_registry._entries)
+        self.assertIsNone(node_registry.lookup(self.sphereName))
+
+
+if __name__ == "__main__":
+    unittest.main()
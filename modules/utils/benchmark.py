@@ -0,0 +1,125 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Benchmark tools to measure the cost of our code from within Maya.
+"""
+
+import sys
+
+import time
+
+import tracemalloc
+
+
+def timeIt(func, *args, **kwargs):
+    """Run the function a number of times and return the best time per call in seconds.
+
+    Args:
+        func(function): The function to time.
+        repeat(int): How many times to call it, default: 5.
+
+    Returns:
+        float: The fastest run in seconds.
+
+    Example:
+        timeIt(Dag_Node, "L_hand_JNT", repeat=100)
+        Output: 1.2e-05
+    """
+    repeat = kwargs.pop("repeat", 5)
+    best = None
+
+    for i in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def wrapperMemory(cls, nodes):
+    """Measure the memory used per wrapper when holding a whole list of nodes.
+
+    Args:
+        cls(class): The wrapper class, e.g. Dag_Node or Attribute.
+        nodes(list): The nodes to wrap, either names or argument tuples.
+
+    Returns:
+        dict: The bytes allocated per wrapper and the size of a single instance.
+
+    Example:
+        wrapperMemory(Dag_Node, cmds.ls(dag=True, long=True))
+        Output: {'count': 2416, 'bytesPerWrapper': 72.0, 'instanceSize': 64, 'hasDict': False}
+    """
+    from modules.nodel.base import node_registry
+
+    nodes = list(nodes)
+    argList = [n if isinstance(n, tuple) else (n,) for n in nodes]
+
+    # Resolve up front so only the wrappers themselves are measured
+    node_registry.resolveMany([args[0] for args in argList])
+
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    wrappers = [cls(*args) for args in argList]
+    end = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    count = len(wrappers) or 1
+    result = {
+        "count": len(wrappers),
+        "bytesPerWrapper": float(end - start) / count,
+        "instanceSize": sys.getsizeof(wrappers[0]) if wrappers else 0,
+        "hasDict": hasattr(wrappers[0], "__dict__") if wrappers else False,
+    }
+
+    print(">>> {0} x {1}: \t{2:.1f} bytes per wrapper".format(result["count"], cls.__name__,
+                                                           result["bytesPerWrapper"]))
+    return result
+
+
+def skinWeightFormats(mesh, weightsFolder, repeat=3):
+    """Compare saving and loading the skin weights of a mesh as deformerWeights XML and as binary npz.
+    The skinCluster is rebuilt by every load, it is unbound outside the timing.
+
+    Args:
+        mesh(str/Mesh): A skinned mesh.
+        weightsFolder(str): A scratch folder for the files.
+        repeat(int): How many times to save and load each format, the best time is kept.
+
+    Returns:
+        dict: The save and load seconds and the file size of each format.
+
+    Example:
+        skinWeightFormats("body_GEO", tempfile.mkdtemp())
+        Output: {'xml': {'save': 4.1, 'load': 6.3, 'bytes': 48211031}, 'npz': {'save': 0.21, ...}}
+    """
+    import os
+
+    import maya.cmds as cmds
+
+    from modules.nodel import Mesh
+    from modules.utils import weights
+
+    mesh = Mesh(mesh)
+    result = {}
+
+    for fileFormat in (weights.FORMAT_XML, weights.FORMAT_BINARY):
+        saveTimes, loadTimes = [], []
+        path = None
+        for i in range(repeat):
+            start = time.perf_counter()
+            path = mesh.saveSkinWeights(weightsFolder, fileFormat=fileFormat)
+            saveTimes.append(time.perf_counter() - start)
+
+            cmds.skinCluster(mesh.skinCluster.fullPath, e=True, ub=True)
+
+            start = time.perf_counter()
+            mesh.loadSkinWeights(weightsFolder)
+            loadTimes.append(time.perf_counter() - start)
+
+        result[fileFormat] = {"save": min(saveTimes), "load": min(loadTimes), "bytes": os.path.getsize(path)}
+        print(">>> {0}: \tsave {1:.3f}s \tload {2:.3f}s \t{3} bytes".format(
+            fileFormat, result[fileFormat]["save"], result[fileFormat]["load"], result[fileFormat]["bytes"]))
+
+    return result
@@ -6,6 +6,10 @@ About: A utility function that facilitates the conversion of Maya
 """
 
 import maya.OpenMaya as om
+import maya.api.OpenMaya as om2
+
+# The space names our array functions take, for the API 2.0 function sets
+SPACES = {"world": om2.MSpace.kWorld, "object": om2.MSpace.kObject}
 
 
 def toDependencyNode(node):
@@ -69,3 +73,327 @@ def toMDagPath(node):
     if obj.hasFn(om.MFn.kDagNode):
         dag = om.MDagPath.getAPathTo(obj)
         return dag
+
+
+def toName(node):
+    """Return the name of a node passed as a string, a wrapped node, an MObject or an MDagPath.
+    Args:
+        node(str/node/MObject/MDagPath): The maya node.
+
+    Returns:
+        str: The full path name for dag nodes, the node name otherwise.
+
+    Example:
+        print(toName(toMDagPath("L_hand_JNT")))
+        # Output:|BASE_GRP|SUB_GRP|L_hand_JNT
+    """
+    if isinstance(node, om.MDagPath):
+        return node.fullPathName()
+
+    if isinstance(node, om.MObject):
+        if node.hasFn(om.MFn.kDagNode):
+            return om.MDagPath.getAPathTo(node).fullPathName()
+        return om.MFnDependencyNode(node).name()
+
+    return str(node)
+
+
+def toMObjects(nodes):
+    """Convert a list of nodes into OpenMaya Objects through a single selection list.
+    Args:
+        nodes(list): The maya nodes.
+
+    Returns:
+        list: The OpenMaya objects, parallel to nodes, None where a node does not exist.
+
+    Example:
+        names = ["L_hand_JNT", "R_hand_JNT"]
+        objs = toMObjects(names)
+        print([om.MFnDependencyNode(obj).name() for obj in objs])
+        # Output: ['L_hand_JNT', 'R_hand_JNT']
+    """
+    selectionList = om.MSelectionList()
+    indices = []
+
+    for node in nodes:
+        length = selectionList.length()
+        try:
+            selectionList.add(str(node))
+        except RuntimeError:
+            indices.append(None)
+            continue
+
+        # A node already in the list is merged rather than appended
+        indices.append(length if selectionList.length() > length else -1)
+
+    objs = []
+    for node, index in zip(nodes, indices):
+        if index is None:
+            objs.append(None)
+        elif index < 0:
+            objs.append(toMObject(str(node)))
+        else:
+            obj = om.MObject()
+            selectionList.getDependNode(index, obj)
+            objs.append(obj)
+
+    return objs
+
+
+def toDependencyNodes(nodes):
+    """Convert a list of nodes into OpenMaya Dependency Nodes.
+    Args:
+        nodes(list): The maya nodes.
+
+    Returns:
+        list: The OpenMaya Dependency Objects, parallel to nodes.
+    """
+    return [om.MFnDependencyNode(obj) if obj else None for obj in toMObjects(nodes)]
+
+
+def toMDagPaths(nodes):
+    """Convert a list of nodes into OpenMaya Dag objects.
+    Args:
+        nodes(list): The maya nodes.
+
+    Returns:
+        list: The OpenMaya Dag Paths, parallel to nodes, None for missing or non dag nodes.
+
+    Example:
+        names = ["L_hand_JNT", "multiplyDivide1"]
+        paths = toMDagPaths(names)
+        print(paths[0].fullPathName(), paths[1])
+        # Output: BASE_GRP|SUB_GRP|L_hand_JNT None
+    """
+    return [om.MDagPath.getAPathTo(obj) if obj and obj.hasFn(om.MFn.kDagNode) else None
+            for obj in toMObjects(nodes)]
+
+
+def toMSpace(space):
+    """Convert a space name into an API 2.0 MSpace constant.
+    Args:
+        space(str): "world" or "object".
+
+    Returns:
+        int: The MSpace constant.
+    """
+    if space not in SPACES:
+        raise ValueError(">>> Unknown space {0}, use one of {1}".format(space, sorted(SPACES)))
+    return SPACES[space]
+
+
+# -------------------------------------------------------------------------------------------------
+
+def toMPlug(attr):
+    """Convert an attribute path into an OpenMaya Plug.
+    Args:
+        attr(str): The maya attribute, "node.attribute".
+
+    Returns:
+        object: The OpenMaya Plug.
+
+    Example:
+        plug = toMPlug("L_hand_JNT.rotateX")
+        print(plug.partialName(False, False, False, False, False, True))
+        # Output:rotateX
+    """
+    selectionList = om.MSelectionList()
+    selectionList.add(attr)
+    plug = om.MPlug()
+    selectionList.getPlug(0, plug)
+    return plug
+
+
+_INT_TYPES = [getattr(om.MFnNumericData, i) for i in ("kByte", "kChar", "kShort", "kInt", "kLong", "kInt64")
+              if hasattr(om.MFnNumericData, i)]
+
+
+def plugValueType(plug):
+    """Find out how the value of a plug can be read and written through the API.
+    Args:
+        plug(MPlug): The plug to check.
+
+    Returns:
+        str: "bool", "int", "float", "double", "angle", "distance", "matrix" or "compound".
+            None when the plug holds a type we leave to maya.cmds.
+
+    Example:
+        print(plugValueType(toMPlug("L_hand_JNT.rotateX")))
+        # Output:angle
+    """
+    if plug.isNull() or plug.isArray():
+        return None
+
+    attr = plug.attribute()
+
+    if plug.isCompound():
+        # Only flat compounds like translate or colour, mirroring getAttr's [(x, y, z)]
+        for i in range(plug.numChildren()):
+            if plugValueType(plug.child(i)) in (None, "compound", "matrix"):
+                return None
+        return "compound"
+
+    if attr.hasFn(om.MFn.kNumericAttribute):
+        numericType = om.MFnNumericAttribute(attr).unitType()
+        if numericType == om.MFnNumericData.kBoolean:
+            return "bool"
+        if numericType in _INT_TYPES:
+            return "int"
+        if numericType == om.MFnNumericData.kFloat:
+            return "float"
+        if numericType == om.MFnNumericData.kDouble:
+            return "double"
+        return None
+
+    if attr.hasFn(om.MFn.kUnitAttribute):
+        unitType = om.MFnUnitAttribute(attr).unitType()
+        if unitType == om.MFnUnitAttribute.kAngle:
+            return "angle"
+        if unitType == om.MFnUnitAttribute.kDistance:
+            return "distance"
+        return None
+
+    if attr.hasFn(om.MFn.kEnumAttribute):
+        return "int"
+
+    if attr.hasFn(om.MFn.kMatrixAttribute):
+        return "matrix"
+
+    if attr.hasFn(om.MFn.kTypedAttribute) and om.MFnTypedAttribute(attr).attrType() == om.MFnData.kMatrix:
+        return "matrix"
+
+    return None
+
+
+def getPlugValue(plug, valueType=None):
+    """Read a plug in the same shape maya.cmds.getAttr returns it, in UI units.
+    Args:
+        plug(MPlug): The plug to read.
+        valueType(str): The result of plugValueType if already known.(optional)
+
+    Returns:
+        bool/int/float/list: The value of the plug.
+
+    Example:
+        print(getPlugValue(toMPlug("L_hand_JNT.translate")))
+        # Output:[(1.0, 0.0, 0.0)]
+    """
+    valueType = valueType or plugValueType(plug)
+
+    if valueType == "bool":
+        return plug.asBool()
+    if valueType == "int":
+        return plug.asInt()
+    if valueType == "float":
+        return plug.asFloat()
+    if valueType == "double":
+        return plug.asDouble()
+    if valueType == "angle":
+        return plug.asMAngle().asUnits(om.MAngle.uiUnit())
+    if valueType == "distance":
+        return plug.asMDistance().asUnits(om.MDistance.uiUnit())
+    if valueType == "matrix":
+        matrix = om.MFnMatrixData(plug.asMObject()).matrix()
+        return [matrix(row, column) for row in range(4) for column in range(4)]
+    if valueType == "compound":
+        return [tuple(getPlugValue(plug.child(i)) for i in range(plug.numChildren()))]
+
+    raise ValueError(">>> Plug type not supported: {}".format(plug.name()))
+
+
+def isPlugFree(plug):
+    """Check a plug, its children and the plugs above it are neither locked nor driven by a connection,
+    a value written under a driven parent like translate or an array would be overridden right away."""
+    if not _isTreeFree(plug):
+        return False
+
+    parent = plug
+    while parent.isChild() or parent.isElement():
+        parent = parent.parent() if parent.isChild() else parent.array()
+        if not _isPlugFree(parent):
+            return False
+
+    return True
+
+
+def _isTreeFree(plug):
+    if not _isPlugFree(plug):
+        return False
+
+    if plug.isCompound():
+        return all(_isTreeFree(plug.child(i)) for i in range(plug.numChildren()))
+
+    return True
+
+
+def _isPlugFree(plug):
+    if plug.isLocked():
+        return False
+
+    sources = om.MPlugArray()
+    plug.connectedTo(sources, True, False)
+    return not sources.length()
+
+
+def setPlugValue(modifier, plug, values, valueType=None):
+    """Queue a new value for a plug on a modifier, taking values the way maya.cmds.setAttr does.
+    Args:
+        modifier(MDGModifier): The modifier to queue the change on.
+        plug(MPlug): The plug to set.
+        values(list/tuple): The values, one for scalars, one per child for compounds or 16 for matrices.
+        valueType(str): The result of plugValueType if already known.(optional)
+
+    Returns:
+        bool: False, with nothing queued, if the values do not fit the plug.
+
+    Example:
+        modifier = om.MDGModifier()
+        setPlugValue(modifier, toMPlug("L_hand_JNT.translate"), (1, 0, 0))
+        modifier.doIt()
+    """
+    valueType = valueType or plugValueType(plug)
+    values = list(values)
+
+    # Allow set([x, y, z]) as well as set(x, y, z)
+    if len(values) == 1 and isinstance(values[0], (list, tuple)):
+        values = list(values[0])
+
+    if not valueType or not all(isinstance(v, (bool, int, float)) for v in values):
+        return False
+
+    if valueType == "compound":
+        if len(values) != plug.numChildren():
+            return False
+
+        children = [plug.child(i) for i in range(plug.numChildren())]
+        return all(setPlugValue(modifier, child, [value]) for child, value in zip(children, values))
+
+    if valueType == "matrix":
+        if len(values) != 16:
+            return False
+
+        matrix = om.MMatrix()
+        om.MScriptUtil.createMatrixFromList([float(v) for v in values], matrix)
+        modifier.newPlugValue(plug, om.MFnMatrixData().create(matrix))
+        return True
+
+    if len(values) != 1:
+        return False
+
+    value = values[0]
+    if valueType == "bool":
+        modifier.newPlugValueBool(plug, bool(value))
+    elif valueType == "int":
+        modifier.newPlugValueInt(plug, int(value))
+    elif valueType == "float":
+        modifier.newPlugValueFloat(plug, float(value))
+    elif valueType == "double":
+        modifier.newPlugValueDouble(plug, float(value))
+    elif valueType == "angle":
+        modifier.newPlugValueMAngle(plug, om.MAngle(float(value), om.MAngle.uiUnit()))
+    elif valueType == "distance":
+        modifier.newPlugValueMDistance(plug, om.MDistance(float(value), om.MDistance.uiUnit()))
+    else:
+        return False
+
+    return True
@@ -0,0 +1,320 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Vectorised spatial queries, world positions of many nodes at once, distance
+        matrices and a KD-tree to find the closest items or the items within a radius.
+"""
+
+import heapq
+
+import maya.api.OpenMaya as om2
+
+import numpy as np
+
+from modules import six
+
+from modules.utils import open_maya_api
+
+
+def worldPositions(items):
+    """The world translation of many nodes, resolved through one selection list.
+    Arrays and lists of coordinates are passed through, so the queries below take either.
+
+        Args:
+            items(list/numpy.ndarray): Dag nodes, or points as [x, y, z].
+
+        Returns:
+            numpy.ndarray: Shape (N, 3).
+
+        Example:
+            print(worldPositions(["L_hand_JNT", "R_hand_JNT"]))
+            Output: [[ 52.1 140.3 -2.4] [-52.1 140.3 -2.4]]
+    """
+    if isinstance(items, np.ndarray):
+        return _asPoints(items)
+
+    items = list(items)
+    if items and not isinstance(items[0], six.string_types) and not hasattr(items[0], "fullPath"):
+        return _asPoints(items)
+
+    positions = np.zeros((len(items), 3), dtype=np.float64)
+    for i, (item, path) in enumerate(zip(items, open_maya_api.toMDagPaths(items))):
+        if path is None:
+            raise ValueError(">>> {} is not an existing dag node and has no world position".format(item))
+
+        matrix = path.inclusiveMatrix()
+        positions[i] = (matrix(3, 0), matrix(3, 1), matrix(3, 2))
+
+    return positions
+
+
+def vertexPositions(mesh):
+    """The world position of every vertex of a mesh.
+
+        Args:
+            mesh(str/Mesh): The mesh transform or shape.
+
+        Returns:
+            numpy.ndarray: Shape (N, 3).
+    """
+    selectionList = om2.MSelectionList()
+    selectionList.add(str(mesh))
+    points = om2.MFnMesh(selectionList.getDagPath(0)).getPoints(om2.MSpace.kWorld)
+    return np.array(points, dtype=np.float64).reshape(-1, 4)[:, :3]
+
+
+def _asPoints(points):
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim == 1:
+        points = points.reshape(1, -1)
+
+    if points.ndim != 2 or points.shape[1] not in (2, 3):
+        raise ValueError(">>> Expected points as (N, 2) or (N, 3), got the shape {}".format(points.shape))
+
+    return points
+
+
+# -------------------------------------------------------------------------------------------------
+
+def distances(pointsA, pointsB):
+    """The distance between each pair of rows, like getDistanceBetween for many pairs.
+
+        Returns:
+            numpy.ndarray: Shape (N,).
+    """
+    return np.linalg.norm(worldPositions(pointsA) - worldPositions(pointsB), axis=1)
+
+
+def distanceMatrix(pointsA, pointsB=None):
+    """The distance from every point of A to every point of B.
+
+        Args:
+            pointsA(list/numpy.ndarray): Nodes or points.
+            pointsB(list/numpy.ndarray): Nodes or points, A against itself if not given.(optional)
+
+        Returns:
+            numpy.ndarray: Shape (N, M).
+
+        Example:
+            print(distanceMatrix(controls, joints).argmin(axis=1))
+            Output: [0 4 7]
+    """
+    pointsA = worldPositions(pointsA)
+    pointsB = pointsA if pointsB is None else worldPositions(pointsB)
+
+    # |a - b|^2 = |a|^2 + |b|^2 - 2ab, clipped as the rounding can go slightly negative
+    squared = (pointsA ** 2).sum(axis=1)[:, None] + (pointsB ** 2).sum(axis=1)[None, :] - 2 * pointsA.dot(pointsB.T)
+    return np.sqrt(np.clip(squared, 0, None))
+
+
+# -------------------------------------------------------------------------------------------------
+
+class KD_Tree(object):
+    """A static KD-tree over points, splitting on the widest axis until a leaf holds leafSize points.
+    Leaves are searched with NumPy, so building it pays off from a few hundred points or repeated queries.
+
+        Args:
+            points(list/numpy.ndarray): Nodes or points.
+            leafSize(int): The most points a leaf holds.
+
+        Example:
+
+            tree = KD_Tree(vertexPositions("body_GEO"))
+            distance, index = tree.nearest(worldPositions(locators))
+    """
+
+    __slots__ = ("points", "leafSize", "_order", "_nodes")
+
+    def __init__(self, points, leafSize=16):
+        self.points = worldPositions(points)
+        self.leafSize = max(1, leafSize)
+        self._order = np.arange(len(self.points))
+
+        # (start, end, axis, value, left, right) with left = right = -1 for a leaf
+        self._nodes = []
+        if len(self.points):
+            self._build(0, len(self.points))
+
+    def __repr__(self):
+        return "{0}({1} points)".format(self.__class__.__name__, len(self.points))
+
+    def __len__(self):
+        return len(self.points)
+
+    def _build(self, start, end):
+        index = len(self._nodes)
+        self._nodes.append(None)
+
+        if end - start <= self.leafSize:
+            self._nodes[index] = (start, end, 0, 0.0, -1, -1)
+            return index
+
+        points = self.points[self._order[start:end]]
+        axis = int(np.argmax(points.max(axis=0) - points.min(axis=0)))
+
+        middle = (end - start) // 2
+        partition = np.argpartition(points[:, axis], middle)
+        self._order[start:end] = self._order[start:end][partition]
+        value = float(self.points[self._order[start + middle], axis])
+
+        left = self._build(start, start + middle)
+        right = self._build(start + middle, end)
+        self._nodes[index] = (start, end, axis, value, left, right)
+        return index
+
+    # -------------------------------------------------------------------------------------------------
+
+    def nearest(self, points, k=1):
+        """The k closest tree points to each query point.
+
+            Args:
+                points(list/numpy.ndarray): Nodes or points to search from.
+                k(int): How many neighbours to return.
+
+            Returns:
+                tuple: (distances, indices), each shaped (M,) for k=1 and (M, k) otherwise.
+                    Missing neighbours when the tree is smaller than k are inf and -1.
+        """
+        points = worldPositions(points)
+        resultDistances = np.full((len(points), k), np.inf)
+        resultIndices = np.full((len(points), k), -1, dtype=np.int64)
+
+        for row, point in enumerate(points):
+            found = sorted((-negative, index) for negative, index in self._search(point, k))
+            for column, (squared, index) in enumerate(found):
+                resultDistances[row, column] = np.sqrt(squared)
+                resultIndices[row, column] = index
+
+        if k == 1:
+            return resultDistances[:, 0], resultIndices[:, 0]
+        return resultDistances, resultIndices
+
+    def _search(self, point, k):
+        # Max heap of the best (-squared distance, index) so far
+        best = []
+        stack = [(0, 0.0)] if self._nodes else []
+
+        while stack:
+            node, bound = stack.pop()
+            if len(best) == k and bound >= -best[0][0]:
+                continue
+
+            start, end, axis, value, left, right = self._nodes[node]
+            if left < 0:
+                indices = self._order[start:end]
+                squared = ((self.points[indices] - point) ** 2).sum(axis=1)
+                for i in np.argsort(squared)[:k]:
+                    item = (-float(squared[i]), int(indices[i]))
+                    if len(best) < k:
+                        heapq.heappush(best, item)
+                    elif item > best[0]:
+                        heapq.heapreplace(best, item)
+                continue
+
+            difference = point[axis] - value
+            near, far = (left, right) if difference < 0 else (right, left)
+            stack.append((far, max(bound, difference * difference)))
+            stack.append((near, bound))
+
+        return best
+
+    def radius(self, point, radius):
+        """The tree points within a distance of one point, closest first.
+
+            Returns:
+                numpy.ndarray: The indices of the points.
+        """
+        point = worldPositions([point] if not isinstance(point, np.ndarray) else point)[0]
+        limit = radius * radius
+
+        indices = []
+        squared = []
+        stack = [(0, 0.0)] if self._nodes else []
+        while stack:
+            node, bound = stack.pop()
+            if bound > limit:
+                continue
+
+            start, end, axis, value, left, right = self._nodes[node]
+            if left < 0:
+                leaf = self._order[start:end]
+                leafSquared = ((self.points[leaf] - point) ** 2).sum(axis=1)
+                inside = leafSquared <= limit
+                indices.append(leaf[inside])
+                squared.append(leafSquared[inside])
+                continue
+
+            difference = point[axis] - value
+            near, far = (left, right) if difference < 0 else (right, left)
+            stack.append((far, max(bound, difference * difference)))
+            stack.append((near, bound))
+
+        if not indices:
+            return np.zeros(0, dtype=np.int64)
+
+        indices = np.concatenate(indices)
+        return indices[np.argsort(np.concatenate(squared), kind="stable")]
+
+
+# -------------------------------------------------------------------------------------------------
+
+def closest(items, candidates):
+    """The closest candidate to each item, e.g. the closest joint to each control.
+
+        Args:
+            items(list): The nodes or points to search from.
+            candidates(list): The nodes or points to pick from.
+
+        Returns:
+            list: A candidate for each item.
+
+        Example:
+            print(closest(["L_arm_CTRL"], joints))
+            Output: ['L_elbow_JNT']
+    """
+    candidates = list(candidates)
+    _, indices = KD_Tree(candidates).nearest(items)
+    return [candidates[i] if i >= 0 else None for i in indices]
+
+
+def closestVertices(items, mesh):
+    """The index of the closest vertex of a mesh to each item, e.g. to each locator.
+
+        Returns:
+            numpy.ndarray: Shape (N,).
+    """
+    _, indices = KD_Tree(vertexPositions(mesh)).nearest(items)
+    return indices
+
+
+def within(point, candidates, radius):
+    """The candidates within a distance of a point or a node, closest first."""
+    candidates = list(candidates)
+    return [candidates[i] for i in KD_Tree(candidates).radius(worldPositions([point])[0], radius)]
+
+
+def mirrorPairs(items, axis=0, tolerance=0.001):
+    """Pair every item with the item sitting at its mirrored position, to decide
+    what to mirror onto what without relying on names.
+
+        Args:
+            items(list): The nodes.
+            axis(int): The axis mirrored across, 0 for the YZ plane.
+            tolerance(float): How far the mirrored position may be off.
+
+        Returns:
+            list: (item, mirrored item) tuples, the mirrored item is None when nothing matches
+                and the item itself for items on the mirror plane.
+
+        Example:
+            print(mirrorPairs(["L_hand_JNT", "R_hand_JNT", "spine_JNT"]))
+            Output: [('L_hand_JNT', 'R_hand_JNT'), ('R_hand_JNT', 'L_hand_JNT'), ('spine_JNT', 'spine_JNT')]
+    """
+    items = list(items)
+    points = worldPositions(items)
+    mirrored = points.copy()
+    mirrored[:, axis] *= -1
+
+    distance, indices = KD_Tree(points).nearest(mirrored)
+    return [(item, items[index] if found <= tolerance else None)
+            for item, found, index in zip(items, distance, indices)]
@@ -10,7 +10,7 @@ import maya.OpenMaya as om
 
 import maya.cmds as cmds
 
-from modules.utils.open_maya_api import toDependencyNode, toMObject
+from modules.utils.open_maya_api import toDependencyNode, toMObject, toMObjects, toMDagPaths
 
 
 class Test_Maya_Open_API(unittest.TestCase):
@@ -38,6 +38,21 @@ class Test_Maya_Open_API(unittest.TestCase):
         expectedResult = "|BASE_GRP|SUB_GRP|L_hand_JNT"
         self.assertEqual(fullPathName, expectedResult)
 
+    def test_toMObjects(self):
+        objs = toMObjects([self.jointName, "FAKE_OBJECT", self.baseGrp, self.jointName])
+        self.assertEqual(len(objs), 4)
+        self.assertIsNone(objs[1])
+        self.assertEqual(om.MFnDagNode(objs[0]).fullPathName(), "|BASE_GRP|SUB_GRP|L_hand_JNT")
+        self.assertEqual(om.MFnDagNode(objs[2]).fullPathName(), "|BASE_GRP")
+        self.assertTrue(objs[3] == objs[0])
+
+    def test_toMDagPaths(self):
+        md = cmds.createNode("multiplyDivide")
+        paths = toMDagPaths([self.jointName, md])
+        self.assertEqual(paths[0].fullPathName(), "|BASE_GRP|SUB_GRP|L_hand_JNT")
+        self.assertIsNone(paths[1])
+        cmds.delete(md)
+
 
 if __name__ == "__main__":
     unittest.main()
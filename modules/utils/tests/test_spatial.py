@@ -0,0 +1,91 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Tests for our spatial queries
+"""
+
+import unittest
+
+import maya.cmds as cmds
+import numpy as np
+
+from modules.nodel import Dag_Node as Dag
+from modules.utils import spatial
+
+
+class Test_Spatial_Points(unittest.TestCase):
+    def setUp(self):
+        self.points = np.random.RandomState(7).uniform(-10, 10, size=(500, 3))
+        self.tree = spatial.KD_Tree(self.points, leafSize=8)
+
+    def test_distanceMatrix(self):
+        matrix = spatial.distanceMatrix([[0, 0, 0], [3, 4, 0]], [[0, 0, 0], [0, 0, 2]])
+        self.assertTrue(np.allclose(matrix, [[0, 2], [5, np.sqrt(29)]]))
+
+    def test_distances(self):
+        self.assertTrue(np.allclose(spatial.distances([[0, 0, 0], [1, 1, 1]], [[0, 10, 0], [1, 1, 1]]), [10, 0]))
+
+    def test_kd_tree_nearest(self):
+        queries = np.random.RandomState(8).uniform(-10, 10, size=(50, 3))
+        distance, index = self.tree.nearest(queries)
+        expected = spatial.distanceMatrix(queries, self.points)
+        self.assertTrue((index == expected.argmin(axis=1)).all())
+        self.assertTrue(np.allclose(distance, expected.min(axis=1)))
+
+    def test_kd_tree_nearest_k(self):
+        distance, index = self.tree.nearest([[0, 0, 0]], k=4)
+        expected = np.argsort(spatial.distanceMatrix([[0, 0, 0]], self.points)[0])[:4]
+        self.assertEqual(index[0].tolist(), expected.tolist())
+        self.assertEqual(distance.shape, (1, 4))
+
+    def test_kd_tree_nearest_small_tree(self):
+        distance, index = spatial.KD_Tree([[1, 0, 0]]).nearest([[0, 0, 0]], k=2)
+        self.assertEqual(index[0].tolist(), [0, -1])
+        self.assertTrue(np.isinf(distance[0, 1]))
+
+    def test_kd_tree_radius(self):
+        found = self.tree.radius(np.array([0, 0, 0]), 3)
+        expected = np.where(np.linalg.norm(self.points, axis=1) <= 3)[0]
+        self.assertEqual(sorted(found.tolist()), sorted(expected.tolist()))
+        self.assertTrue((np.diff(np.linalg.norm(self.points[found], axis=1)) >= 0).all())
+
+    def test_mirrorPairs(self):
+        points = [[1, 2, 3], [-1, 2, 3], [0, 5, 0], [4, 0, 0]]
+        pairs = spatial.mirrorPairs(points)
+        self.assertEqual([i[1] for i in pairs], [points[1], points[0], points[2], None])
+
+
+class Test_Spatial_Nodes(unittest.TestCase):
+    def setUp(self):
+        self.locators = [Dag(cmds.spaceLocator(n="spatial{}_LOC".format(i))[0]) for i in range(3)]
+        for locator, position in zip(self.locators, ([0, 0, 0], [5, 0, 0], [-5, 0, 0])):
+            locator.a.t.set(*position)
+
+        self.cube = Dag(cmds.polyCube(n="cube_GEO")[0])
+        self.cube.a.t.set(10, 0, 0)
+
+    def tearDown(self) -> None:
+        for node in self.locators + [self.cube]:
+            node.delete()
+
+    def test_worldPositions(self):
+        self.assertEqual(spatial.worldPositions(self.locators).tolist(), [[0, 0, 0], [5, 0, 0], [-5, 0, 0]])
+        with self.assertRaises(ValueError):
+            spatial.worldPositions(["missing_LOC"])
+
+    def test_closest(self):
+        self.assertEqual(spatial.closest([[4, 1, 0]], self.locators), [self.locators[1]])
+
+    def test_closestVertices(self):
+        index = spatial.closestVertices(self.locators[1:2], self.cube)[0]
+        position = cmds.xform("{}.vtx[{}]".format(self.cube, index), q=1, ws=1, t=1)
+        self.assertAlmostEqual(position[0], 9.5)
+
+    def test_within(self):
+        self.assertEqual(spatial.within(self.locators[0], self.locators, 5.5)[0], self.locators[0])
+        self.assertEqual(len(spatial.within(self.locators[0], self.locators, 5.5)), 3)
+        self.assertEqual(len(spatial.within(self.locators[1], self.locators, 1)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
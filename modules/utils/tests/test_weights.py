@@ -0,0 +1,207 @@
+"""
+Author:SuoLin Zhang
+Created:2023
+About: Tests for our skin weight files
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import maya.cmds as cmds
+import numpy as np
+
+from modules.nodel import Dag_Node as Dag, Mesh
+from modules.utils import weights
+
+
+class Test_Weights(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.sphere = Mesh(cmds.polySphere(n="sphere_GEO")[0])
+
+        cmds.select(cl=True)
+        self.joint1 = Dag(cmds.joint(n="body_j1", p=(0, -1, 0)))
+        self.joint2 = Dag(cmds.joint(n="body_j2", p=(0, 1, 0)))
+        self.sphere.softWeightTo([self.joint1, self.joint2])
+
+    def tearDown(self) -> None:
+        self.sphere.delete()
+        self.joint1.delete()
+        shutil.rmtree(self.folder)
+
+    def test_weights_default_binary(self):
+        path = self.sphere.saveSkinWeights(self.folder)
+        self.assertTrue(path.endswith(weights.binaryWeightsFileExt))
+        self.assertEqual(weights.findWeightsFile("sphere_GEO", self.folder), (path, weights.FORMAT_BINARY))
+
+    def test_weights_binary_roundtrip(self):
+        expected = cmds.skinPercent(self.sphere.skinCluster.fullPath, self.sphere.vertices[10], q=True, v=True)
+        self.sphere.saveSkinWeights(self.folder, fileFormat=weights.FORMAT_BINARY)
+        cmds.skinCluster(self.sphere.skinCluster.fullPath, e=True, ub=True)
+
+        self.sphere.loadSkinWeights(self.folder)
+        result = cmds.skinPercent(self.sphere.skinCluster.fullPath, self.sphere.vertices[10], q=True, v=True)
+        self.assertTrue(np.allclose(result, expected, atol=1e-6))
+
+    def test_weights_readBinaryWeights(self):
+        path = weights.saveBinaryWeights("sphere_GEO", self.folder, self.sphere.skinCluster.fullPath)
+        influences, dense, fingerprint = weights.readBinaryWeights(path)
+        self.assertEqual(influences, ["body_j1", "body_j2"])
+        self.assertEqual(dense.shape, (self.sphere.vertexCount, 2))
+        self.assertTrue(np.allclose(dense.sum(axis=1), 1, atol=1e-5))
+        self.assertEqual(fingerprint, weights.topologyFingerprint("sphere_GEO"))
+
+    def test_weights_vertex_count_mismatch(self):
+        self.sphere.saveSkinWeights(self.folder)
+        cmds.skinCluster(self.sphere.skinCluster.fullPath, e=True, ub=True)
+        cmds.polySmooth(self.sphere.fullPath)
+        cmds.delete(self.sphere.fullPath, ch=True)
+
+        with self.assertRaises(ValueError):
+            self.sphere.loadSkinWeights(self.folder)
+
+    def test_weights_fileKey(self):
+        self.assertEqual(weights.fileKey("|troll|model_GRP|char:body_GEO"), "char%3Abody_GEO")
+        self.assertNotEqual(weights.fileKey("char:body_GEO"), weights.fileKey("char_body_GEO"))
+        self.assertEqual(weights.geometryName(weights.fileKey("L_GRP|100%:body_GEO")), "L_GRP|100%:body_GEO")
+        path = self.sphere.saveSkinWeights(self.folder)
+        self.assertEqual(os.path.basename(path), "sphere_GEO" + weights.binaryWeightsFileExt)
+
+    def test_weights_xml(self):
+        path = self.sphere.saveSkinWeights(self.folder, fileFormat=weights.FORMAT_XML)
+        self.assertTrue(path.endswith(weights.weightsFileExt))
+        self.assertTrue(os.path.exists(os.path.join(self.folder, "sphere_GEO" + weights.influencesFileExt)))
+        self.assertEqual(weights.findWeightsFile("sphere_GEO", self.folder), (path, weights.FORMAT_XML))
+
+    def test_weights_format_switch(self):
+        self.sphere.saveSkinWeights(self.folder, fileFormat=weights.FORMAT_BINARY)
+        path = self.sphere.saveSkinWeights(self.folder, fileFormat=weights.FORMAT_XML)
+        self.assertFalse(os.path.exists(os.path.join(self.folder, "sphere_GEO" + weights.binaryWeightsFileExt)))
+        self.assertEqual(weights.findWeightsFile("sphere_GEO", self.folder), (path, weights.FORMAT_XML))
+
+        path = self.sphere.saveSkinWeights(self.folder, fileFormat=weights.FORMAT_BINARY)
+        self.assertEqual(sorted(os.listdir(self.folder)), sorted([os.path.basename(path), weights.manifestFileName]))
+
+
+class Test_Weights_Many(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+        cmds.select(cl=True)
+        self.joint1 = Dag(cmds.joint(n="body_j1", p=(0, -1, 0)))
+        self.joint2 = Dag(cmds.joint(n="body_j2", p=(0, 1, 0)))
+
+        self.meshes = [Mesh(cmds.polySphere(n="sphere{}_GEO".format(i))[0]) for i in range(5)]
+        for mesh in self.meshes:
+            mesh.softWeightTo([self.joint1, self.joint2])
+        self.unskinned = Mesh(cmds.polyCube(n="cube_GEO")[0])
+
+    def tearDown(self) -> None:
+        for mesh in self.meshes + [self.unskinned]:
+            mesh.delete()
+        self.joint1.delete()
+        shutil.rmtree(self.folder)
+
+    def test_weights_many_roundtrip(self):
+        expected = [cmds.skinPercent(mesh.skinCluster.fullPath, mesh.vertices[5], q=True, v=True)
+                    for mesh in self.meshes]
+
+        paths = Mesh.saveSkinWeightsMany(self.meshes + [self.unskinned], self.folder, workers=2)
+        self.assertEqual(len(paths), 5)
+        for mesh in self.meshes:
+            cmds.skinCluster(mesh.skinCluster.fullPath, e=True, ub=True)
+
+        loaded = Mesh.loadSkinWeightsMany(self.meshes + [self.unskinned], self.folder, workers=2)
+        self.assertEqual(loaded.count(None), 1)
+        for mesh, weightValues in zip(self.meshes, expected):
+            result = cmds.skinPercent(mesh.skinCluster.fullPath, mesh.vertices[5], q=True, v=True)
+            self.assertTrue(np.allclose(result, weightValues, atol=1e-6))
+
+    def test_weights_many_incremental(self):
+        self.assertEqual(len(Mesh.saveSkinWeightsMany(self.meshes, self.folder)), 5)
+        self.assertEqual(Mesh.saveSkinWeightsMany(self.meshes, self.folder), [])
+
+        changed = self.meshes[2]
+        cmds.skinPercent(changed.skinCluster.fullPath, changed.vertices[0], transformValue=[(self.joint1.fullPath, 1)])
+        paths = Mesh.saveSkinWeightsMany(self.meshes, self.folder)
+        self.assertEqual([os.path.basename(i) for i in paths], [changed.name + weights.binaryWeightsFileExt])
+
+        self.assertEqual(len(Mesh.saveSkinWeightsMany(self.meshes, self.folder, incremental=False)), 5)
+
+    def test_weights_many_missing_file_rewritten(self):
+        paths = Mesh.saveSkinWeightsMany(self.meshes, self.folder)
+        os.remove(paths[0])
+        self.assertEqual(Mesh.saveSkinWeightsMany(self.meshes, self.folder), [paths[0]])
+
+    def test_weights_manifest(self):
+        Mesh.saveSkinWeightsMany(self.meshes, self.folder)
+        manifest = weights.readManifest(self.folder)
+        self.assertEqual(sorted(manifest), sorted(mesh.name for mesh in self.meshes))
+
+        entry = manifest[self.meshes[0].name]
+        self.assertEqual(entry["format"], weights.FORMAT_BINARY)
+        self.assertEqual(entry["vertexCount"], self.meshes[0].vertexCount)
+
+    def test_weights_stale(self):
+        Mesh.saveSkinWeightsMany(self.meshes, self.folder)
+        names = [mesh.name for mesh in self.meshes]
+        self.assertEqual(weights.staleWeights(names, self.folder), [])
+
+        cmds.skinCluster(self.meshes[1].skinCluster.fullPath, e=True, ub=True)
+        cmds.polyFlipEdge(self.meshes[1].edges[0])
+        cmds.delete(self.meshes[1].fullPath, ch=True)
+        self.assertEqual(weights.staleWeights(names, self.folder), [names[1]])
+
+    def test_weights_xml_stale(self):
+        Mesh.saveSkinWeightsMany(self.meshes[:1], self.folder, fileFormat=weights.FORMAT_XML)
+        cmds.skinCluster(self.meshes[0].skinCluster.fullPath, e=True, ub=True)
+        cmds.polySmooth(self.meshes[0].fullPath)
+        cmds.delete(self.meshes[0].fullPath, ch=True)
+
+        with self.assertRaises(ValueError):
+            self.meshes[0].loadSkinWeights(self.folder)
+
+    def test_weights_many_same_names(self):
+        meshes = []
+        for side in ("L", "R"):
+            group = cmds.group(em=True, n="{}_GRP".format(side))
+            sphere = cmds.parent(cmds.polySphere(n="{}_body_GEO".format(side))[0], group)[0]
+            cmds.rename("|{0}|{1}".format(group, sphere), "body_GEO")
+            meshes.append(Mesh("|{}|body_GEO".format(group)))
+            meshes[-1].softWeightTo([self.joint1, self.joint2])
+
+        vertex = meshes[1].vertices[0]
+        cmds.skinPercent(meshes[1].skinCluster.fullPath, vertex, transformValue=[(self.joint1.fullPath, 1)])
+        expected = [cmds.skinPercent(mesh.skinCluster.fullPath, mesh.vertices[0], q=True, v=True) for mesh in meshes]
+
+        paths = Mesh.saveSkinWeightsMany(meshes, self.folder)
+        self.assertEqual(sorted(os.path.basename(i) for i in paths),
+                         ["L_GRP%7Cbody_GEO.npz", "R_GRP%7Cbody_GEO.npz"])
+        self.assertEqual(sorted(weights.readManifest(self.folder)), ["L_GRP%7Cbody_GEO", "R_GRP%7Cbody_GEO"])
+
+        for mesh in meshes:
+            cmds.skinCluster(mesh.skinCluster.fullPath, e=True, ub=True)
+        Mesh.loadSkinWeightsMany(meshes, self.folder)
+        for mesh, weightValues in zip(meshes, expected):
+            result = cmds.skinPercent(mesh.skinCluster.fullPath, mesh.vertices[0], q=True, v=True)
+            self.assertTrue(np.allclose(result, weightValues, atol=1e-6))
+
+        cmds.delete("L_GRP", "R_GRP")
+
+    def test_weights_many_duplicate_keys(self):
+        mesh = self.meshes[0]
+        entry = (mesh.fullPath, mesh.skinCluster.fullPath, [self.joint1.fullPath, self.joint2.fullPath])
+        with self.assertRaises(ValueError):
+            weights.saveWeightsMany([entry, (mesh.name,) + entry[1:]], self.folder)
+        self.assertEqual(os.listdir(self.folder), [])
+
+    def test_weights_many_shapes_once(self):
+        shapes = [mesh.shape for mesh in self.meshes]
+        paths = Mesh.saveSkinWeightsMany(self.meshes + shapes, self.folder)
+        self.assertEqual(len(paths), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,28 +5,129 @@ About: functions for working with deformer weights
 """
 
 import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import maya.api.OpenMayaAnim as oma2
+import collections
+import hashlib
 import json
 import os.path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 weightsFileExt = '.xml'
 influencesFileExt = '.infs'
+binaryWeightsFileExt = '.npz'
+manifestFileName = 'weights_manifest.json'
+
+FORMAT_XML = 'xml'
+FORMAT_BINARY = 'npz'
+BINARY_VERSION = 1
+
+
+# The dag path and namespace separators cannot go in a file name, '%' is escaped so the keys stay reversible
+_KEY_ESCAPES = (('%', '%25'), ('|', '%7C'), (':', '%3A'))
+
+
+def fileKey(geoObject):
+    """The name a geometry's weight files and manifest entry go by, its shortest unique
+    dag path with the separators escaped, so same-named meshes under other parents and
+    namespaced names never share a file. Names not in the scene are escaped as they are.
+
+    Example:
+        print(fileKey("|troll|model_GRP|char:body_GEO"))
+        Output: char%3Abody_GEO
+        print(fileKey("|troll|L_GRP|body_GEO"))
+        Output: L_GRP%7Cbody_GEO
+    """
+    name = str(geoObject)
+    selectionList = om2.MSelectionList()
+    try:
+        selectionList.add(name)
+        name = selectionList.getDagPath(0).partialPathName()
+    except (RuntimeError, TypeError):
+        pass
+
+    for character, escaped in _KEY_ESCAPES:
+        name = name.replace(character, escaped)
+    return name
+
+
+def geometryName(key):
+    """The dag path a fileKey was made from.
+
+    Example:
+        print(geometryName("L_GRP%7Cbody_GEO"))
+        Output: L_GRP|body_GEO
+    """
+    for character, escaped in reversed(_KEY_ESCAPES):
+        key = key.replace(escaped, character)
+    return key
+
+
+def defaultFormat():
+    """The binary format when NumPy is there to read it, the deformerWeights XML otherwise."""
+    return FORMAT_BINARY if numpy is not None else FORMAT_XML
+
+
+def findWeightsFile(geoObject, weightsFolder):
+    """The weights file saved for a geometry and its format, preferring the binary one.
 
+    Returns:
+        tuple: (path, format), (None, None) if nothing was saved.
+    """
+    candidates = [(binaryWeightsFileExt, FORMAT_BINARY)] if numpy is not None else []
+    candidates.append((weightsFileExt, FORMAT_XML))
 
-def saveWeights(geoObject, weightsFolder, geoSkinClusterNode, influences):
-    weightsFileName = geoObject + weightsFileExt
+    for ext, fileFormat in candidates:
+        path = os.path.join(weightsFolder, fileKey(geoObject) + ext)
+        if os.path.exists(path):
+            return path, fileFormat
+
+    return None, None
+
+
+def _removeOtherFormat(key, weightsFolder, fileFormat):
+    """Delete the files a geometry has in the format we are not saving, so a load
+    never picks up weights older than the ones just saved.
+    """
+    exts = [weightsFileExt, influencesFileExt] if fileFormat == FORMAT_BINARY else [binaryWeightsFileExt]
+    for ext in exts:
+        path = os.path.join(weightsFolder, key + ext)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def saveWeights(geoObject, weightsFolder, geoSkinClusterNode, influences, fileFormat=None):
+    return saveWeightsMany([(geoObject, geoSkinClusterNode, influences)], weightsFolder,
+                           fileFormat=fileFormat, incremental=False)[0]
+
+
+def _saveXmlWeights(geoObject, weightsFolder, geoSkinClusterNode, influences):
+    weightsFileName = fileKey(geoObject) + weightsFileExt
     cmds.deformerWeights(weightsFileName, path=weightsFolder, export=True, deformer=geoSkinClusterNode)
 
-    influencesFileName = geoObject + influencesFileExt
+    influencesFileName = fileKey(geoObject) + influencesFileExt
     influencesPath = os.path.join(weightsFolder, influencesFileName)
     fileObj = open(influencesPath, mode='w')
     json.dump(influences, fileObj, sort_keys=True, indent=4, separators=(',', ': '))
+    fileObj.close()
+
+    return os.path.join(weightsFolder, weightsFileName)
 
 
 def loadWeights(geoObject, weightsFolder):
-    weightsFileName = geoObject + weightsFileExt
+    path, fileFormat = findWeightsFile(geoObject, weightsFolder)
+    if fileFormat == FORMAT_BINARY:
+        return loadBinaryWeights(geoObject, path)
+
+    weightsFileName = fileKey(geoObject) + weightsFileExt
     weightsFilepath = os.path.join(weightsFolder, weightsFileName)
 
-    influencesFileName = geoObject + influencesFileExt
+    influencesFileName = fileKey(geoObject) + influencesFileExt
     influencesFilePath = os.path.join(weightsFolder, influencesFileName)
 
     if not os.path.exists(weightsFilepath):
@@ -36,6 +137,10 @@ def loadWeights(geoObject, weightsFolder):
     if not os.path.exists(influencesFilePath):
         print('# influences file not found for %s, skipping loading weights from %s' % (geoObject, influencesFilePath))
         return
+
+    # the xml file has no fingerprint of its own, the manifest has
+    checkFingerprint(geoObject, readManifest(weightsFolder).get(fileKey(geoObject)), weightsFilepath)
+
     # get influences
     fileObj = open(influencesFilePath, mode='rb')
     fileObjStr = fileObj.read()
@@ -51,23 +156,349 @@ def loadWeights(geoObject, weightsFolder):
     return weightsFilepath
 
 
+# ------------------------------------------------------------------------------------------------- BINARY
+
+def _shapePath(geoObject):
+    selectionList = om2.MSelectionList()
+    selectionList.add(geoObject)
+    path = selectionList.getDagPath(0)
+    if not path.hasFn(om2.MFn.kMesh):
+        path.extendToShape()
+    return path
+
+
+def _skinClusterFn(skinCluster):
+    selectionList = om2.MSelectionList()
+    selectionList.add(str(skinCluster))
+    return oma2.MFnSkinCluster(selectionList.getDependNode(0))
 
 
+def _allVertices(shapePath):
+    component = om2.MFnSingleIndexedComponent()
+    components = component.create(om2.MFn.kMeshVertComponent)
+    component.setCompleteData(om2.MFnMesh(shapePath).numVertices)
+    return components
 
 
+def topologyFingerprint(geoObject):
+    """A hash of the vertex and face layout of a mesh, it changes when the topology does
+    and stays the same when the points only move.
 
+    Returns:
+        dict: {'vertexCount': int, 'faceCount': int, 'topology': str}
+    """
+    fnMesh = om2.MFnMesh(_shapePath(geoObject))
+    counts, indices = fnMesh.getVertices()
 
+    digest = hashlib.sha1()
+    digest.update(numpy.array(counts, dtype=numpy.int32).tobytes())
+    digest.update(numpy.array(indices, dtype=numpy.int32).tobytes())
+    return {'vertexCount': fnMesh.numVertices, 'faceCount': fnMesh.numPolygons, 'topology': digest.hexdigest()}
 
 
+def collectBinaryWeights(geoObject, geoSkinClusterNode):
+    """Read the skin weights of a mesh with one getWeights call into the sparse table we save.
+    Touches Maya, so it runs on the main thread.
 
+    Returns:
+        dict: The arrays writeBinaryWeights stores.
+    """
+    shapePath = _shapePath(geoObject)
+    fnSkin = _skinClusterFn(geoSkinClusterNode)
+    influences = [path.partialPathName() for path in fnSkin.influenceObjects()]
 
+    values, influenceCount = fnSkin.getWeights(shapePath, _allVertices(shapePath))
+    dense = numpy.array(values, dtype=numpy.float64).reshape(-1, influenceCount)
 
+    vertices, influenceIndices = numpy.nonzero(dense)
+    counts = numpy.bincount(vertices, minlength=dense.shape[0])
+    fingerprint = topologyFingerprint(geoObject)
 
+    return {
+        'version': numpy.int32(BINARY_VERSION),
+        'influences': numpy.array(influences),
+        'counts': counts.astype(numpy.uint16),
+        'indices': influenceIndices.astype(numpy.uint16),
+        'weights': dense[vertices, influenceIndices].astype(numpy.float32),
+        'vertexCount': numpy.int64(fingerprint['vertexCount']),
+        'faceCount': numpy.int64(fingerprint['faceCount']),
+        'topology': numpy.array(fingerprint['topology']),
+    }
 
 
+def writeBinaryWeights(path, table):
+    """Write a table from collectBinaryWeights as an uncompressed .npz, safe to run on a thread."""
+    folder = os.path.dirname(path)
+    if folder and not os.path.exists(folder):
+        try:
+            os.makedirs(folder)
+        except OSError:
+            # Another writer made it first
+            if not os.path.isdir(folder):
+                raise
 
+    with open(path, 'wb') as fileObj:
+        numpy.savez(fileObj, **table)
 
+    return path
 
 
+def saveBinaryWeights(geoObject, weightsFolder, geoSkinClusterNode):
+    """Save skin weights as a sparse table in an uncompressed .npz, read with one getWeights call.
 
+    The file holds the influence names, for each vertex how many influences it has, the influence
+    index and float32 weight of each of those, and the mesh fingerprint checked on load.
+
+    Returns:
+        str: The path saved to.
+    """
+    path = os.path.join(weightsFolder, fileKey(geoObject) + binaryWeightsFileExt)
+    return writeBinaryWeights(path, collectBinaryWeights(geoObject, geoSkinClusterNode))
+
+
+def readBinaryWeights(path):
+    """Read a .npz weights file back into a dense table, safe to run on a thread.
+
+    Returns:
+        tuple: (influences list, weights array shaped (vertexCount, influenceCount), fingerprint dict)
+    """
+    with numpy.load(path) as data:
+        influences = [str(i) for i in data['influences']]
+        counts = data['counts'].astype(numpy.int64)
+        vertexCount = int(data['vertexCount'])
+
+        dense = numpy.zeros((vertexCount, len(influences)), dtype=numpy.float64)
+        dense[numpy.repeat(numpy.arange(vertexCount), counts), data['indices']] = data['weights']
+
+        fingerprint = {'vertexCount': vertexCount, 'faceCount': int(data['faceCount']),
+                       'topology': str(data['topology'])}
+
+    return influences, dense, fingerprint
+
+
+def applyBinaryWeights(geoObject, path, influences, dense, fingerprint):
+    """Bind a mesh to the saved influences and apply the weights with one setWeights call.
+    A different vertex count cannot be loaded, a different topology with the same count only warns.
+    """
+    checkFingerprint(geoObject, fingerprint, path)
+
+    # create skinCluster
+    sc = cmds.skinCluster(geoObject, influences, tsb=True)[0]
+
+    # the skinCluster may order its influences differently from the file
+    fnSkin = _skinClusterFn(sc)
+    order = dict((influencePath.partialPathName().split('|')[-1], i)
+                 for i, influencePath in enumerate(fnSkin.influenceObjects()))
+    columns = om2.MIntArray([order[name.split('|')[-1]] for name in influences])
+
+    shapePath = _shapePath(geoObject)
+    fnSkin.setWeights(shapePath, _allVertices(shapePath), columns,
+                      om2.MDoubleArray(dense.ravel().tolist()), False)
+
+    return path
+
+
+def loadBinaryWeights(geoObject, path):
+    """Read a .npz weights file and apply it, see applyBinaryWeights."""
+    influences, dense, fingerprint = readBinaryWeights(path)
+    return applyBinaryWeights(geoObject, path, influences, dense, fingerprint)
+
+
+# ------------------------------------------------------------------------------------------------- PIPELINED
+
+def _pipeline(items, background, foreground, workers):
+    """Run background(item) on a thread pool while the main thread runs foreground(item, result)
+    in item order. At most twice the workers are in flight, so decoded files do not pile up
+    when Maya is the slower side.
+    """
+    results = []
+    pending = collections.deque()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for item in items:
+            pending.append((item, pool.submit(background, item)))
+            if len(pending) >= workers * 2:
+                ready, future = pending.popleft()
+                results.append(foreground(ready, future.result()))
+
+        while pending:
+            ready, future = pending.popleft()
+            results.append(foreground(ready, future.result()))
+
+    return results
+
+
+def saveWeightsMany(entries, weightsFolder, fileFormat=None, workers=4, incremental=True):
+    """Save the weights of many meshes, reading each skinCluster on the main thread while
+    the files of the previous ones are written on a thread pool.
+
+    With NumPy available every weight table is hashed with its influences and the hashes kept in
+    the manifest next to the files, so an incremental save only writes the meshes that changed.
+    A mesh's files in the other format are removed, loading prefers the binary one.
+
+    Args:
+        entries(list): (geoObject, geoSkinClusterNode, influences) for each mesh.
+        weightsFolder(str): The folder to save in.
+        fileFormat(str): Force FORMAT_BINARY or FORMAT_XML.(optional)
+        workers(int): The number of writer threads.
+        incremental(bool): Skip the meshes whose weights match the manifest and file on disk.
+
+    Returns:
+        list: The paths written, unchanged meshes are left out.
+    """
+    fileFormat = fileFormat or defaultFormat()
+    entries = list(entries)
+
+    # Two entries for one key would write over each other's file and manifest entry
+    keys = collections.Counter(fileKey(geoObject) for geoObject, _, _ in entries)
+    duplicates = sorted(geometryName(key) for key, count in keys.items() if count > 1)
+    if duplicates:
+        raise ValueError(">>> Cannot save the weights of {} more than once in one save".format(", ".join(duplicates)))
+
+    manifest = readManifest(weightsFolder)
+
+    written = []
+    pending = collections.deque()
+    skipped = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for geoObject, skinCluster, influences in entries:
+            table = collectBinaryWeights(geoObject, skinCluster) if numpy is not None else None
+            entry = manifestEntry(table, fileFormat) if table is not None else None
+
+            key = fileKey(geoObject)
+            _removeOtherFormat(key, weightsFolder, fileFormat)
+
+            ext = binaryWeightsFileExt if fileFormat == FORMAT_BINARY else weightsFileExt
+            path = os.path.join(weightsFolder, key + ext)
+            if incremental and entry is not None and manifest.get(key) == entry and os.path.exists(path):
+                skipped += 1
+                continue
+
+            if fileFormat == FORMAT_BINARY:
+                pending.append(pool.submit(writeBinaryWeights, path, table))
+            else:
+                # deformerWeights is a Maya command, it cannot leave the main thread
+                written.append(_saveXmlWeights(geoObject, weightsFolder, skinCluster, influences))
+
+            if entry is not None:
+                manifest[key] = entry
+            else:
+                manifest.pop(key, None)
+
+            # Keep the collected tables in memory bounded when the disk is the slower side
+            if len(pending) >= workers * 2:
+                written.append(pending.popleft().result())
+
+        written.extend(future.result() for future in pending)
+
+    writeManifest(weightsFolder, manifest)
+    if incremental:
+        print('# skin weights: %s saved, %s unchanged in %s' % (len(written), skipped, weightsFolder))
+
+    return written
+
+
+def loadWeightsMany(geoObjects, weightsFolder, workers=4):
+    """Load the weights of many meshes, decoding the binary files on a thread pool while
+    the main thread builds the skinClusters and applies the files already decoded.
+    XML files are read by deformerWeights on the main thread as they come.
+
+    Args:
+        geoObjects(list): The mesh names.
+        weightsFolder(str): The folder the weights were saved in.
+        workers(int): The number of reader threads.
+
+    Returns:
+        list: The paths loaded, None for meshes without a weights file.
+    """
+    # fileKey asks Maya for the dag path, so the files are found here and the threads only get paths
+    items = [(geoObject,) + findWeightsFile(geoObject, weightsFolder) for geoObject in geoObjects]
+
+    def read(item):
+        geoObject, path, fileFormat = item
+        if fileFormat == FORMAT_BINARY:
+            return readBinaryWeights(path)
+        return None
+
+    def apply(item, table):
+        geoObject, path, fileFormat = item
+        if table is None:
+            return loadWeights(geoObject, weightsFolder)
+        return applyBinaryWeights(geoObject, path, *table)
+
+    return _pipeline(items, read, apply, workers)
+
+
+# ------------------------------------------------------------------------------------------------- MANIFEST
+
+def manifestEntry(table, fileFormat):
+    """What the manifest records for a weight table from collectBinaryWeights: the content hash
+    of the weights and influences, and the topology fingerprint of the mesh.
+    """
+    digest = hashlib.sha1()
+    digest.update('\n'.join(str(i) for i in table['influences']).encode('utf-8'))
+    for key in ('counts', 'indices', 'weights'):
+        digest.update(numpy.ascontiguousarray(table[key]).tobytes())
+
+    return {
+        'format': fileFormat,
+        'hash': digest.hexdigest(),
+        'vertexCount': int(table['vertexCount']),
+        'faceCount': int(table['faceCount']),
+        'topology': str(table['topology']),
+    }
+
+
+def readManifest(weightsFolder):
+    """The manifest entries keyed by geometry, empty when there is no manifest yet."""
+    path = os.path.join(weightsFolder, manifestFileName)
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, 'r') as fileObj:
+        return json.load(fileObj)
+
+
+def writeManifest(weightsFolder, manifest):
+    """Write the manifest through a temporary file, so an interrupted save leaves the old one."""
+    if not os.path.exists(weightsFolder):
+        os.makedirs(weightsFolder)
+
+    path = os.path.join(weightsFolder, manifestFileName)
+    with open(path + '.tmp', 'w') as fileObj:
+        json.dump(manifest, fileObj, sort_keys=True, indent=4, separators=(',', ': '))
+    os.replace(path + '.tmp', path)
+
+
+def checkFingerprint(geoObject, entry, path):
+    """Compare a mesh with the fingerprint recorded when its weights were saved.
+    A different vertex count cannot be loaded, a different topology with the same count only warns.
+    Nothing is checked without a fingerprint or without NumPy.
+    """
+    if not entry or numpy is None:
+        return
 
+    current = topologyFingerprint(geoObject)
+    if current['vertexCount'] != entry['vertexCount']:
+        raise ValueError(">>> {0} has {1} vertices, the weights in {2} were saved for {3}".format(
+            geoObject, current['vertexCount'], path, entry['vertexCount']))
+    if current['topology'] != entry['topology']:
+        print('# topology of %s changed since %s was saved, loading weights by vertex index' % (geoObject, path))
+
+
+def staleWeights(geoObjects, weightsFolder):
+    """The meshes whose topology changed since their weights were saved, to find out
+    before a build rather than while loading. Needs NumPy for the fingerprints.
+
+    Returns:
+        list: The geometry names that no longer match the manifest.
+    """
+    manifest = readManifest(weightsFolder)
+    stale = []
+    for geoObject in geoObjects:
+        entry = manifest.get(fileKey(geoObject))
+        if entry and topologyFingerprint(geoObject)['topology'] != entry['topology']:
+            stale.append(geoObject)
+
+    return stale
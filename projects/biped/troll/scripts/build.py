@@ -5,7 +5,7 @@ About: All functions to build to a simple biped rig
 """
 import maya.cmds as cmds
 import maya.mel as mel
-from modules.nodel import Dag_Node as Dag, Curve, Mesh, Joint, Dep_Node as Dep
+from modules.nodel import Dag_Node as Dag, Curve, Mesh, Joint, Dep_Node as Dep, positions
 from modules.controller_lib import Controller
 from modules.utils import tools
 
@@ -86,9 +86,8 @@ class setup(object):
         controlsGrp = self.createGroup(n=controlsGrpName, em=True, p=topGrp)
 
         # lock attribute of top group
-        for attr in ['t', 'r', 's']:
-            for axis in ['x', 'y', 'z']:
-                topGrp.a[attr + axis].set(l=True, keyable=False, channelBox=False)
+        topGrp.a.setMany([attr + axis for attr in ['t', 'r', 's'] for axis in ['x', 'y', 'z']],
+                         lock=True, keyable=False, channelBox=False)
 
         return {'topGrp': topGrp,
                 'jointGrp': jointGrp,
@@ -306,8 +305,9 @@ class setup(object):
         closestPointNode = Dep(prefix + 'ClosestRibbonPoint_cpo', nodeType='closestPointOnSurface')
         ribbon.shape.a['ws'] >> closestPointNode.a['is']
 
+        spineJointPositions = positions(spineJoints[:-2])
         for num, spineJnt in enumerate(spineJoints[:-2]):
-            jntPos = Joint(spineJnt).o.position[0:3]
+            jntPos = spineJointPositions[num, :3].tolist()
             closestPointNode.a['inPosition'].set(jntPos[0], jntPos[1], jntPos[2])
             uParam = closestPointNode.a['parameterU'].get()
             vParam = closestPointNode.a['parameterV'].get()
@@ -745,8 +745,7 @@ class setup(object):
             if prefix.startswith('r_'):
                 cmds.rotate(clavicleCtrl['off'], r=1)
                 clavicleCtrl['c'].clsRotate(180, -180, -180, r=1)
-            for ax in ['x', 'y', 'z']:
-                clavicleCtrl['c'].a['t' + ax].set(l=True, k=False)
+            clavicleCtrl['c'].a.setMany(['t' + ax for ax in ['x', 'y', 'z']], lock=True, keyable=False)
             # attach clavicle
             clavicleCtrl['c'].orientConstraint(clavicleJnt, mo=1)
             baseGrp.parentConstraint(clavicleCtrl['off'], mo=1)
@@ -768,8 +767,7 @@ class setup(object):
                 ctrl['c'].a.r >> j.a.r
                 ctrl['c'].a.ro >> j.a.ro
 
-                for ax in ['x', 'y', 'z']:
-                    ctrl['c'].a['t' + ax].set(l=1, k=0)
+                ctrl['c'].a.setMany(['t' + ax for ax in ['x', 'y', 'z']], lock=True, keyable=False)
 
                 parentJnt = j.parent
                 if parentJnt == endJoint:
@@ -996,25 +994,18 @@ class setup(object):
     def saveSkinWeights(self, modelGrp, weightsPath='%sweights/'):
         """save all meshes' skin weights to specified folder"""
         modelGrp = Dag(modelGrp)
-        modelGeos = [cmds.listRelatives(m, p=True)[0] for m in cmds.listRelatives(modelGrp, ad=True, type='mesh')]
-        modelGeos = list(set(modelGeos))
         projectFolder = self.projectPath % (self.type, self.charName)
         weightsFolder = weightsPath % projectFolder
 
-        for mesh in modelGeos:
-            Mesh(mesh).saveSkinWeights(weightsFolder)
+        Mesh.saveSkinWeightsMany(modelGrp.iterDescendants(type='mesh'), weightsFolder)
 
     def loadSkinWeights(self, modelGrp, weightsPath='%sweights/'):
         """load all meshes' skin weights from specified folder"""
         modelGrp = Dag(modelGrp)
-        modelGeos = [cmds.listRelatives(m, p=True)[0] for m in cmds.listRelatives(modelGrp, ad=True, type='mesh')]
-        modelGeos = list(set(modelGeos))
-
         projectFolder = self.projectPath % (self.type, self.charName)
         weightsFolder = weightsPath % projectFolder
 
-        for mesh in modelGeos:
-            Mesh(mesh).loadSkinWeights(weightsFolder)
+        Mesh.loadSkinWeightsMany(modelGrp.iterDescendants(type='mesh'), weightsFolder)
 
 
 if __name__ == '__main__':